@@ -13,8 +13,13 @@ from .components import (
     GraphicsBuilder,
     Theme,
     ComponentRenderer,
+    ComponentSpec,
     dark_theme,
     linkedin_theme,
+    register_component,
+    unregister_component,
+    registered_components,
+    render,
 )
 
 from .advanced import (
@@ -24,22 +29,46 @@ from .advanced import (
 
 from .export import (
     html_to_png,
+    html_to_pdf,
     export_config_to_png,
     PNGExporter,
+    AsyncPNGExporter,
+    ImageFormat,
 )
 
+from .cache import RenderCache
+from .carousel import Carousel
+from .pipeline import build_many
+from .raster import RasterRenderer, render_raster
+from .svg import SVGBuilder, render_svg
+
 __version__ = "2.2.0"
 
 __all__ = [
     "GraphicsBuilder",
     "Theme",
     "ComponentRenderer",
+    "ComponentSpec",
+    "register_component",
+    "unregister_component",
+    "registered_components",
+    "render",
     "HeroIcons",
     "AdvancedComponentRenderer",
     "dark_theme",
     "linkedin_theme",
     "html_to_png",
+    "html_to_pdf",
     "export_config_to_png",
     "PNGExporter",
+    "AsyncPNGExporter",
+    "ImageFormat",
+    "RenderCache",
+    "Carousel",
+    "build_many",
+    "RasterRenderer",
+    "render_raster",
+    "SVGBuilder",
+    "render_svg",
 ]
 
@@ -0,0 +1,198 @@
+"""
+Benchmarks - Measure export cost on this machine.
+
+Usage:
+    python -m openfigma.benchmark formats --runs 10
+    python -m openfigma.benchmark reuse --renders 50
+
+    rows = benchmark_formats(html, width=1080, height=1080)
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from .export import (
+    ImageFormat, ImageFormatLike, _PLAYWRIGHT_MISSING, _capture, _drop_warm_pages,
+    _image_format, _load_html, _render_page,
+)
+
+
+def sample_html(dimensions: tuple = (1080, 1080), variant: int = 0) -> str:
+    """A representative LinkedIn graphic: text, a metric card and a chart."""
+    from .components import linkedin_theme, render
+
+    config = {
+        "components": [
+            {"type": "badge", "content": {"text": f"Case Study {variant + 1}"}},
+            {"type": "headline", "content": {"text": "10x growth in 6 months", "size": "large"}},
+            {"type": "metric_card", "content": {
+                "value": f"{variant + 10}x", "label": "Pipeline", "change": "+900%",
+            }},
+            {"type": "bar_chart", "content": {"data": [
+                {"label": "Q1", "value": 10}, {"label": "Q2", "value": 35},
+                {"label": "Q3", "value": 60}, {"label": "Q4", "value": 100},
+            ]}},
+        ]
+    }
+    return render(config, linkedin_theme(), dimensions)
+
+
+def default_formats() -> List[ImageFormat]:
+    """Formats compared by default; Pillow-backed ones only when installed."""
+    formats = [
+        ImageFormat("png"),
+        ImageFormat("jpeg", quality=90),
+        ImageFormat("jpeg", quality=75),
+        ImageFormat("webp", quality=80),
+    ]
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return formats
+    return formats + [
+        ImageFormat("png", compress_level=1),
+        ImageFormat("webp", lossless=True),
+    ]
+
+
+def benchmark_formats(
+    html: Optional[str] = None,
+    width: int = 1080,
+    height: int = 1080,
+    formats: Optional[Sequence[ImageFormatLike]] = None,
+    runs: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    Compare encode time and output size per image format.
+
+    The document is loaded once and captured runs times per format, so the
+    timings isolate screenshot + encode cost from page setup.
+
+    Returns:
+        One row per format: {"format", "bytes", "median_ms", "min_ms"}
+    """
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        raise ImportError(_PLAYWRIGHT_MISSING)
+
+    html = html or sample_html((width, height))
+    formats = [_image_format(f) for f in (formats or default_formats())]
+
+    rows = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        try:
+            page = browser.new_page(viewport={"width": width, "height": height})
+            _load_html(page, html)
+            for image_format in formats:
+                timings = []
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    data = _capture(page, image_format)
+                    timings.append((time.perf_counter() - start) * 1000)
+                rows.append({
+                    "format": image_format.cache_tag,
+                    "bytes": len(data),
+                    "median_ms": statistics.median(timings),
+                    "min_ms": min(timings),
+                })
+        finally:
+            browser.close()
+    return rows
+
+
+def benchmark_reuse(
+    htmls: Optional[Sequence[str]] = None,
+    width: int = 1080,
+    height: int = 1080,
+    renders: int = 20,
+) -> List[Dict[str, Any]]:
+    """
+    Compare fresh-page rendering with content swaps into a warm page.
+
+    Both modes render the same documents on one browser, cycling through
+    htmls (default: renders distinct sample graphics).
+
+    Returns:
+        One row per mode: {"mode", "renders", "total_ms", "per_render_ms"}
+    """
+    if renders < 1:
+        raise ValueError("renders must be at least 1")
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        raise ImportError(_PLAYWRIGHT_MISSING)
+
+    htmls = list(htmls or [sample_html((width, height), i) for i in range(renders)])
+
+    rows = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        try:
+            for mode, reuse in (("fresh page", False), ("warm page", True)):
+                # Untimed first render, so neither mode pays browser warm-up
+                _render_page(browser, htmls[0], width, height, reuse=reuse)
+                start = time.perf_counter()
+                for i in range(renders):
+                    _render_page(browser, htmls[i % len(htmls)], width, height, reuse=reuse)
+                total = (time.perf_counter() - start) * 1000
+                rows.append({
+                    "mode": mode,
+                    "renders": renders,
+                    "total_ms": total,
+                    "per_render_ms": total / renders,
+                })
+        finally:
+            # Warm pages are kept per thread and would outlive the browser
+            _drop_warm_pages(browser)
+            browser.close()
+    return rows
+
+
+def _print_rows(rows: List[Dict[str, Any]]) -> None:
+    columns = list(rows[0]) if rows else []
+    print(" ".join(f"{column:>14}" for column in columns))
+    for row in rows:
+        print(" ".join(
+            f"{value:>14.1f}" if isinstance(value, float)
+            else f"{value:>14,}" if isinstance(value, int)
+            else f"{value:>14}"
+            for value in row.values()
+        ))
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark openfigma exports")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    formats = commands.add_parser("formats", help="Encode time and size per image format")
+    formats.add_argument("--html", help="HTML file to render (default: built-in sample)")
+    formats.add_argument("--width", type=int, default=1080)
+    formats.add_argument("--height", type=int, default=1080)
+    formats.add_argument("--runs", type=int, default=5)
+
+    reuse = commands.add_parser("reuse", help="Fresh pages vs content swaps into a warm page")
+    reuse.add_argument("--width", type=int, default=1080)
+    reuse.add_argument("--height", type=int, default=1080)
+    reuse.add_argument("--renders", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.command == "reuse":
+        _print_rows(benchmark_reuse(None, args.width, args.height, renders=args.renders))
+        return
+
+    html = None
+    if args.html:
+        with open(args.html, encoding="utf-8") as f:
+            html = f.read()
+    _print_rows(benchmark_formats(html, args.width, args.height, runs=args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Render Cache - Content-addressed cache for rendered images.
+
+Identical inputs (same HTML, viewport, scale, format and base directory) always produce the
+same image, so renders are keyed by a hash of those inputs. Hits are served
+from an in-memory LRU, then from an optional on-disk tier, and never touch
+the browser.
+
+Usage:
+    cache = RenderCache(disk_dir=".openfigma-cache")
+    png_bytes = html_to_png(html, width=1080, height=1080, cache=cache)
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class RenderCache:
+    """
+    Two-tier (memory LRU + disk) cache of rendered image bytes.
+
+    Thread-safe, so one instance can be shared by exporter workers and
+    server threads.
+
+    Args:
+        max_memory_bytes: Memory tier budget (default 64 MB, 0 disables)
+        disk_dir: Directory for the disk tier (default None = memory only)
+        max_disk_bytes: Disk tier budget; least recently used files are
+                        evicted beyond it (default 1 GB)
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.stats: Dict[str, int] = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    @staticmethod
+    def key(
+        html: str,
+        width: int,
+        height: int,
+        scale: float = 1.0,
+        format: str = "png",
+        base_dir: Optional[str] = None,
+    ) -> str:
+        """
+        Stable content hash for a render request.
+
+        base_dir is part of the key because relative assets resolve against
+        it: the same HTML loaded from two directories can render differently.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{width}x{height}@{float(scale)}:{format}\0".encode("utf-8"))
+        if base_dir is not None:
+            digest.update(f"{os.path.abspath(base_dir)}\0".encode("utf-8"))
+        digest.update(html.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for key, or None on a miss."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.stats["hits"] += 1
+                return data
+
+        data = self._disk_get(key)
+        with self._lock:
+            if data is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self.stats["disk_hits"] += 1
+            self._memory_put(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store rendered bytes under key in both tiers."""
+        with self._lock:
+            self._memory_put(key, data)
+        if self.disk_dir:
+            self._disk_put(key, data)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self.disk_dir:
+                for path, _, _ in self._disk_entries():
+                    os.unlink(path)
+                self._disk_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _memory_put(self, key: str, data: bytes) -> None:
+        """Insert into the LRU and evict down to budget. Caller holds the lock."""
+        if len(data) > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.bin")
+
+    def _disk_entries(self) -> list:
+        """(path, size, last_used) for every file in the disk tier."""
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            if not name.endswith(".bin"):
+                continue
+            path = os.path.join(self.disk_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # mtime doubles as last-used time for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def _disk_put(self, key: str, data: bytes) -> None:
+        path = self._disk_path(key)
+        if os.path.exists(path) or len(data) > self.max_disk_bytes:
+            return
+
+        # Write then rename so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self._disk_bytes += len(data)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        """Remove least recently used files until under budget. Caller holds the lock."""
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        self._disk_bytes = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            self._disk_bytes -= size
@@ -0,0 +1,90 @@
+"""
+Carousel - Multi-slide documents with one shared stylesheet.
+
+All slides are built into a single HTML document: fonts and CSS are
+emitted once, and every slide is captured from one page load. The same
+document prints to a multi-page PDF, the format LinkedIn document posts
+expect.
+
+Usage:
+    carousel = Carousel([cover_config, slide_config, cta_config],
+                        theme=linkedin_theme("#8b5cf6"))
+    paths = carousel.export("exports/cold-emails")
+    carousel.export_pdf("exports/cold-emails.pdf")
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from .components import GraphicsBuilder, Theme
+from .export import PNGExporter
+
+
+class Carousel:
+    """
+    An ordered set of slide configs sharing one theme and canvas size.
+
+    Args:
+        slides: build_from_config configs, one per slide; a slide's theme
+                overrides apply to that slide only
+        theme: Theme shared by every slide (default: the builder's theme)
+        dimensions: Slide size (default 1080x1350, LinkedIn portrait)
+        builder: GraphicsBuilder for font and CSS options
+                 (default GraphicsBuilder())
+    """
+
+    def __init__(
+        self,
+        slides: Iterable[Dict[str, Any]] = (),
+        theme: Optional[Theme] = None,
+        dimensions: tuple = (1080, 1350),
+        builder: Optional[GraphicsBuilder] = None,
+    ):
+        self.slides: List[Dict[str, Any]] = list(slides)
+        self.theme = theme
+        self.dimensions = tuple(dimensions)
+        self.builder = builder or GraphicsBuilder()
+
+    def add_slide(self, config: Dict[str, Any]) -> "Carousel":
+        """Append a slide; returns self for chaining."""
+        self.slides.append(config)
+        return self
+
+    def __len__(self) -> int:
+        return len(self.slides)
+
+    def to_html(self) -> str:
+        """The single HTML document holding every slide."""
+        return self.builder.build_carousel(self.slides, self.dimensions, self.theme)
+
+    def export(
+        self,
+        output_dir: str,
+        name: str = "slide",
+        exporter: Optional[PNGExporter] = None,
+        **exporter_options: Any,
+    ) -> List[str]:
+        """
+        Render every slide to {output_dir}/{name}-1.png, {name}-2.png, ...
+
+        Uses exporter if given (an open PNGExporter), otherwise a one-off
+        PNGExporter created with exporter_options (cache, format, scale...).
+
+        Returns:
+            Saved file paths, one per slide
+        """
+        if exporter is not None:
+            return exporter.export_carousel(self, output_dir, name)
+        with PNGExporter(**exporter_options) as exporter:
+            return exporter.export_carousel(self, output_dir, name)
+
+    def export_pdf(
+        self,
+        output_path: str,
+        exporter: Optional[PNGExporter] = None,
+        **exporter_options: Any,
+    ) -> str:
+        """Render the carousel as one PDF with a page per slide."""
+        if exporter is not None:
+            return exporter.export_carousel_pdf(self, output_path)
+        with PNGExporter(**exporter_options) as exporter:
+            return exporter.export_carousel_pdf(self, output_path)
@@ -22,11 +22,26 @@ Themes:
 - Colors, fonts, spacing configurable per business/client
 """
 
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+import re
+import threading
+import warnings
+from typing import Callable, Dict, Any, Optional, List, Sequence, Tuple
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
 from html import escape as html_escape
 
 from .advanced import AdvancedComponentRenderer, HeroIcons
+from .fonts import GOOGLE_FONTS_URL, font_face_css, resolve_font_dir
+
+
+# Set on window once fonts have loaded and images decoded, giving
+# exporters a deterministic capture signal
+READY_FLAG = "__openfigmaReady"
+READY_SCRIPT = (
+    "Promise.all([document.fonts.ready].concat(Array.from(document.images, "
+    "function (img) { return img.decode().catch(function () {}); })))"
+    f".then(function () {{ window.{READY_FLAG} = true; }});"
+)
 
 
 def escape_html(text: str) -> str:
@@ -101,6 +116,20 @@ class Theme:
     line_height_tight: str = "1.1"
     line_height_normal: str = "1.5"
 
+    def with_overrides(self, overrides: Dict[str, Any]) -> "Theme":
+        """
+        Return a copy with the given fields replaced.
+
+        Unknown keys are ignored and this theme is left untouched, so a
+        shared theme can be specialised per call without leaking changes.
+        """
+        known = {key: value for key, value in overrides.items() if key in _THEME_FIELDS}
+        return replace(self, **known)
+
+
+# Field order used for hashable theme snapshots
+_THEME_FIELDS = tuple(f.name for f in fields(Theme))
+
 
 def dark_theme() -> Theme:
     """Create a dark theme preset."""
@@ -465,15 +494,57 @@ class ComponentRenderer:
 
 
 class GraphicsBuilder:
-    """Builds graphics from JSON config."""
+    """
+    Builds graphics from JSON config.
+
+    Args:
+        theme: Theme to render with (default Theme())
+        font_dir: Directory of font files to embed as @font-face
+                  (default: OPENFIGMA_FONT_DIR, then the bundled fonts)
+        remote_fonts: Link Google Fonts when no local fonts are found
+                      (default True; False renders offline with the
+                      theme's fallback fonts)
+        full_css: Emit the stylesheet for every component instead of only
+                  the ones used by the config (useful for debugging)
+        unknown_components: What to do with unregistered component types:
+                            "ignore" (default), "warn" or "raise"
+
+    Thread safety: build_from_config never mutates the builder, so one
+    instance can be shared across threads. Pass a per-call theme rather
+    than assigning to builder.theme while builds are in flight.
+    """
     
-    def __init__(self, theme: Optional[Theme] = None):
+    def __init__(
+        self,
+        theme: Optional[Theme] = None,
+        font_dir: Optional[str] = None,
+        remote_fonts: bool = True,
+        full_css: bool = False,
+        unknown_components: str = "ignore",
+    ):
+        if unknown_components not in ("ignore", "warn", "raise"):
+            raise ValueError("unknown_components must be 'ignore', 'warn' or 'raise'")
         self.theme = theme or Theme()
         self.renderer = ComponentRenderer()
+        self.font_dir = resolve_font_dir(font_dir)
+        self.remote_fonts = remote_fonts
+        self.full_css = full_css
+        self.unknown_components = unknown_components
     
-    def build_from_config(self, config: Dict[str, Any], dimensions: tuple = (1920, 1080)) -> str:
+    def build_from_config(
+        self,
+        config: Dict[str, Any],
+        dimensions: Optional[tuple] = (1920, 1080),
+        theme: Optional[Theme] = None,
+    ) -> str:
         """
         Build HTML graphic from JSON config.
+
+        theme replaces the builder's theme for this call only; config
+        overrides are applied on top of it.
+
+        dimensions=None emits responsive CSS where the canvas fills the
+        viewport, so one document can be captured at several sizes.
         
         Config structure:
         {
@@ -485,209 +556,256 @@ class GraphicsBuilder:
           ]
         }
         """
-        # Apply theme overrides if provided
-        if "theme" in config:
-            theme_dict = config["theme"]
-            for key, value in theme_dict.items():
-                if hasattr(self.theme, key):
-                    setattr(self.theme, key, value)
-        
-        # Build components
+        components_html, component_types, theme = self._build_components(
+            config, theme or self.theme
+        )
+
+        # Generate full HTML, with CSS only for the component types used
+        return self._generate_html(components_html, dimensions, component_types, theme)
+
+    def build_carousel(
+        self,
+        configs: Sequence[Dict[str, Any]],
+        dimensions: tuple = (1080, 1350),
+        theme: Optional[Theme] = None,
+    ) -> str:
+        """
+        Build one HTML document holding every config as a slide.
+
+        Fonts and the stylesheet are emitted once for all slides. Each slide
+        is a ``section.slide`` (id ``slide-1``, ``slide-2``, ...) sized to
+        dimensions and stacked vertically; the document prints as one slide
+        per PDF page. theme is shared by every slide and a config's theme
+        overrides apply to its own slide only.
+        """
+        if not dimensions:
+            raise ValueError("Carousel slides need fixed dimensions")
+        theme = theme or self.theme
+        dimensions = tuple(dimensions)
+
+        slides = []
+        component_types = set()
+        slide_themes = []
+        for index, config in enumerate(configs, 1):
+            components_html, types, slide_theme = self._build_components(config, theme)
+            component_types |= types
+            slides.append(
+                f'<section class="slide" id="slide-{index}">\n    '
+                + "\n    ".join(components_html)
+                + "\n  </section>"
+            )
+            if slide_theme is not theme:
+                slide_themes.append((f"#slide-{index}", slide_theme))
+
+        components = None if self.full_css else frozenset(component_types)
+        static_css, names = _compiled_css(components, ".slide")
+        theme_css = [self._theme_css(theme, dimensions, names, ".slide")]
+        for selector, slide_theme in slide_themes:
+            theme_css.append(
+                self._theme_css(slide_theme, dimensions, names, selector, selector)
+            )
+        width, height = dimensions
+        theme_css.append(_CAROUSEL_CSS.format(width=width, height=height))
+
+        return self._generate_document(
+            "\n  ".join(slides), static_css, "\n    ".join(theme_css), "Carousel"
+        )
+
+    def _build_components(
+        self,
+        config: Dict[str, Any],
+        theme: Theme,
+    ) -> Tuple[List[str], frozenset, Theme]:
+        """Render a config's components; returns their HTML, types and the config's theme."""
+        # Derive a per-config theme; overrides never touch self.theme
+        overrides = config.get("theme")
+        if overrides:
+            theme = theme.with_overrides(overrides)
+
+        # Build components via the registry
         components_html = []
+        component_types = set()
         for component in config.get("components", []):
             comp_type = component.get("type")
+            spec = _REGISTRY.get(comp_type)
+            if spec is None:
+                self._handle_unknown(comp_type)
+                continue
+
             comp_content = component.get("content", {})
-            
-            if comp_type == "badge":
-                components_html.append(
-                    self.renderer.render_badge(
-                        comp_content.get("text", ""),
-                        self.theme,
-                        comp_content.get("icon"),
-                    )
-                )
-            elif comp_type == "headline":
-                components_html.append(
-                    self.renderer.render_headline(
-                        comp_content.get("text", ""),
-                        self.theme,
-                        comp_content.get("size", "large"),
-                        comp_content.get("align", "center"),
-                        comp_content.get("bold_parts"),
-                        comp_content.get("muted_parts"),
-                    )
-                )
-            elif comp_type == "quote_card":
-                components_html.append(
-                    self.renderer.render_quote_card(
-                        comp_content.get("quote", ""),
-                        comp_content.get("author"),
-                        comp_content.get("role"),
-                        comp_content.get("avatar"),
-                        self.theme,
-                        comp_content.get("emphasis"),
-                    )
-                )
-            elif comp_type == "metric_card":
-                components_html.append(
-                    self.renderer.render_metric_card(
-                        comp_content.get("value", ""),
-                        comp_content.get("label", ""),
-                        comp_content.get("change"),
-                        comp_content.get("change_type", "positive"),
-                        self.theme,
-                    )
-                )
-            elif comp_type == "cta_card":
-                components_html.append(
-                    self.renderer.render_cta_card(
-                        comp_content.get("headline", ""),
-                        comp_content.get("description"),
-                        comp_content.get("button_text", "Get Started"),
-                        comp_content.get("button_url"),
-                        self.theme,
-                    )
-                )
-            elif comp_type == "infographic_card":
-                components_html.append(
-                    self.renderer.render_infographic_card(
-                        comp_content.get("title", ""),
-                        comp_content.get("items", []),
-                        self.theme,
-                    )
-                )
-            elif comp_type == "logo_card":
-                components_html.append(
-                    self.renderer.render_logo_card(
-                        comp_content.get("client_name", ""),
-                        comp_content.get("provider_name", "SCAILE"),
-                        self.theme,
-                    )
-                )
-            elif comp_type == "process_flow":
-                components_html.append(
-                    AdvancedComponentRenderer.render_process_flow(
-                        comp_content.get("steps", []),
-                        self.theme,
-                        comp_content.get("orientation", "horizontal"),
-                        comp_content.get("show_arrows", True),
-                    )
-                )
-            elif comp_type == "bar_chart":
-                components_html.append(
-                    AdvancedComponentRenderer.render_bar_chart(
-                        comp_content.get("data", []),
-                        self.theme,
-                        comp_content.get("max_value"),
-                    )
-                )
-            elif comp_type == "timeline":
-                components_html.append(
-                    AdvancedComponentRenderer.render_timeline(
-                        comp_content.get("events", []),
-                        self.theme,
-                        comp_content.get("orientation", "vertical"),
-                    )
-                )
-            elif comp_type == "comparison":
-                components_html.append(
-                    AdvancedComponentRenderer.render_comparison(
-                        comp_content.get("left", {}),
-                        comp_content.get("right", {}),
-                        self.theme,
-                    )
-                )
-            elif comp_type == "feature_grid":
-                components_html.append(
-                    AdvancedComponentRenderer.render_feature_grid(
-                        comp_content.get("features", []),
-                        self.theme,
-                        comp_content.get("columns", 3),
-                    )
-                )
-            elif comp_type == "stats_dashboard":
-                components_html.append(
-                    AdvancedComponentRenderer.render_stats_dashboard(
-                        comp_content.get("stats", []),
-                        self.theme,
-                    )
-                )
-            elif comp_type == "progress_bar":
-                components_html.append(
-                    AdvancedComponentRenderer.render_progress_bar(
-                        comp_content.get("label", ""),
-                        comp_content.get("value", 0),
-                        comp_content.get("max_value", 100),
-                        self.theme,
-                        comp_content.get("show_percentage", True),
-                    )
-                )
-            elif comp_type == "event_poster":
-                components_html.append(
-                    self.renderer.render_event_poster(
-                        comp_content.get("lines", []),
-                        self.theme,
-                        comp_content.get("align", "left"),
-                    )
-                )
-            elif comp_type == "subtitle":
-                components_html.append(
-                    self.renderer.render_subtitle(
-                        comp_content.get("text", ""),
-                        self.theme,
-                        comp_content.get("highlight"),
-                        comp_content.get("align", "left"),
-                    )
-                )
-            elif comp_type == "positioned_logo":
-                components_html.append(
-                    self.renderer.render_positioned_logo(
-                        comp_content.get("text", ""),
-                        self.theme,
-                        comp_content.get("position", "bottom-right"),
-                        comp_content.get("icon_svg"),
-                    )
-                )
-            elif comp_type == "background_svg":
-                components_html.append(
-                    self.renderer.render_background_svg(
-                        comp_content.get("svg", ""),
-                        self.theme,
-                    )
-                )
-
-        # Generate full HTML
-        return self._generate_html(components_html, dimensions)
+            components_html.append(spec.render(*spec.args(comp_content, theme)))
+            component_types.add(comp_type)
+        return components_html, frozenset(component_types), theme
+
+    def _handle_unknown(self, comp_type: Any) -> None:
+        """Apply the unknown_components policy to an unregistered type."""
+        if self.unknown_components == "ignore":
+            return
+        message = (
+            f"Unknown component type {comp_type!r}; "
+            f"registered types: {', '.join(registered_components())}"
+        )
+        if self.unknown_components == "raise":
+            raise ValueError(message)
+        warnings.warn(message, stacklevel=3)
     
-    def _generate_html(self, components: List[str], dimensions: tuple) -> str:
+    def _generate_html(
+        self,
+        components: List[str],
+        dimensions: Optional[tuple],
+        component_types: Optional[frozenset] = None,
+        theme: Optional[Theme] = None,
+    ) -> str:
         """Generate full HTML document with components."""
         components_html = "\n  ".join(components)
-        
+        static_css, theme_css = self._generate_css(dimensions, component_types, theme)
+        return self._generate_document(components_html, static_css, theme_css)
+
+    def _generate_document(
+        self,
+        body_html: str,
+        static_css: str,
+        theme_css: str,
+        title: str = "Graphic",
+    ) -> str:
+        """Wrap body HTML with fonts, both stylesheets and the ready script."""
         return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Graphic</title>
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
+  <title>{title}</title>
+  {self._generate_font_html(static_css, theme_css)}
   <style>
-    {self._generate_css(dimensions)}
+    {theme_css}
+  </style>
+  <style>
+    {static_css}
   </style>
 </head>
 <body>
-  {components_html}
+  {body_html}
+  <script>{READY_SCRIPT}</script>
 </body>
 </html>"""
     
-    def _generate_css(self, dimensions: tuple) -> str:
-        """Generate CSS from theme."""
-        t = self.theme
+    def _generate_font_html(self, static_css: str, theme_css: str) -> str:
+        """Embedded @font-face rules, or the Google Fonts link as a fallback."""
+        if self.font_dir:
+            families, weights, styles = _font_usage(static_css, theme_css)
+            return f"<style>\n{font_face_css(self.font_dir, families, weights, styles)}\n  </style>"
+        if self.remote_fonts:
+            return f'<link href="{GOOGLE_FONTS_URL}" rel="stylesheet">'
+        return ""
+
+    def _generate_css(
+        self,
+        dimensions: Optional[tuple],
+        component_types: Optional[frozenset] = None,
+        theme: Optional[Theme] = None,
+    ) -> Tuple[str, str]:
+        """
+        Generate (static stylesheet, theme block).
+
+        The static sheet references the theme through CSS custom properties
+        and depends only on the component set, so it is compiled once per
+        process. The theme block holds the :root variables and is memoized
+        per (theme snapshot, dimensions).
+
+        Unless full_css is set, only rules for component_types are emitted.
+        theme defaults to the builder's theme.
+        """
+        theme = theme or self.theme
+        components = None if self.full_css else component_types
+        static_css, names = _compiled_css(components)
+
+        dimensions = tuple(dimensions) if dimensions else None
+        return static_css, self._theme_css(theme, dimensions, names)
+
+    @staticmethod
+    def _theme_css(
+        theme: Theme,
+        dimensions: Optional[tuple],
+        names: Tuple[str, ...],
+        canvas: str = "body",
+        root: str = ":root",
+    ) -> str:
+        """Memoized _compile_theme_css."""
+        snapshot = tuple(getattr(theme, name) for name in _THEME_FIELDS)
+        try:
+            return _compiled_theme_css(snapshot, dimensions, names, canvas, root)
+        except TypeError:
+            # Unhashable theme override values can't be cached
+            return GraphicsBuilder._compile_theme_css(theme, dimensions, names, canvas, root)
+
+    @staticmethod
+    def css_cache_info() -> Dict[str, Dict[str, int]]:
+        """Hit/miss statistics for the static stylesheet and theme block caches."""
+        stats = {}
+        for name, cache in (("static", _compiled_css), ("theme", _compiled_theme_css)):
+            info = cache.cache_info()
+            stats[name] = {
+                "hits": info.hits,
+                "misses": info.misses,
+                "size": info.currsize,
+                "max_size": info.maxsize,
+            }
+        return stats
+
+    @staticmethod
+    def css_cache_clear() -> None:
+        """Drop all compiled stylesheets and theme blocks."""
+        _compiled_css.cache_clear()
+        _compiled_theme_css.cache_clear()
+
+    @staticmethod
+    def _compile_css(
+        components: Optional[frozenset] = None,
+        canvas: str = "body",
+    ) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Format the static stylesheet with theme fields as var(--name).
+
+        Only rules for the given component types are included; None emits
+        the full sheet. canvas is the selector styled as the graphic's
+        canvas. Returns the sheet and the theme fields it references.
+        """
+        t = _ThemeVars()
+        css = [_BASE_CSS.format(t=t, canvas=canvas)]
+        for comp_type, spec in _REGISTRY.items():
+            if spec.css and (components is None or comp_type in components):
+                css.append(spec.css.format(t=t))
+        return "".join(css), tuple(name for name in _THEME_FIELDS if name in t.used)
+
+    @staticmethod
+    def _compile_theme_css(
+        t: Theme,
+        dimensions: Optional[tuple],
+        names: Tuple[str, ...],
+        canvas: str = "body",
+        root: str = ":root",
+    ) -> str:
+        """
+        Format the theme block: variables for the given fields and the
+        canvas size (None: viewport) on root, plus the optional grid and
+        background rules for canvas. A root other than :root also scopes
+        the background rules to it.
+        """
+        width, height = (f"{d}px" for d in dimensions) if dimensions else ("100vw", "100vh")
+        variables = "".join(
+            f"\n      {_css_var(name)}: {getattr(t, name)};" for name in names
+        )
+        scope = "" if root == ":root" else f"{root} "
+        root_css = f"""{root} {{{variables}
+      --canvas-width: {width};
+      --canvas-height: {height};
+    }}"""
 
         grid_css = ""
         if t.grid_enabled:
             if t.grid_style == "dots":
                 grid_css = f"""
-    body::before {{
+    {canvas}::before {{
       content: '';
       position: absolute;
       inset: 0;
@@ -698,7 +816,7 @@ class GraphicsBuilder:
     }}"""
             else:
                 grid_css = f"""
-    body::before {{
+    {canvas}::before {{
       content: '';
       position: absolute;
       inset: 0;
@@ -713,7 +831,7 @@ class GraphicsBuilder:
         background_svg_css = ""
         if t.background_svg:
             background_svg_css = f"""
-    .background-svg {{
+    {scope}.background-svg {{
       position: absolute;
       inset: 0;
       pointer-events: none;
@@ -722,14 +840,106 @@ class GraphicsBuilder:
       align-items: flex-end;
       justify-content: flex-end;
     }}
-    .background-svg svg {{
+    {scope}.background-svg svg {{
       width: auto;
       height: 80%;
       opacity: 0.15;
       fill: {t.background_svg_color};
     }}"""
 
-        return f"""
+        return root_css + grid_css + background_svg_css
+
+
+_default_builder: Optional[GraphicsBuilder] = None
+_default_builder_lock = threading.Lock()
+
+
+def render(
+    config: Dict[str, Any],
+    theme: Optional[Theme] = None,
+    dimensions: Optional[tuple] = (1920, 1080),
+) -> str:
+    """
+    Build HTML from config without holding a builder.
+
+    Stateless and safe to call from any thread: each call renders with its
+    own theme (default Theme()) on a shared builder using default options.
+    Construct a GraphicsBuilder for non-default font or CSS options.
+
+    Usage:
+        html = render(config, dark_theme(), (1080, 1080))
+    """
+    global _default_builder
+    if _default_builder is None:
+        with _default_builder_lock:
+            if _default_builder is None:
+                _default_builder = GraphicsBuilder()
+    return _default_builder.build_from_config(config, dimensions, theme)
+
+
+def _css_var(name: str) -> str:
+    """CSS custom property for a Theme field: text_primary -> --text-primary."""
+    return "--" + name.replace("_", "-")
+
+
+class _ThemeVars:
+    """Formats stylesheet templates with var(--field) for every ``t.field``."""
+
+    def __init__(self):
+        self.used = set()
+
+    def __getattr__(self, name: str) -> str:
+        if name not in _THEME_FIELDS:
+            raise AttributeError(f"Theme has no field {name!r}")
+        self.used.add(name)
+        return f"var({_css_var(name)})"
+
+
+@lru_cache(maxsize=128)
+def _compiled_css(
+    components: Optional[frozenset],
+    canvas: str = "body",
+) -> Tuple[str, Tuple[str, ...]]:
+    """Compile the static stylesheet once per component set and canvas selector."""
+    return GraphicsBuilder._compile_css(components, canvas)
+
+
+@lru_cache(maxsize=128)
+def _compiled_theme_css(
+    theme_snapshot: tuple,
+    dimensions: Optional[tuple],
+    names: Tuple[str, ...],
+    canvas: str = "body",
+    root: str = ":root",
+) -> str:
+    """Compile the theme block once per distinct theme state, size, field set and scope."""
+    return GraphicsBuilder._compile_theme_css(
+        Theme(*theme_snapshot), dimensions, names, canvas, root
+    )
+
+
+# Weights browsers apply without a rule (body text, <strong>, headings)
+_DEFAULT_FONT_WEIGHTS = frozenset({400, 700})
+
+
+@lru_cache(maxsize=128)
+def _font_usage(static_css: str, theme_css: str) -> Tuple[str, frozenset, frozenset]:
+    """(font families, weights, styles) a document's stylesheets can ask for."""
+    families = ", ".join(re.findall(r"--font-family:\s*([^;]+);", theme_css))
+    weights = _DEFAULT_FONT_WEIGHTS.union(
+        int(w) for w in re.findall(r"font-weight:\s*(\d+)\s*;", static_css)
+    ).union(
+        int(w) for w in re.findall(r"--font-[\w-]+:\s*(\d+)\s*;", theme_css)
+    )
+    styles = frozenset({"normal", "italic"} if "italic" in static_css else {"normal"})
+    return families, weights, styles
+
+
+# Stylesheet templates. ``t.field`` becomes var(--field), resolved against
+# the :root block of the theme, so the formatted sheet is theme-independent
+# and values must not be concatenated with other tokens. The base sheet is
+# always emitted; component blocks only for component types in the config.
+_BASE_CSS = """
     * {{ margin: 0; padding: 0; box-sizing: border-box; }}
 
     /* Anti-aliasing for crisp text */
@@ -739,11 +949,11 @@ class GraphicsBuilder:
       text-rendering: optimizeLegibility;
     }}
 
-    body {{
+    {canvas} {{
       font-family: {t.font_family};
       background: {t.background};
-      width: {dimensions[0]}px;
-      height: {dimensions[1]}px;
+      width: var(--canvas-width);
+      height: var(--canvas-height);
       display: flex;
       flex-direction: column;
       padding: {t.padding_large};
@@ -752,13 +962,24 @@ class GraphicsBuilder:
       gap: {t.gap_large};
       overflow: hidden;
     }}
-    {grid_css}
-    {background_svg_css}
-    body > * {{
+
+    {canvas} > * {{
       position: relative;
       z-index: 2;
     }}
 
+    /* Advanced Components */
+    .hero-icon {{ flex-shrink: 0; }}
+"""
+
+# Carousel documents: slides stack at canvas size and print one per page
+_CAROUSEL_CSS = """
+    @page {{ size: {width}px {height}px; margin: 0; }}
+    .slide + .slide {{ break-before: page; }}
+"""
+
+_COMPONENT_CSS = {
+    "badge": """
     /* Badge - refined pill style */
     .badge {{
       display: inline-flex;
@@ -780,7 +1001,8 @@ class GraphicsBuilder:
       margin-bottom: {t.gap_small};
     }}
     .badge svg {{ width: 18px; height: 18px; }}
-
+""",
+    "headline": """
     /* Headline - bold, impactful typography */
     .headline {{
       font-weight: {t.font_headline};
@@ -795,7 +1017,8 @@ class GraphicsBuilder:
       color: {t.text_muted};
       display: inline;
     }}
-
+""",
+    "quote_card": """
     /* Quote Card - elegant, spacious */
     .quote-card {{
       background: {t.surface};
@@ -866,7 +1089,8 @@ class GraphicsBuilder:
       margin-top: 4px;
       font-weight: 500;
     }}
-
+""",
+    "metric_card": """
     /* Metric Card - bold, centered */
     .metric-card {{
       background: {t.surface};
@@ -909,7 +1133,8 @@ class GraphicsBuilder:
       border-radius: {t.radius_pill};
       display: inline-block;
     }}
-
+""",
+    "cta_card": """
     /* CTA Card - compelling, action-oriented */
     .cta-card {{
       background: {t.surface};
@@ -955,7 +1180,8 @@ class GraphicsBuilder:
       box-shadow: {t.shadow_medium}, 0 0 0 0 {t.accent};
       transition: all 0.2s ease;
     }}
-
+""",
+    "infographic_card": """
     /* Infographic Card - structured, readable */
     .infographic-card {{
       background: {t.surface};
@@ -1016,7 +1242,8 @@ class GraphicsBuilder:
       line-height: 1.4;
       letter-spacing: {t.letter_spacing_normal};
     }}
-
+""",
+    "logo_card": """
     /* Logos Card */
     .logos-card {{
       background: {t.border_light};
@@ -1050,10 +1277,8 @@ class GraphicsBuilder:
       background: {t.gradient_primary};
       border-radius: 8px;
     }}
-    
-    /* Advanced Components */
-    .hero-icon {{ flex-shrink: 0; }}
-
+""",
+    "process_flow": """
     /* Process Flow - clean, connected steps */
     .process-flow {{
       display: flex;
@@ -1119,7 +1344,8 @@ class GraphicsBuilder:
       margin: 0 auto;
       opacity: 0.5;
     }}
-
+""",
+    "bar_chart": """
     /* Bar Chart - refined data visualization */
     .bar-chart {{
       display: flex;
@@ -1176,7 +1402,8 @@ class GraphicsBuilder:
       text-align: center;
       letter-spacing: 0.02em;
     }}
-
+""",
+    "timeline": """
     /* Timeline - elegant vertical progression */
     .timeline {{
       display: flex;
@@ -1247,7 +1474,8 @@ class GraphicsBuilder:
       color: {t.text_secondary};
       line-height: {t.line_height_normal};
     }}
-
+""",
+    "comparison": """
     /* Comparison - clear side-by-side */
     .comparison {{
       display: flex;
@@ -1317,7 +1545,8 @@ class GraphicsBuilder:
       color: white;
       box-shadow: {t.shadow_medium};
     }}
-
+""",
+    "feature_grid": """
     /* Feature Grid - balanced icon cards */
     .feature-grid {{
       display: grid;
@@ -1361,7 +1590,8 @@ class GraphicsBuilder:
       color: {t.text_secondary};
       line-height: {t.line_height_normal};
     }}
-
+""",
+    "stats_dashboard": """
     /* Stats Dashboard - compact, informative */
     .stats-dashboard {{
       display: grid;
@@ -1428,7 +1658,8 @@ class GraphicsBuilder:
       font-weight: 600;
       color: {t.text_secondary};
     }}
-    
+""",
+    "progress_bar": """
     /* Progress Bar */
     .progress-bar-container {{
       display: flex;
@@ -1463,7 +1694,8 @@ class GraphicsBuilder:
       transition: width 0.3s ease;
       box-shadow: {t.shadow_medium};
     }}
-
+""",
+    "event_poster": """
     /* Event Poster */
     .event-poster {{
       display: flex;
@@ -1486,7 +1718,8 @@ class GraphicsBuilder:
       color: {t.text_primary};
       font-style: normal;
     }}
-
+""",
+    "subtitle": """
     /* Subtitle */
     .subtitle {{
       font-size: 24px;
@@ -1502,7 +1735,8 @@ class GraphicsBuilder:
       padding: 4px 12px;
       border-radius: 4px;
     }}
-
+""",
+    "positioned_logo": """
     /* Positioned Logo */
     .positioned-logo {{
       position: absolute;
@@ -1541,7 +1775,8 @@ class GraphicsBuilder:
     .positioned-logo-text {{
       letter-spacing: 0.05em;
     }}
-
+""",
+    "background_svg": """
     /* Background SVG */
     .background-svg {{
       position: absolute;
@@ -1560,5 +1795,224 @@ class GraphicsBuilder:
       fill: {t.text_primary};
       opacity: 0.08;
     }}
-  """
+""",
+}
 
+
+@dataclass(frozen=True)
+class ComponentSpec:
+    """
+    Registered component type.
+
+    - render: Callable returning the component's HTML
+    - args: Extracts render's positional arguments from (content, theme)
+    - css: Stylesheet template for the component; ``{t.field}`` becomes
+           var(--field) (literal braces doubled); only emitted when used
+    """
+    render: Callable[..., str]
+    args: Callable[[Dict[str, Any], Theme], Tuple[Any, ...]]
+    css: str = ""
+
+
+_REGISTRY: Dict[str, ComponentSpec] = {}
+
+
+def _content_and_theme(content: Dict[str, Any], theme: Theme) -> Tuple[Any, ...]:
+    return (content, theme)
+
+
+def register_component(
+    name: str,
+    render: Callable[..., str],
+    args: Optional[Callable[[Dict[str, Any], Theme], Tuple[Any, ...]]] = None,
+    css: str = "",
+    replace: bool = False,
+) -> None:
+    """
+    Register a component type for build_from_config.
+
+    Args:
+        name: Component type used in config ("type": name)
+        render: Callable returning the component's HTML
+        args: Maps (content, theme) to render's positional arguments
+              (default: render is called as render(content, theme))
+        css: Stylesheet template for the component (see ComponentSpec)
+        replace: Allow overriding an existing registration
+
+    Usage:
+        register_component(
+            "chip",
+            lambda text, theme: f'<span class="chip">{escape_html(text)}</span>',
+            lambda content, theme: (content.get("text", ""), theme),
+            css=".chip {{ color: {t.accent}; }}",
+        )
+    """
+    if name in _REGISTRY and not replace:
+        raise ValueError(f"Component type {name!r} is already registered")
+    _REGISTRY[name] = ComponentSpec(render, args or _content_and_theme, css)
+    # Compiled sheets for this type may predate the registration
+    _compiled_css.cache_clear()
+
+
+def unregister_component(name: str) -> None:
+    """Remove a registered component type."""
+    del _REGISTRY[name]
+    _compiled_css.cache_clear()
+
+
+def registered_components() -> List[str]:
+    """Names of all registered component types."""
+    return list(_REGISTRY)
+
+
+# Built-in components, in stylesheet order
+register_component(
+    "badge",
+    ComponentRenderer.render_badge,
+    lambda c, t: (c.get("text", ""), t, c.get("icon")),
+    _COMPONENT_CSS["badge"],
+)
+register_component(
+    "headline",
+    ComponentRenderer.render_headline,
+    lambda c, t: (
+        c.get("text", ""),
+        t,
+        c.get("size", "large"),
+        c.get("align", "center"),
+        c.get("bold_parts"),
+        c.get("muted_parts"),
+    ),
+    _COMPONENT_CSS["headline"],
+)
+register_component(
+    "quote_card",
+    ComponentRenderer.render_quote_card,
+    lambda c, t: (
+        c.get("quote", ""),
+        c.get("author"),
+        c.get("role"),
+        c.get("avatar"),
+        t,
+        c.get("emphasis"),
+    ),
+    _COMPONENT_CSS["quote_card"],
+)
+register_component(
+    "metric_card",
+    ComponentRenderer.render_metric_card,
+    lambda c, t: (
+        c.get("value", ""),
+        c.get("label", ""),
+        c.get("change"),
+        c.get("change_type", "positive"),
+        t,
+    ),
+    _COMPONENT_CSS["metric_card"],
+)
+register_component(
+    "cta_card",
+    ComponentRenderer.render_cta_card,
+    lambda c, t: (
+        c.get("headline", ""),
+        c.get("description"),
+        c.get("button_text", "Get Started"),
+        c.get("button_url"),
+        t,
+    ),
+    _COMPONENT_CSS["cta_card"],
+)
+register_component(
+    "infographic_card",
+    ComponentRenderer.render_infographic_card,
+    lambda c, t: (c.get("title", ""), c.get("items", []), t),
+    _COMPONENT_CSS["infographic_card"],
+)
+register_component(
+    "logo_card",
+    ComponentRenderer.render_logo_card,
+    lambda c, t: (c.get("client_name", ""), c.get("provider_name", "SCAILE"), t),
+    _COMPONENT_CSS["logo_card"],
+)
+register_component(
+    "process_flow",
+    AdvancedComponentRenderer.render_process_flow,
+    lambda c, t: (
+        c.get("steps", []),
+        t,
+        c.get("orientation", "horizontal"),
+        c.get("show_arrows", True),
+    ),
+    _COMPONENT_CSS["process_flow"],
+)
+register_component(
+    "bar_chart",
+    AdvancedComponentRenderer.render_bar_chart,
+    lambda c, t: (c.get("data", []), t, c.get("max_value")),
+    _COMPONENT_CSS["bar_chart"],
+)
+register_component(
+    "timeline",
+    AdvancedComponentRenderer.render_timeline,
+    lambda c, t: (c.get("events", []), t, c.get("orientation", "vertical")),
+    _COMPONENT_CSS["timeline"],
+)
+register_component(
+    "comparison",
+    AdvancedComponentRenderer.render_comparison,
+    lambda c, t: (c.get("left", {}), c.get("right", {}), t),
+    _COMPONENT_CSS["comparison"],
+)
+register_component(
+    "feature_grid",
+    AdvancedComponentRenderer.render_feature_grid,
+    lambda c, t: (c.get("features", []), t, c.get("columns", 3)),
+    _COMPONENT_CSS["feature_grid"],
+)
+register_component(
+    "stats_dashboard",
+    AdvancedComponentRenderer.render_stats_dashboard,
+    lambda c, t: (c.get("stats", []), t),
+    _COMPONENT_CSS["stats_dashboard"],
+)
+register_component(
+    "progress_bar",
+    AdvancedComponentRenderer.render_progress_bar,
+    lambda c, t: (
+        c.get("label", ""),
+        c.get("value", 0),
+        c.get("max_value", 100),
+        t,
+        c.get("show_percentage", True),
+    ),
+    _COMPONENT_CSS["progress_bar"],
+)
+register_component(
+    "event_poster",
+    ComponentRenderer.render_event_poster,
+    lambda c, t: (c.get("lines", []), t, c.get("align", "left")),
+    _COMPONENT_CSS["event_poster"],
+)
+register_component(
+    "subtitle",
+    ComponentRenderer.render_subtitle,
+    lambda c, t: (c.get("text", ""), t, c.get("highlight"), c.get("align", "left")),
+    _COMPONENT_CSS["subtitle"],
+)
+register_component(
+    "positioned_logo",
+    ComponentRenderer.render_positioned_logo,
+    lambda c, t: (
+        c.get("text", ""),
+        t,
+        c.get("position", "bottom-right"),
+        c.get("icon_svg"),
+    ),
+    _COMPONENT_CSS["positioned_logo"],
+)
+register_component(
+    "background_svg",
+    ComponentRenderer.render_background_svg,
+    lambda c, t: (c.get("svg", ""), t),
+    _COMPONENT_CSS["background_svg"],
+)
@@ -1,12 +1,192 @@
 """
 PNG Export Module - Convert HTML graphics to PNG images.
 Uses Playwright for headless browser rendering.
+
+JPEG and WebP output are also available via the format/quality arguments
+or an ImageFormat, and vector PDFs via html_to_pdf. Configs within the
+raster subset can skip the browser entirely with native=True (see raster.py).
 """
 
+import asyncio
+import base64
+import io
+import math
 import os
+import queue
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from html import escape as html_escape
 from pathlib import Path
-from typing import Optional, Union
+from typing import (
+    Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union,
+)
+
+from .cache import RenderCache
+from .components import READY_FLAG
+
+# Readiness strategies, applied after the document's load event:
+# - "fonts": every font used by the document has loaded (or failed)
+# - "images": every <img> has been decoded
+# - "flag": window.__openfigmaReady is set (emitted by GraphicsBuilder)
+# - "networkidle": no network activity for 500ms (slow, for remote assets)
+# - "none": screenshot right after load, for fully inline documents
+# - "auto": "flag" for GraphicsBuilder output, otherwise "fonts"
+READY_STRATEGIES = ("auto", "fonts", "images", "flag", "networkidle", "none")
+
+_READY_SCRIPTS = {
+    "fonts": "() => document.fonts.ready.then(() => true)",
+    "images": (
+        "() => Promise.all(Array.from(document.images, "
+        "img => img.decode().catch(() => null))).then(() => true)"
+    ),
+}
+
+ReadyStrategy = Union[str, Sequence[str]]
+
+# Swaps a new document into a warm page: <body> is always replaced, <head>
+# nodes (fonts, static stylesheet, theme variables) only where they differ,
+# so a theme switch re-applies just the small :root block. Scripts in
+# swapped documents do not run. Fonts load lazily, once layout asks for
+# them, so the swap forces a layout pass: without it document.fonts.ready
+# can resolve before the new document has requested its faces.
+_SWAP_SCRIPT = """(html) => {
+  const doc = new DOMParser().parseFromString(html, "text/html");
+  const next = Array.from(doc.head.children);
+  const current = Array.from(document.head.children);
+  if (next.length === current.length) {
+    next.forEach((node, i) => {
+      if (!node.isEqualNode(current[i])) current[i].replaceWith(document.adoptNode(node));
+    });
+  } else {
+    document.head.replaceChildren(...next.map((node) => document.adoptNode(node)));
+  }
+  document.body.replaceWith(document.adoptNode(doc.body));
+  document.body.getBoundingClientRect();
+  return true;
+}"""
+
+_BLANK_HTML = "<!DOCTYPE html><html><head></head><body></body></html>"
+
+# Atlas pages and multi-document PDFs hold one srcdoc <iframe> per graphic;
+# these apply a readiness step to the framed documents at the given indices,
+# as each document resolves "auto" (flag or fonts) on its own
+_FRAMES = "indices.map(i => document.querySelectorAll('iframe')[i])"
+_FRAME_READY_SCRIPTS = {
+    "flag": f"(indices) => {_FRAMES}.every(f => f.contentWindow.{READY_FLAG} === true)",
+    "fonts": (
+        f"(indices) => Promise.all({_FRAMES}.map(f => f.contentDocument.fonts.ready))"
+        ".then(() => true)"
+    ),
+    "images": (
+        f"(indices) => Promise.all({_FRAMES}.flatMap(f => Array.from("
+        "f.contentDocument.images, img => img.decode().catch(() => null))))"
+        ".then(() => true)"
+    ),
+}
+
+_PLAYWRIGHT_MISSING = (
+    "Playwright is required for PNG export. "
+    "Install with: pip install playwright && playwright install chromium"
+)
+
+_PILLOW_MISSING = (
+    "Pillow is required for lossless WebP and PNG compress_level. "
+    "Install with: pip install Pillow"
+)
+
+IMAGE_FORMATS = ("png", "jpeg", "webp")
+
+_EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+_DEFAULT_QUALITY = {"jpeg": 90, "webp": 80}
+
+
+@dataclass(frozen=True)
+class ImageFormat:
+    """
+    Output encoding for rendered graphics.
+
+    - format: "png", "jpeg" (or "jpg") or "webp"
+    - quality: 0-100 for jpeg (default 90) and webp (default 80); for
+      lossless webp it trades encode time for size instead
+    - lossless: Encode webp losslessly
+    - compress_level: zlib level 0-9 for png (default: Chromium's encoder)
+
+    PNG, JPEG and lossy WebP are encoded by Chromium itself. Lossless WebP
+    and an explicit PNG compress_level are re-encoded from a PNG capture
+    with Pillow, which must be installed.
+    """
+    format: str = "png"
+    quality: Optional[int] = None
+    lossless: bool = False
+    compress_level: Optional[int] = None
+
+    def __post_init__(self):
+        fmt = self.format.lower()
+        if fmt == "jpg":
+            fmt = "jpeg"
+        if fmt not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format {self.format!r}, expected one of {IMAGE_FORMATS}")
+        object.__setattr__(self, "format", fmt)
+
+        if self.quality is not None:
+            if fmt == "png":
+                raise ValueError("quality does not apply to png; use compress_level")
+            if not 0 <= self.quality <= 100:
+                raise ValueError("quality must be between 0 and 100")
+        if self.lossless and fmt != "webp":
+            raise ValueError("lossless only applies to webp")
+        if self.compress_level is not None:
+            if fmt != "png":
+                raise ValueError("compress_level only applies to png")
+            if not 0 <= self.compress_level <= 9:
+                raise ValueError("compress_level must be between 0 and 9")
+
+    @property
+    def extension(self) -> str:
+        """File extension including the dot."""
+        return _EXTENSIONS[self.format]
+
+    @property
+    def content_type(self) -> str:
+        """MIME type of the encoded image."""
+        return f"image/{self.format}"
+
+    @property
+    def cache_tag(self) -> str:
+        """Distinguishes encodings in RenderCache keys ("png" for the default)."""
+        parts = [self.format]
+        if self.format in _DEFAULT_QUALITY:
+            parts.append(f"q{self._quality}")
+        if self.lossless:
+            parts.append("lossless")
+        if self.compress_level is not None:
+            parts.append(f"z{self.compress_level}")
+        return ":".join(parts)
+
+    @property
+    def _quality(self) -> Optional[int]:
+        if self.quality is not None:
+            return self.quality
+        return _DEFAULT_QUALITY.get(self.format)
+
+    @property
+    def _needs_pillow(self) -> bool:
+        return self.lossless or self.compress_level is not None
+
+
+ImageFormatLike = Union[str, ImageFormat]
+
+_PNG = ImageFormat()
+
+
+def _image_format(format: ImageFormatLike = "png", quality: Optional[int] = None) -> ImageFormat:
+    """Resolve a format name or ImageFormat plus an optional quality override."""
+    if isinstance(format, ImageFormat):
+        return format if quality is None else replace(format, quality=quality)
+    return ImageFormat(format, quality)
 
 
 def html_to_png(
@@ -14,6 +194,12 @@ def html_to_png(
     output_path: Optional[str] = None,
     width: int = 1920,
     height: int = 1080,
+    cache: Optional[RenderCache] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    format: ImageFormatLike = "png",
+    quality: Optional[int] = None,
+    scale: float = 1.0,
 ) -> bytes:
     """
     Convert HTML to PNG image.
@@ -23,52 +209,111 @@ def html_to_png(
         output_path: Optional path to save PNG file
         width: Viewport width (default 1920)
         height: Viewport height (default 1080)
+        cache: Optional RenderCache; hits skip the browser entirely
+        base_dir: Load the document from a file in this directory so
+                  relative file:// assets resolve (default: in memory)
+        ready: Readiness strategy before the screenshot, a name from
+               READY_STRATEGIES or a sequence of them (default "auto")
+        format: "png" (default), "jpeg", "webp" or an ImageFormat
+        quality: JPEG/WebP quality 0-100 (see ImageFormat)
+        scale: Device scale factor; 2 renders a 2x (retina) image of the
+               same CSS layout (default 1)
 
     Returns:
-        PNG image bytes
+        Image bytes in the requested format
     """
+    image_format = _image_format(format, quality)
+    _check_scale(scale)
+    if cache is not None:
+        key = cache.key(html, width, height, scale, image_format.cache_tag, base_dir)
+        png_bytes = cache.get(key)
+        if png_bytes is not None:
+            if output_path:
+                _write_bytes(output_path, png_bytes)
+            return png_bytes
+
     try:
         from playwright.sync_api import sync_playwright
     except ImportError:
-        raise ImportError(
-            "Playwright is required for PNG export. "
-            "Install with: pip install playwright && playwright install chromium"
-        )
-
-    png_bytes = None
+        raise ImportError(_PLAYWRIGHT_MISSING)
 
     with sync_playwright() as p:
         browser = p.chromium.launch()
-        page = browser.new_page(viewport={"width": width, "height": height})
+        try:
+            png_bytes = _render_page(
+                browser, html, width, height, output_path, base_dir, ready, image_format, scale
+            )
+        finally:
+            browser.close()
 
-        # Write HTML to temp file and load it
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html)
-            temp_path = f.name
+    if cache is not None:
+        cache.put(key, png_bytes)
+    return png_bytes
 
-        try:
-            page.goto(f"file://{temp_path}")
-            page.wait_for_load_state("networkidle")
 
-            # Take screenshot
-            png_bytes = page.screenshot(type="png")
+def html_to_pdf(
+    html: Union[str, Sequence[str]],
+    output_path: Optional[str] = None,
+    width: int = 1920,
+    height: int = 1080,
+    cache: Optional[RenderCache] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+) -> bytes:
+    """
+    Convert HTML to a vector PDF sized exactly to the graphic.
+
+    Text and shapes stay vector and fonts are embedded, so text-heavy
+    graphics are far smaller than PNGs and print sharply at any size.
+
+    Args:
+        html: HTML string to render, or a sequence of HTML strings for a
+              multi-page PDF with one graphic per page
+        output_path: Optional path to save the PDF file
+        width: Page width in CSS pixels (default 1920)
+        height: Page height in CSS pixels (default 1080)
+        cache: Optional RenderCache; hits skip the browser entirely
+        base_dir: Load the document from a file in this directory so
+                  relative file:// assets resolve (default: in memory)
+        ready: Readiness strategy before printing (default "auto")
 
+    Returns:
+        PDF bytes
+    """
+    if cache is not None:
+        document, pages, _ = _pdf_source(html, width, height)
+        key = cache.key(document, width, height, format=f"pdf:{pages}", base_dir=base_dir)
+        pdf_bytes = cache.get(key)
+        if pdf_bytes is not None:
             if output_path:
-                with open(output_path, 'wb') as f:
-                    f.write(png_bytes)
+                _write_bytes(output_path, pdf_bytes)
+            return pdf_bytes
 
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        raise ImportError(_PLAYWRIGHT_MISSING)
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        try:
+            return _render_pdf(
+                browser, html, width, height, output_path, cache, base_dir, ready
+            )
         finally:
-            os.unlink(temp_path)
             browser.close()
 
-    return png_bytes
-
 
 def export_config_to_png(
     config: dict,
     output_path: str,
     dimensions: tuple = (1920, 1080),
     theme=None,
+    cache: Optional[RenderCache] = None,
+    format: ImageFormatLike = "png",
+    quality: Optional[int] = None,
+    scale: float = 1.0,
+    native: bool = False,
 ) -> str:
     """
     Build graphic from config and export directly to PNG.
@@ -78,37 +323,956 @@ def export_config_to_png(
         output_path: Path to save PNG file
         dimensions: (width, height) tuple
         theme: Optional Theme object
+        cache: Optional RenderCache shared across calls
+        format: "png" (default), "jpeg", "webp" or an ImageFormat
+        quality: JPEG/WebP quality 0-100 (see ImageFormat)
+        scale: Device scale factor (default 1)
+        native: Draw configs within the raster subset (see
+                openfigma.raster) with Pillow instead of launching
+                Chromium; anything else still renders in the browser.
+                Native renders bypass the cache (default False)
 
     Returns:
         Path to saved PNG file
     """
     from .components import GraphicsBuilder
 
+    if native:
+        from .raster import RasterRenderer
+
+        renderer = RasterRenderer()
+        if not renderer.unsupported(config, theme):
+            renderer.render(config, dimensions, theme, output_path, format, quality, scale)
+            return output_path
+
     builder = GraphicsBuilder(theme=theme)
     html = builder.build_from_config(config, dimensions=dimensions)
 
-    html_to_png(html, output_path, width=dimensions[0], height=dimensions[1])
+    html_to_png(
+        html, output_path, width=dimensions[0], height=dimensions[1], cache=cache,
+        format=format, quality=quality, scale=scale,
+    )
+    return output_path
+
+
+def _check_scale(scale: float) -> None:
+    if scale <= 0:
+        raise ValueError("scale must be positive")
+
+
+def _scaled_path(path: str, scale: float) -> str:
+    """name.png for 1x, name@2x.png etc. for other scales."""
+    if scale == 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}@{scale:g}x{ext}"
+
+
+def _sized_path(path: str, size: Tuple[int, int]) -> str:
+    """name-1080x1350.png for a (1080, 1350) size."""
+    root, ext = os.path.splitext(path)
+    return f"{root}-{size[0]}x{size[1]}{ext}"
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write rendered bytes to a file."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _write_temp_html(html: str, base_dir: str) -> str:
+    """Write HTML to a temp file in base_dir and return its path."""
+    with tempfile.NamedTemporaryFile(
+        mode='w', suffix='.html', dir=base_dir, delete=False, encoding='utf-8'
+    ) as f:
+        f.write(html)
+        return f.name
+
+
+def _ready_steps(html: str, ready: ReadyStrategy) -> List[str]:
+    """Resolve a readiness strategy (name or sequence of names) to concrete steps."""
+    steps = [ready] if isinstance(ready, str) else list(ready)
+    for step in steps:
+        if step not in READY_STRATEGIES:
+            raise ValueError(
+                f"Unknown readiness strategy {step!r}, expected one of {READY_STRATEGIES}"
+            )
+    resolved = []
+    for step in steps:
+        if step == "auto":
+            step = "flag" if READY_FLAG in html else "fonts"
+        if step != "none":
+            resolved.append(step)
+    return resolved
+
+
+def _wait_ready(page: Any, html: str, ready: ReadyStrategy) -> None:
+    """Block until the page satisfies the readiness strategy."""
+    for step in _ready_steps(html, ready):
+        if step == "flag":
+            page.wait_for_function(f"() => window.{READY_FLAG} === true")
+        elif step == "networkidle":
+            page.wait_for_load_state("networkidle")
+        else:
+            page.evaluate(_READY_SCRIPTS[step])
+
+
+async def _wait_ready_async(page: Any, html: str, ready: ReadyStrategy) -> None:
+    """Async counterpart of _wait_ready."""
+    for step in _ready_steps(html, ready):
+        if step == "flag":
+            await page.wait_for_function(f"() => window.{READY_FLAG} === true")
+        elif step == "networkidle":
+            await page.wait_for_load_state("networkidle")
+        else:
+            await page.evaluate(_READY_SCRIPTS[step])
+
+
+def _load_html(
+    page: Any,
+    html: str,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+) -> None:
+    """
+    Load a document into a page and wait until it is ready to capture.
+
+    By default the HTML is handed to the page in memory with no disk I/O.
+    With base_dir, it is written to a temp file in that directory and loaded
+    from ``file://`` so relative asset paths resolve against base_dir.
+    """
+    if base_dir is None:
+        page.set_content(html)
+    else:
+        temp_path = _write_temp_html(html, base_dir)
+        try:
+            page.goto(Path(temp_path).as_uri())
+        finally:
+            os.unlink(temp_path)
+    _wait_ready(page, html, ready)
+
+
+async def _load_html_async(
+    page: Any,
+    html: str,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+) -> None:
+    """Async counterpart of _load_html."""
+    if base_dir is None:
+        await page.set_content(html)
+    else:
+        temp_path = _write_temp_html(html, base_dir)
+        try:
+            await page.goto(Path(temp_path).as_uri())
+        finally:
+            os.unlink(temp_path)
+    await _wait_ready_async(page, html, ready)
+
+
+def _swap_ready_steps(html: str, ready: ReadyStrategy) -> List[str]:
+    """Readiness steps after a content swap, where the ready flag script never runs."""
+    steps = []
+    for step in _ready_steps(html, ready):
+        for swapped in (["fonts", "images"] if step == "flag" else [step]):
+            if swapped not in steps:
+                steps.append(swapped)
+    return steps
+
+
+# Warm pages live on the thread driving their browser (a pool worker or the
+# exporter's own thread, as sync Playwright is thread-bound), per browser and
+# keyed by (device scale, base_dir). Whoever closes a browser drops its pages.
+_warm = threading.local()
+
+
+def _warm_pages(browser: Any) -> Dict[tuple, Any]:
+    """This thread's warm pages of browser."""
+    browsers = _warm.__dict__.setdefault("browsers", {})
+    return browsers.setdefault(browser, {})
+
+
+def _drop_warm_pages(browser: Any) -> None:
+    """Forget this thread's warm pages of browser, before it closes or relaunches."""
+    _warm.__dict__.get("browsers", {}).pop(browser, None)
+
+
+def _warm_page(browser: Any, width: int, height: int, scale: float, base_dir: Optional[str]) -> Any:
+    """Return this browser's warm page for scale/base_dir, sized to width x height."""
+    pages = _warm_pages(browser)
+    page = pages.get((scale, base_dir))
+    if page is None or page.is_closed():
+        page = browser.new_page(
+            viewport={"width": width, "height": height}, device_scale_factor=scale
+        )
+        # Loading a blank document from base_dir makes relative URLs resolve there
+        _load_html(page, _BLANK_HTML, base_dir, "none")
+        pages[(scale, base_dir)] = page
+    elif page.viewport_size != {"width": width, "height": height}:
+        page.set_viewport_size({"width": width, "height": height})
+    return page
+
+
+def _render_warm(
+    browser: Any,
+    html: str,
+    width: int,
+    height: int,
+    output_path: Optional[str] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    image_format: Optional[ImageFormat] = None,
+    scale: float = 1.0,
+) -> bytes:
+    """Render by swapping HTML into a warm page instead of opening a new one."""
+    page = _warm_page(browser, width, height, scale, base_dir)
+    try:
+        page.evaluate(_SWAP_SCRIPT, html)
+        _wait_ready(page, html, _swap_ready_steps(html, ready))
+        return _capture(page, image_format, output_path)
+    except Exception:
+        # Never reuse a page left in an unknown state
+        page.close()
+        raise
+
+
+def _atlas_layout(count: int, width: int, height: int) -> Tuple[List[dict], int, int]:
+    """Tile rectangles on a near-square grid, plus the atlas width and height."""
+    columns = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / columns)
+    clips = [
+        {"x": (i % columns) * width, "y": (i // columns) * height, "width": width, "height": height}
+        for i in range(count)
+    ]
+    return clips, columns * width, rows * height
+
+
+def _atlas_html(htmls: Sequence[str], clips: List[dict]) -> str:
+    """One page with every document isolated in its own positioned iframe."""
+    tiles = "".join(
+        f'<iframe style="left:{clip["x"]}px;top:{clip["y"]}px;'
+        f'width:{clip["width"]}px;height:{clip["height"]}px" '
+        f'srcdoc="{html_escape(html, quote=True)}"></iframe>'
+        for html, clip in zip(htmls, clips)
+    )
+    return (
+        "<!DOCTYPE html><html><head><style>"
+        "html, body { margin: 0; padding: 0; }"
+        "iframe { position: absolute; border: 0; display: block; }"
+        f"</style></head><body>{tiles}</body></html>"
+    )
+
+
+def _wait_frames_ready(page: Any, htmls: Sequence[str], ready: ReadyStrategy) -> None:
+    """
+    Apply the readiness strategy to each framed document of a page.
+
+    Steps resolve per document, so with "auto" only GraphicsBuilder frames
+    wait for the ready flag and raw HTML frames wait for their fonts.
+    """
+    frames: Dict[str, List[int]] = {}
+    for index, html in enumerate(htmls):
+        for step in _ready_steps(html, ready):
+            frames.setdefault(step, []).append(index)
+    for step, indices in frames.items():
+        if step == "flag":
+            page.wait_for_function(_FRAME_READY_SCRIPTS["flag"], arg=indices)
+        elif step == "networkidle":
+            page.wait_for_load_state("networkidle")
+        else:
+            page.evaluate(_FRAME_READY_SCRIPTS[step], indices)
+
+
+def _item_html(content: Union[str, dict], dimensions: tuple) -> str:
+    """Resolve a batch item's content (HTML string or config dict) to HTML."""
+    from .components import render
+
+    if isinstance(content, dict):
+        return render(content, dimensions=dimensions)
+    return content
+
+
+def _transcode(png_bytes: bytes, image_format: ImageFormat) -> bytes:
+    """Re-encode a PNG capture with Pillow for encodings Chromium lacks."""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError(_PILLOW_MISSING)
+
+    out = io.BytesIO()
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        if image_format.format == "webp":
+            image.save(out, "WEBP", lossless=True, quality=image_format._quality)
+        else:
+            image.save(out, "PNG", compress_level=image_format.compress_level)
+    return out.getvalue()
+
+
+def _capture_params(image_format: ImageFormat, clip: Optional[dict] = None) -> dict:
+    """CDP Page.captureScreenshot parameters for a Chromium-encoded WebP."""
+    params = {"format": "webp", "quality": image_format._quality}
+    if clip:
+        params["clip"] = {**clip, "scale": 1}
+    return params
+
+
+def _capture(
+    page: Any,
+    image_format: Optional[ImageFormat] = None,
+    output_path: Optional[str] = None,
+    clip: Optional[dict] = None,
+) -> bytes:
+    """Screenshot the viewport (or a clip rectangle of it) in the requested encoding."""
+    image_format = image_format or _PNG
+    if image_format._needs_pillow:
+        data = _transcode(page.screenshot(type="png", clip=clip), image_format)
+    elif image_format.format == "webp":
+        # Playwright's screenshot() has no WebP option; Chromium's CDP does
+        session = page.context.new_cdp_session(page)
+        try:
+            result = session.send("Page.captureScreenshot", _capture_params(image_format, clip))
+        finally:
+            session.detach()
+        data = base64.b64decode(result["data"])
+    else:
+        return page.screenshot(
+            path=output_path, type=image_format.format, quality=image_format._quality, clip=clip
+        )
+
+    if output_path:
+        _write_bytes(output_path, data)
+    return data
+
+
+async def _capture_async(
+    page: Any,
+    image_format: Optional[ImageFormat] = None,
+    output_path: Optional[str] = None,
+) -> bytes:
+    """Async counterpart of _capture."""
+    image_format = image_format or _PNG
+    if image_format._needs_pillow:
+        data = _transcode(await page.screenshot(type="png"), image_format)
+    elif image_format.format == "webp":
+        session = await page.context.new_cdp_session(page)
+        try:
+            result = await session.send("Page.captureScreenshot", _capture_params(image_format))
+        finally:
+            await session.detach()
+        data = base64.b64decode(result["data"])
+    else:
+        return await page.screenshot(
+            path=output_path, type=image_format.format, quality=image_format._quality
+        )
+
+    if output_path:
+        _write_bytes(output_path, data)
+    return data
+
+
+def _render_page(
+    browser: Any,
+    html: str,
+    width: int,
+    height: int,
+    output_path: Optional[str] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    image_format: Optional[ImageFormat] = None,
+    scale: float = 1.0,
+    reuse: bool = False,
+) -> bytes:
+    """
+    Render HTML in a fresh page of an open browser and return image bytes.
+
+    With reuse, the HTML is swapped into a warm page instead (_render_warm).
+    """
+    if reuse:
+        return _render_warm(
+            browser, html, width, height, output_path, base_dir, ready, image_format, scale
+        )
+
+    page = browser.new_page(
+        viewport={"width": width, "height": height}, device_scale_factor=scale
+    )
+
+    try:
+        _load_html(page, html, base_dir, ready)
+        return _capture(page, image_format, output_path)
+    finally:
+        page.close()
+
+
+def _render_bytes(
+    browser: Any,
+    html: str,
+    width: int,
+    height: int,
+    cache: Optional[RenderCache] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    image_format: Optional[ImageFormat] = None,
+    scale: float = 1.0,
+    reuse: bool = False,
+) -> bytes:
+    """Render HTML to image bytes, consulting the cache first."""
+    args = (browser, html, width, height, None, base_dir, ready, image_format, scale, reuse)
+    if cache is None:
+        return _render_page(*args)
+
+    key = cache.key(html, width, height, scale, (image_format or _PNG).cache_tag, base_dir)
+    png_bytes = cache.get(key)
+    if png_bytes is None:
+        png_bytes = _render_page(*args)
+        cache.put(key, png_bytes)
+    return png_bytes
+
+
+def _render_to_file(
+    browser: Any,
+    html: str,
+    output_path: str,
+    width: int,
+    height: int,
+    cache: Optional[RenderCache] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    image_format: Optional[ImageFormat] = None,
+    scale: float = 1.0,
+    reuse: bool = False,
+) -> str:
+    """Render HTML to an image file, consulting the cache first, and return its path."""
+    if cache is None:
+        _render_page(
+            browser, html, width, height, output_path, base_dir, ready, image_format, scale, reuse
+        )
+        return output_path
+
+    _write_bytes(
+        output_path,
+        _render_bytes(
+            browser, html, width, height, cache, base_dir, ready, image_format, scale, reuse
+        ),
+    )
     return output_path
 
 
+def _uncached_variants(
+    variants: List[Tuple[str, str, int, int, float]],
+    cache: Optional[RenderCache],
+    image_format: ImageFormat,
+    base_dir: Optional[str] = None,
+) -> List[Tuple[str, str, int, int, float, Optional[str]]]:
+    """
+    Write cached (html, path, width, height, scale) variants to disk.
+
+    Returns the rest with their cache keys appended.
+    """
+    missing = []
+    for html, path, width, height, scale in variants:
+        key = data = None
+        if cache is not None:
+            key = cache.key(html, width, height, scale, image_format.cache_tag, base_dir)
+            data = cache.get(key)
+        if data is None:
+            missing.append((html, path, width, height, scale, key))
+        else:
+            _write_bytes(path, data)
+    return missing
+
+
+def _render_scales(
+    browser: Any,
+    html: str,
+    output_path: str,
+    width: int,
+    height: int,
+    scales: Sequence[float],
+    cache: Optional[RenderCache] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    image_format: Optional[ImageFormat] = None,
+) -> List[str]:
+    """
+    Render one document at several device scales from a single page load.
+
+    Output paths follow the @2x convention (see _scaled_path). Between
+    captures the device scale factor is switched in place through CDP, which
+    re-rasterizes the page without reloading it or re-running layout math.
+    """
+    image_format = image_format or _PNG
+    paths = [_scaled_path(output_path, scale) for scale in scales]
+    missing = _uncached_variants(
+        [(html, path, width, height, scale) for path, scale in zip(paths, scales)],
+        cache, image_format, base_dir,
+    )
+    if not missing:
+        return paths
+
+    page = browser.new_page(
+        viewport={"width": width, "height": height}, device_scale_factor=missing[0][4]
+    )
+    session = None
+    try:
+        _load_html(page, html, base_dir, ready)
+        for index, (_, path, _, _, scale, key) in enumerate(missing):
+            if index:
+                # The override only lives as long as the session that set it
+                session = session or page.context.new_cdp_session(page)
+                session.send("Emulation.setDeviceMetricsOverride", {
+                    "width": width,
+                    "height": height,
+                    "deviceScaleFactor": scale,
+                    "mobile": False,
+                })
+            data = _capture(page, image_format, path)
+            if cache is not None:
+                cache.put(key, data)
+    finally:
+        if session is not None:
+            session.detach()
+        page.close()
+    return paths
+
+
+def _render_sizes(
+    browser: Any,
+    html: str,
+    output_path: str,
+    sizes: Sequence[Tuple[int, int]],
+    cache: Optional[RenderCache] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    image_format: Optional[ImageFormat] = None,
+    scale: float = 1.0,
+) -> List[str]:
+    """
+    Render one responsive document at several viewport sizes from a single load.
+
+    Output paths get a -WIDTHxHEIGHT suffix (see _sized_path). The viewport
+    is resized between captures, so only relayout and paint are repeated.
+    """
+    image_format = image_format or _PNG
+    paths = [_sized_path(output_path, size) for size in sizes]
+    missing = _uncached_variants(
+        [(html, path, w, h, scale) for path, (w, h) in zip(paths, sizes)],
+        cache, image_format, base_dir,
+    )
+    if not missing:
+        return paths
+
+    _, _, width, height, _, _ = missing[0]
+    page = browser.new_page(
+        viewport={"width": width, "height": height}, device_scale_factor=scale
+    )
+    try:
+        _load_html(page, html, base_dir, ready)
+        for index, (_, path, width, height, _, key) in enumerate(missing):
+            if index:
+                page.set_viewport_size({"width": width, "height": height})
+            data = _capture(page, image_format, path)
+            if cache is not None:
+                cache.put(key, data)
+    finally:
+        page.close()
+    return paths
+
+
+def _render_atlas(
+    browser: Any,
+    htmls: Sequence[str],
+    output_paths: Sequence[str],
+    width: int,
+    height: int,
+    cache: Optional[RenderCache] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    image_format: Optional[ImageFormat] = None,
+    scale: float = 1.0,
+) -> List[str]:
+    """
+    Render many same-sized documents as tiles of a single page.
+
+    Each document gets its own srcdoc iframe, so styles stay isolated, and
+    each tile is captured with a clipped screenshot. Page creation, load and
+    settle are paid once per atlas instead of once per graphic.
+    """
+    image_format = image_format or _PNG
+    missing = _uncached_variants(
+        [(html, path, width, height, scale) for html, path in zip(htmls, output_paths)],
+        cache, image_format, base_dir,
+    )
+    if not missing:
+        return list(output_paths)
+
+    tile_htmls = [html for html, *_ in missing]
+    clips, atlas_width, atlas_height = _atlas_layout(len(missing), width, height)
+    # Clipped screenshots are limited to the viewport, so it spans the atlas
+    page = browser.new_page(
+        viewport={"width": atlas_width, "height": atlas_height}, device_scale_factor=scale
+    )
+    try:
+        _load_html(page, _atlas_html(tile_htmls, clips), base_dir, "none")
+        _wait_frames_ready(page, tile_htmls, ready)
+        for (_, path, _, _, _, key), clip in zip(missing, clips):
+            data = _capture(page, image_format, path, clip)
+            if cache is not None:
+                cache.put(key, data)
+    finally:
+        page.close()
+    return list(output_paths)
+
+
+def _render_slides(
+    browser: Any,
+    html: str,
+    output_paths: Sequence[str],
+    width: int,
+    height: int,
+    cache: Optional[RenderCache] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    image_format: Optional[ImageFormat] = None,
+    scale: float = 1.0,
+) -> List[str]:
+    """
+    Capture every slide of a carousel document from a single page load.
+
+    Slides are stacked vertically at width x height (see
+    GraphicsBuilder.build_carousel); each is captured with a clipped
+    screenshot and cached under the document plus its slide number.
+    """
+    image_format = image_format or _PNG
+    missing = []
+    for index, path in enumerate(output_paths):
+        key = data = None
+        if cache is not None:
+            tag = f"{image_format.cache_tag}:slide-{index + 1}"
+            key = cache.key(html, width, height, scale, tag, base_dir)
+            data = cache.get(key)
+        if data is None:
+            missing.append((index, path, key))
+        else:
+            _write_bytes(path, data)
+    if not missing:
+        return list(output_paths)
+
+    # Clipped screenshots are limited to the viewport, so it spans every slide
+    page = browser.new_page(
+        viewport={"width": width, "height": height * len(output_paths)},
+        device_scale_factor=scale,
+    )
+    try:
+        _load_html(page, html, base_dir, ready)
+        for index, path, key in missing:
+            clip = {"x": 0, "y": index * height, "width": width, "height": height}
+            data = _capture(page, image_format, path, clip)
+            if cache is not None:
+                cache.put(key, data)
+    finally:
+        page.close()
+    return list(output_paths)
+
+
+def _pages_html(htmls: Sequence[str], width: int, height: int) -> str:
+    """One printable document with each graphic isolated in a page-sized iframe."""
+    frames = "".join(
+        f'<iframe srcdoc="{html_escape(html, quote=True)}"></iframe>' for html in htmls
+    )
+    return (
+        "<!DOCTYPE html><html><head><style>"
+        f"@page {{ size: {width}px {height}px; margin: 0; }}"
+        "html, body { margin: 0; padding: 0; }"
+        f"iframe {{ display: block; border: 0; width: {width}px; height: {height}px; }}"
+        "iframe + iframe { break-before: page; }"
+        f"</style></head><body>{frames}</body></html>"
+    )
+
+
+def _pdf_source(
+    html: Union[str, Sequence[str]],
+    width: int,
+    height: int,
+    pages: int = 1,
+) -> Tuple[str, int, Optional[List[str]]]:
+    """Resolve PDF input to (document, page count, framed documents or None)."""
+    if isinstance(html, str):
+        return html, pages, None
+    htmls = list(html)
+    return _pages_html(htmls, width, height), len(htmls), htmls
+
+
+def _render_pdf(
+    browser: Any,
+    html: Union[str, Sequence[str]],
+    width: int,
+    height: int,
+    output_path: Optional[str] = None,
+    cache: Optional[RenderCache] = None,
+    base_dir: Optional[str] = None,
+    ready: ReadyStrategy = "auto",
+    pages: int = 1,
+) -> bytes:
+    """
+    Print to a vector PDF with width x height CSS-pixel pages.
+
+    html is one document printed to its first pages pages (a graphic is
+    one page, a carousel one per slide), or a sequence of documents printed
+    one per page. Chromium embeds the fonts used as subsets.
+    """
+    html, pages, htmls = _pdf_source(html, width, height, pages)
+
+    key = None
+    if cache is not None:
+        key = cache.key(html, width, height, format=f"pdf:{pages}", base_dir=base_dir)
+        pdf_bytes = cache.get(key)
+        if pdf_bytes is not None:
+            if output_path:
+                _write_bytes(output_path, pdf_bytes)
+            return pdf_bytes
+
+    page = browser.new_page(viewport={"width": width, "height": height})
+    try:
+        if htmls is not None:
+            _load_html(page, html, base_dir, "none")
+            _wait_frames_ready(page, htmls, ready)
+        else:
+            _load_html(page, html, base_dir, ready)
+        # page_ranges drops a trailing blank page left by sub-pixel overflow
+        pdf_bytes = page.pdf(
+            path=output_path, width=f"{width}px", height=f"{height}px",
+            print_background=True, page_ranges=f"1-{pages}",
+        )
+    finally:
+        page.close()
+
+    if cache is not None:
+        cache.put(key, pdf_bytes)
+    return pdf_bytes
+
+
+class _RenderPool:
+    """
+    Fixed set of render workers, each owning its own browser.
+
+    The sync Playwright API is bound to the thread that started it, so every
+    worker thread runs its own Playwright instance and Chromium process and
+    renders one page at a time. Tasks are pulled from a shared queue, so
+    faster workers pick up more items.
+
+    Browsers are relaunched when they crash, after ``max_pages`` renders, and
+    after restart() is called, always between tasks so no render is dropped.
+
+    ``last_error`` holds the most recent launch or render error and
+    ``failing`` whether the most recent attempt of either kind failed.
+    """
+
+    def __init__(self, size: int, max_pages: Optional[int] = None):
+        self.size = size
+        self.max_pages = max_pages
+        self.stats = {"rendered": 0, "failed": 0, "launches": 0, "launch_failures": 0}
+        self.last_error: Optional[str] = None
+        self.failing = False
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._tasks: queue.Queue = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"openfigma-render-{i}", daemon=True)
+            for i in range(size)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue ``fn(browser, *args)`` on the next free worker."""
+        future: Future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def restart(self) -> None:
+        """Recycle every browser as soon as its current task finishes."""
+        with self._lock:
+            self._generation += 1
+
+    def alive(self) -> int:
+        """Number of worker threads still running."""
+        return sum(thread.is_alive() for thread in self._threads)
+
+    def close(self) -> None:
+        """Stop all workers after the queued tasks have run."""
+        for _ in self._threads:
+            self._tasks.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _count(self, key: str, error: Optional[Exception] = None) -> None:
+        """Bump a counter and record whether the attempt it counts failed."""
+        with self._lock:
+            self.stats[key] += 1
+            self.failing = error is not None
+            if error is not None:
+                self.last_error = f"{type(error).__name__}: {error}"
+
+    def _start(self) -> Any:
+        """Start this worker thread's Playwright driver."""
+        from playwright.sync_api import sync_playwright
+        return sync_playwright().start()
+
+    def _launch(self, playwright: Any) -> Any:
+        return playwright.chromium.launch()
+
+    def _run(self) -> None:
+        playwright = None
+        browser = None
+        start_error: Optional[Exception] = None
+        pages = 0
+        generation = self._generation
+
+        try:
+            playwright = self._start()
+        except Exception as e:
+            start_error = e
+            self._count("launch_failures", e)
+        else:
+            # Launch eagerly so the browser is warm for the first task;
+            # a failed launch is retried when a task arrives
+            try:
+                browser = self._launch(playwright)
+                self._count("launches")
+            except Exception as e:
+                browser = None
+                self._count("launch_failures", e)
+
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    break
+
+                future, fn, args = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if start_error is not None:
+                    self._count("failed", start_error)
+                    future.set_exception(start_error)
+                    continue
+
+                try:
+                    stale = (
+                        browser is None
+                        or not browser.is_connected()
+                        or generation != self._generation
+                        or (self.max_pages is not None and pages >= self.max_pages)
+                    )
+                    if stale:
+                        _drop_warm_pages(browser)
+                        if browser is not None and browser.is_connected():
+                            browser.close()
+                        browser = None
+                        generation = self._generation
+                        try:
+                            browser = self._launch(playwright)
+                        except Exception as e:
+                            self._count("launch_failures", e)
+                            raise
+                        pages = 0
+                        self._count("launches")
+
+                    pages += 1
+                    result = fn(browser, *args)
+                except Exception as e:
+                    self._count("failed", e)
+                    future.set_exception(e)
+                else:
+                    self._count("rendered")
+                    future.set_result(result)
+        finally:
+            _drop_warm_pages(browser)
+            if browser is not None and browser.is_connected():
+                browser.close()
+            if playwright:
+                playwright.stop()
+
+
 class PNGExporter:
-    """Batch PNG exporter with browser reuse for performance."""
+    """
+    Batch PNG exporter with browser reuse for performance.
 
-    def __init__(self):
+    Args:
+        workers: Number of concurrent render workers. Each worker runs its
+                 own Chromium process, so throughput scales with available
+                 cores up to this count; with more than one, single exports
+                 also run on the workers (default 1).
+        cache: Optional RenderCache; cached renders skip the browser
+        base_dir: Load documents from files in this directory so relative
+                  file:// assets resolve (default: in memory)
+        ready: Readiness strategy before each screenshot (default "auto")
+        format: "png" (default), "jpeg", "webp" or an ImageFormat
+        quality: JPEG/WebP quality 0-100 (see ImageFormat)
+        scale: Device scale factor for every render (default 1)
+        reuse_page: Keep a warm page per browser and swap each document's
+                    content into it instead of opening a fresh page. Much
+                    faster for runs of similar graphics; scripts in the
+                    documents do not run, so use it for static HTML such as
+                    GraphicsBuilder output (default False)
+        native: Draw config items within the raster subset (see
+                openfigma.raster) with Pillow instead of Chromium; other
+                items, and export_scales/export_sizes runs, still render in
+                the browser. Native renders bypass the cache (default False)
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        cache: Optional[RenderCache] = None,
+        base_dir: Optional[str] = None,
+        ready: ReadyStrategy = "auto",
+        format: ImageFormatLike = "png",
+        quality: Optional[int] = None,
+        scale: float = 1.0,
+        reuse_page: bool = False,
+        native: bool = False,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        _check_scale(scale)
+        if native:
+            from .raster import RasterRenderer
+            self._raster = RasterRenderer()
+        else:
+            self._raster = None
+        self.workers = workers
+        self.cache = cache
+        self.base_dir = base_dir
+        self.ready = ready
+        self.image_format = _image_format(format, quality)
+        self.scale = scale
+        self.reuse_page = reuse_page
         self._playwright = None
         self._browser = None
+        self._pool: Optional[_RenderPool] = None
 
     def __enter__(self):
+        if self.workers > 1:
+            # Every render runs on the pool, so no browser of our own
+            self._pool = _RenderPool(self.workers)
+            return self
         from playwright.sync_api import sync_playwright
         self._playwright = sync_playwright().start()
         self._browser = self._playwright.chromium.launch()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._pool:
+            self._pool.close()
+            self._pool = None
         if self._browser:
+            _drop_warm_pages(self._browser)
             self._browser.close()
+            self._browser = None
         if self._playwright:
             self._playwright.stop()
+            self._playwright = None
 
     def export(
         self,
@@ -118,59 +1282,764 @@ class PNGExporter:
         height: int = 1080,
     ) -> str:
         """Export single HTML to PNG."""
-        if not self._browser:
-            raise RuntimeError("PNGExporter must be used as context manager")
+        self._check_open()
 
-        page = self._browser.new_page(viewport={"width": width, "height": height})
+        return self._call(
+            _render_to_file, html, output_path, width, height, *self._options(),
+        )
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html)
-            temp_path = f.name
+    def export_scales(
+        self,
+        html: str,
+        output_path: str,
+        width: int = 1920,
+        height: int = 1080,
+        scales: Sequence[float] = (1, 2, 3),
+    ) -> List[str]:
+        """
+        Export one graphic at several device scales from a single page load.
 
-        try:
-            page.goto(f"file://{temp_path}")
-            page.wait_for_load_state("networkidle")
-            page.screenshot(path=output_path, type="png")
-        finally:
-            os.unlink(temp_path)
-            page.close()
+        Files are named after output_path with the @2x convention:
+        post.png, post@2x.png, post@3x.png.
+
+        Returns:
+            Saved file paths, one per scale
+        """
+        self._check_open()
+        for scale in scales:
+            _check_scale(scale)
+
+        return self._call(
+            _render_scales, html, output_path, width, height, scales,
+            self.cache, self.base_dir, self.ready, self.image_format,
+        )
+
+    def export_sizes(
+        self,
+        html: str,
+        output_path: str,
+        sizes: Sequence[Tuple[int, int]],
+    ) -> List[str]:
+        """
+        Export one graphic at several canvas sizes from a single page load.
+
+        html must size its canvas to the viewport, e.g. built with
+        build_from_config(config, dimensions=None). Files are named after
+        output_path with a size suffix: post-1080x1080.png, post-1200x627.png.
+
+        Returns:
+            Saved file paths, one per size
+        """
+        self._check_open()
+
+        return self._call(
+            _render_sizes, html, output_path, sizes,
+            self.cache, self.base_dir, self.ready, self.image_format, self.scale,
+        )
+
+    def export_atlas(
+        self,
+        items: list,
+        output_dir: str,
+        dimensions: tuple = (1920, 1080),
+        tiles_per_page: int = 16,
+        return_exceptions: bool = False,
+    ) -> list:
+        """
+        Export many same-sized graphics, several per page load.
+
+        Items are grouped into atlases of up to tiles_per_page graphics. Each
+        graphic is isolated in its own iframe and captured with a clipped
+        screenshot, so the page setup cost is shared across the atlas. Best
+        for large batches of small graphics; with ``workers > 1`` atlases
+        render concurrently.
+
+        Args:
+            items: List of (name, html) tuples or (name, config) tuples
+            output_dir: Directory to save image files
+            dimensions: (width, height) tuple shared by every item
+            tiles_per_page: Maximum graphics per atlas page (default 16)
+            return_exceptions: If True, failures are returned in place of
+                               paths instead of raising; a render failure
+                               applies to every item of its atlas
+
+        Returns:
+            List of saved file paths (or exceptions), in input order
+        """
+        self._check_open()
+        if tiles_per_page < 1:
+            raise ValueError("tiles_per_page must be at least 1")
+
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        width, height = dimensions
+
+        results: list = []
+        tiles: List[Tuple[int, str, str]] = []
+        for name, content in items:
+            output_path = os.path.join(output_dir, f"{name}{self.image_format.extension}")
+            try:
+                html = _item_html(content, dimensions)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+                continue
+            tiles.append((len(results), html, output_path))
+            results.append(None)
+
+        atlases = [tiles[i:i + tiles_per_page] for i in range(0, len(tiles), tiles_per_page)]
+        options = (self.cache, self.base_dir, self.ready, self.image_format, self.scale)
+
+        def job(atlas: List[Tuple[int, str, str]]) -> tuple:
+            htmls = [html for _, html, _ in atlas]
+            paths = [path for _, _, path in atlas]
+            return (_render_atlas, htmls, paths, width, height, *options)
+
+        outcomes = self._run_jobs([job(atlas) for atlas in atlases], return_exceptions)
+        for atlas, outcome in zip(atlases, outcomes):
+            for position, (index, _, _) in enumerate(atlas):
+                results[index] = outcome if isinstance(outcome, Exception) else outcome[position]
+        return results
+
+    def export_carousel(
+        self,
+        carousel: Any,
+        output_dir: str,
+        name: str = "slide",
+    ) -> List[str]:
+        """
+        Export every slide of a Carousel from a single page load.
+
+        Files are named {name}-1.png, {name}-2.png, ... in output_dir.
+
+        Returns:
+            Saved file paths, one per slide
+        """
+        self._check_open()
+
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        width, height = carousel.dimensions
+        output_paths = [
+            os.path.join(output_dir, f"{name}-{index}{self.image_format.extension}")
+            for index in range(1, len(carousel) + 1)
+        ]
+        return self._call(
+            _render_slides, carousel.to_html(), output_paths, width, height,
+            self.cache, self.base_dir, self.ready, self.image_format, self.scale,
+        )
+
+    def export_carousel_pdf(self, carousel: Any, output_path: str) -> str:
+        """Export a Carousel as one vector PDF with a page per slide."""
+        self._check_open()
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        width, height = carousel.dimensions
+        self._call(
+            _render_pdf, carousel.to_html(), width, height, output_path,
+            self.cache, self.base_dir, self.ready, len(carousel),
+        )
+        return output_path
+
+    def export_pdf(
+        self,
+        html: Union[str, Sequence[str]],
+        output_path: str,
+        width: int = 1920,
+        height: int = 1080,
+    ) -> str:
+        """
+        Export HTML to a vector PDF sized exactly to the graphic.
+
+        A sequence of HTML strings produces one multi-page PDF with a
+        graphic per page (see html_to_pdf).
+        """
+        self._check_open()
 
+        self._call(
+            _render_pdf, html, width, height, output_path,
+            self.cache, self.base_dir, self.ready,
+        )
         return output_path
 
+    def export_pdf_batch(
+        self,
+        items: list,
+        output_dir: str,
+        dimensions: tuple = (1920, 1080),
+        return_exceptions: bool = False,
+    ) -> list:
+        """
+        Export multiple graphics to one vector PDF each.
+
+        Like export_batch: items are (name, html) or (name, config) tuples,
+        files are saved as {name}.pdf, and with ``workers > 1`` they render
+        concurrently.
+
+        Returns:
+            List of saved file paths (or exceptions), in input order
+        """
+        self._check_open()
+
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        width, height = dimensions
+
+        results: list = []
+        jobs = []
+        for name, content in items:
+            try:
+                html = _item_html(content, dimensions)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+                continue
+            output_path = os.path.join(output_dir, f"{name}.pdf")
+            jobs.append((len(results), output_path, (
+                _render_pdf, html, width, height, output_path,
+                self.cache, self.base_dir, self.ready,
+            )))
+            results.append(None)
+
+        outcomes = self._run_jobs([job for _, _, job in jobs], return_exceptions)
+        for (index, output_path, _), outcome in zip(jobs, outcomes):
+            results[index] = outcome if isinstance(outcome, Exception) else output_path
+        return results
+
+    def export_bytes(
+        self,
+        html: str,
+        width: int = 1920,
+        height: int = 1080,
+        as_memoryview: bool = False,
+    ) -> Union[bytes, memoryview]:
+        """
+        Render HTML and return the image buffer without writing a file.
+
+        With as_memoryview, the buffer is wrapped in a memoryview so it can
+        be sliced or handed to upload APIs without copying.
+        """
+        self._check_open()
+
+        png_bytes = self._call(_render_bytes, html, width, height, *self._options())
+        return memoryview(png_bytes) if as_memoryview else png_bytes
+
     def export_batch(
         self,
         items: list,
         output_dir: str,
         dimensions: tuple = (1920, 1080),
+        return_exceptions: bool = False,
+        scales: Optional[Sequence[float]] = None,
+        sizes: Optional[Sequence[Tuple[int, int]]] = None,
     ) -> list:
         """
         Export multiple graphics to PNG.
 
+        With ``workers > 1`` items are rendered concurrently; results are
+        always returned in input order.
+
         Args:
             items: List of (name, html) tuples or (name, config) tuples
-            output_dir: Directory to save PNG files
+            output_dir: Directory to save image files
             dimensions: (width, height) tuple
+            return_exceptions: If True, a failing item does not abort the
+                               batch; its exception is returned in place of
+                               its path (like ``asyncio.gather``)
+            scales: Render every item at each of these device scales from
+                    one page load (see export_scales)
+            sizes: Render every item at each of these (width, height) sizes
+                   from one page load (see export_sizes); config items are
+                   built with responsive CSS and dimensions is ignored
 
         Returns:
-            List of saved file paths
+            List of saved file paths (or exceptions, see return_exceptions);
+            with scales or sizes, each entry is a list of paths
         """
-        from .components import GraphicsBuilder
+        self._check_open()
+        if scales and sizes:
+            raise ValueError("Pass either scales or sizes, not both")
+        for scale in scales or ():
+            _check_scale(scale)
 
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        saved_paths = []
+        width, height = dimensions
 
+        jobs = []
         for item in items:
             name, content = item
+            output_path = os.path.join(output_dir, f"{name}{self.image_format.extension}")
+
+            try:
+                if not scales and not sizes and self._native(content):
+                    jobs.append(self._native_job(content, dimensions, output_path))
+                    continue
+                html = _item_html(content, None if sizes else dimensions)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                jobs.append(e)
+                continue
+
+            jobs.append((html, output_path))
+
+        if self._pool is None:
+            return [
+                self._export_job(job, width, height, return_exceptions, scales, sizes)
+                for job in jobs
+            ]
 
-            # If content is a dict, build HTML from config
-            if isinstance(content, dict):
-                builder = GraphicsBuilder()
-                html = builder.build_from_config(content, dimensions=dimensions)
-            else:
-                html = content
+        futures = [
+            job if isinstance(job, Exception)
+            else self._submit_job(job, width, height, scales, sizes)
+            for job in jobs
+        ]
 
-            output_path = os.path.join(output_dir, f"{name}.png")
-            self.export(html, output_path, width=dimensions[0], height=dimensions[1])
-            saved_paths.append(output_path)
+        results = []
+        for future in futures:
+            if isinstance(future, Exception):
+                results.append(future)
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    for pending in futures:
+                        if isinstance(pending, Future):
+                            pending.cancel()
+                    raise
+                results.append(e)
 
-        return saved_paths
+        return results
+
+    def export_stream(
+        self,
+        items: Iterable[Tuple[str, Union[str, dict]]],
+        output_dir: str,
+        dimensions: tuple = (1920, 1080),
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Tuple[str, Union[str, Exception]]]:
+        """
+        Export an arbitrarily long stream of graphics with flat memory use.
+
+        items is consumed lazily: each item is built to HTML just before it
+        is queued, and at most max_in_flight items are pending at once, so
+        the first PNGs land on disk while later configs are still unread.
+
+        Args:
+            items: Iterable of (name, html) or (name, config) tuples
+            output_dir: Directory to save image files
+            dimensions: (width, height) tuple
+            max_in_flight: Items built or rendering at once
+                           (None: 2 per worker)
+
+        Yields:
+            (name, path) tuples in input order; a failed item yields
+            (name, exception) instead of aborting the stream
+
+        Raises:
+            ValueError: If max_in_flight is below 1, before any item is read
+        """
+        self._check_open()
+        max_in_flight = self._max_in_flight(max_in_flight)
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        return self._stream(items, dimensions, max_in_flight, output_dir)
+
+    def iter_bytes(
+        self,
+        items: Iterable[Tuple[str, Union[str, dict]]],
+        dimensions: tuple = (1920, 1080),
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Tuple[str, Union[bytes, Exception]]]:
+        """
+        Like export_stream, but yield (name, png_bytes) instead of writing files.
+
+        Suited to uploading straight to object storage: nothing touches disk
+        unless the cache has a disk tier.
+        """
+        self._check_open()
+        return self._stream(items, dimensions, self._max_in_flight(max_in_flight))
+
+    def _max_in_flight(self, max_in_flight: Optional[int]) -> int:
+        """Resolve max_in_flight up front, as _stream only runs once iterated."""
+        if max_in_flight is None:
+            return self.workers * 2
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        return max_in_flight
+
+    def _stream(
+        self,
+        items: Iterable[Tuple[str, Union[str, dict]]],
+        dimensions: tuple,
+        max_in_flight: int,
+        output_dir: Optional[str] = None,
+    ) -> Iterator[Tuple[str, Any]]:
+        """Shared export_stream/iter_bytes pipeline; output_dir None yields bytes."""
+        width, height = dimensions
+
+        def job(name: str, content: Union[str, dict]) -> tuple:
+            output_path = None
+            if output_dir is not None:
+                output_path = os.path.join(output_dir, f"{name}{self.image_format.extension}")
+            if self._native(content):
+                return self._native_job(content, dimensions, output_path)
+            html = _item_html(content, dimensions)
+            options = self._options()
+            if output_path is None:
+                return (_render_bytes, html, width, height, *options)
+            return (_render_to_file, html, output_path, width, height, *options)
+
+        if self._pool is None:
+            for name, content in items:
+                try:
+                    fn, *args = job(name, content)
+                    yield name, fn(self._browser, *args)
+                except Exception as e:
+                    yield name, e
+            return
+
+        pending: deque = deque()
+        try:
+            for name, content in items:
+                try:
+                    pending.append((name, self._pool.submit(*job(name, content))))
+                except Exception as e:
+                    pending.append((name, e))
+                # Backpressure: wait for the oldest item before reading more
+                while len(pending) >= max_in_flight:
+                    yield _stream_result(*pending.popleft())
+            while pending:
+                yield _stream_result(*pending.popleft())
+        finally:
+            for _, future in pending:
+                if isinstance(future, Future):
+                    future.cancel()
+
+    def _run_jobs(self, jobs: List[tuple], return_exceptions: bool) -> list:
+        """
+        Run (fn, *args) jobs as fn(browser, *args), on the pool when
+        ``workers > 1``, and return their results in order.
+        """
+        if self._pool is None:
+            outcomes = []
+            for fn, *args in jobs:
+                try:
+                    outcomes.append(fn(self._browser, *args))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    outcomes.append(e)
+            return outcomes
+
+        futures = [self._pool.submit(*job) for job in jobs]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                outcomes.append(e)
+        return outcomes
+
+    def _check_open(self) -> None:
+        if self._browser is None and self._pool is None:
+            raise RuntimeError("PNGExporter must be used as context manager")
+
+    def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run one render as fn(browser, *args): on the pool when there is one,
+        so ``workers > 1`` never launches a browser beyond the pool's.
+        """
+        if self._pool is not None:
+            return self._pool.submit(fn, *args).result()
+        return fn(self._browser, *args)
+
+    def _native(self, content: Union[str, dict]) -> bool:
+        """Whether an item takes the raster fast path instead of Chromium."""
+        return (
+            self._raster is not None and isinstance(content, dict)
+            and not self._raster.unsupported(content)
+        )
+
+    def _native_job(self, config: dict, dimensions: tuple, output_path: Optional[str]) -> tuple:
+        """A (fn, *args) job drawing config with the raster renderer."""
+        return (
+            _render_native, self._raster, config, dimensions, output_path,
+            self.image_format, self.scale,
+        )
+
+    def _options(self) -> tuple:
+        """Trailing render arguments shared by _render_to_file and _render_bytes."""
+        return (
+            self.cache, self.base_dir, self.ready, self.image_format, self.scale, self.reuse_page,
+        )
+
+    def _submit_job(
+        self,
+        job: tuple,
+        width: int,
+        height: int,
+        scales: Optional[Sequence[float]] = None,
+        sizes: Optional[Sequence[Tuple[int, int]]] = None,
+    ) -> Future:
+        """Queue one batch job on the render pool."""
+        if callable(job[0]):
+            return self._pool.submit(*job)
+        html, output_path = job
+        options = (self.cache, self.base_dir, self.ready, self.image_format)
+        if scales:
+            return self._pool.submit(
+                _render_scales, html, output_path, width, height, scales, *options
+            )
+        if sizes:
+            return self._pool.submit(_render_sizes, html, output_path, sizes, *options, self.scale)
+        return self._pool.submit(
+            _render_to_file, html, output_path, width, height, *self._options()
+        )
+
+    def _export_job(
+        self,
+        job: Any,
+        width: int,
+        height: int,
+        return_exceptions: bool,
+        scales: Optional[Sequence[float]] = None,
+        sizes: Optional[Sequence[Tuple[int, int]]] = None,
+    ) -> Any:
+        """Render one batch job on the exporter's own browser."""
+        if isinstance(job, Exception):
+            return job
+        try:
+            if callable(job[0]):
+                fn, *args = job
+                return fn(self._browser, *args)
+            if scales:
+                return self.export_scales(job[0], job[1], width, height, scales)
+            if sizes:
+                return self.export_sizes(job[0], job[1], sizes)
+            return self.export(job[0], job[1], width=width, height=height)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            return e
+
+
+def _render_native(
+    browser: Any,
+    renderer: Any,
+    config: dict,
+    dimensions: tuple,
+    output_path: Optional[str],
+    image_format: ImageFormat,
+    scale: float,
+) -> Union[str, bytes]:
+    """Render-pool job for the raster fast path; the browser goes unused."""
+    data = renderer.render(config, dimensions, None, output_path, image_format, scale=scale)
+    return data if output_path is None else output_path
+
+
+def _stream_result(name: str, job: Union[Future, Exception]) -> Tuple[str, Any]:
+    """Resolve an export_stream entry to (name, path or exception)."""
+    if isinstance(job, Exception):
+        return name, job
+    try:
+        return name, job.result()
+    except Exception as e:
+        return name, e
+
+
+class AsyncPNGExporter:
+    """
+    Asyncio PNG exporter built on ``playwright.async_api``.
+
+    Renders never block the event loop, so a single process can keep many
+    requests in flight. Concurrency is bounded by a semaphore over open pages.
+
+    Args:
+        concurrency: Maximum number of pages rendering at once (default 8)
+        browsers: Number of Chromium processes pages are spread across (default 1)
+        cache: Optional RenderCache; cached renders skip the browser
+        base_dir: Load documents from files in this directory so relative
+                  file:// assets resolve (default: in memory)
+        ready: Readiness strategy before each screenshot (default "auto")
+        format: "png" (default), "jpeg", "webp" or an ImageFormat
+        quality: JPEG/WebP quality 0-100 (see ImageFormat)
+        scale: Device scale factor for every render (default 1)
+
+    Usage:
+        async with AsyncPNGExporter(concurrency=16) as exporter:
+            await exporter.export(html, "out.png", width=1080, height=1080)
+            async for name, result in exporter.iter_batch(items, "exports/"):
+                ...
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 8,
+        browsers: int = 1,
+        cache: Optional[RenderCache] = None,
+        base_dir: Optional[str] = None,
+        ready: ReadyStrategy = "auto",
+        format: ImageFormatLike = "png",
+        quality: Optional[int] = None,
+        scale: float = 1.0,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if browsers < 1:
+            raise ValueError("browsers must be at least 1")
+        _check_scale(scale)
+        self.concurrency = concurrency
+        self.browsers = browsers
+        self.cache = cache
+        self.base_dir = base_dir
+        self.ready = ready
+        self.image_format = _image_format(format, quality)
+        self.scale = scale
+        self._playwright = None
+        self._browsers: list = []
+        self._next_browser = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            raise ImportError(_PLAYWRIGHT_MISSING)
+
+        self._playwright = await async_playwright().start()
+        try:
+            for _ in range(self.browsers):
+                self._browsers.append(await self._playwright.chromium.launch())
+        except Exception:
+            await self.__aexit__(None, None, None)
+            raise
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        for browser in self._browsers:
+            await browser.close()
+        self._browsers = []
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def _pick_browser(self) -> Any:
+        """Round-robin pages across the launched browsers."""
+        browser = self._browsers[self._next_browser % len(self._browsers)]
+        self._next_browser += 1
+        return browser
+
+    async def export(
+        self,
+        html: str,
+        output_path: str,
+        width: int = 1920,
+        height: int = 1080,
+    ) -> str:
+        """Export single HTML to PNG."""
+        if not self._browsers:
+            raise RuntimeError("AsyncPNGExporter must be used as async context manager")
+
+        if self.cache is not None:
+            key = self.cache.key(
+                html, width, height, self.scale, self.image_format.cache_tag, self.base_dir
+            )
+            png_bytes = self.cache.get(key)
+            if png_bytes is not None:
+                _write_bytes(output_path, png_bytes)
+                return output_path
+
+        async with self._semaphore:
+            page = await self._pick_browser().new_page(
+                viewport={"width": width, "height": height}, device_scale_factor=self.scale
+            )
+
+            try:
+                await _load_html_async(page, html, self.base_dir, self.ready)
+                png_bytes = await _capture_async(page, self.image_format, output_path)
+            finally:
+                await page.close()
+
+        if self.cache is not None:
+            self.cache.put(key, png_bytes)
+        return output_path
+
+    async def export_batch(
+        self,
+        items: list,
+        output_dir: str,
+        dimensions: tuple = (1920, 1080),
+        return_exceptions: bool = False,
+    ) -> list:
+        """
+        Export multiple graphics to PNG concurrently.
+
+        Args:
+            items: List of (name, html) tuples or (name, config) tuples
+            output_dir: Directory to save image files
+            dimensions: (width, height) tuple
+            return_exceptions: If True, a failing item does not abort the
+                               batch; its exception is returned in place of
+                               its path
+
+        Returns:
+            List of saved file paths in input order
+        """
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        tasks = [
+            asyncio.ensure_future(self._export_item(content, output_dir, name, dimensions))
+            for name, content in items
+        ]
+
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def iter_batch(
+        self,
+        items: list,
+        output_dir: str,
+        dimensions: tuple = (1920, 1080),
+    ) -> AsyncIterator[Tuple[str, Union[str, Exception]]]:
+        """
+        Export multiple graphics, yielding results as they complete.
+
+        Yields:
+            (name, path) tuples in completion order; a failed item yields
+            (name, exception) instead of aborting the batch
+        """
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+        async def run(name: str, content: Union[str, dict]) -> Tuple[str, Union[str, Exception]]:
+            try:
+                return name, await self._export_item(content, output_dir, name, dimensions)
+            except Exception as e:
+                return name, e
+
+        tasks = [asyncio.ensure_future(run(name, content)) for name, content in items]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _export_item(
+        self,
+        content: Union[str, dict],
+        output_dir: str,
+        name: str,
+        dimensions: tuple,
+    ) -> str:
+        """Build (if needed) and export one batch item."""
+        html = _item_html(content, dimensions)
+        output_path = os.path.join(output_dir, f"{name}{self.image_format.extension}")
+        return await self.export(html, output_path, width=dimensions[0], height=dimensions[1])
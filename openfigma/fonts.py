@@ -0,0 +1,167 @@
+"""
+Font Embedding - Offline @font-face rules for generated graphics.
+
+Font files found locally are embedded into the generated HTML as data URIs,
+so rendering never waits on a network fetch. Only the faces a document can
+use (its font families, weights and styles) are embedded. Fonts are looked
+up in:
+
+1. The font_dir passed to GraphicsBuilder
+2. The directory in the OPENFIGMA_FONT_DIR environment variable
+3. The fonts bundled with the package (openfigma/assets/fonts)
+
+Family, weight and style are derived from file names such as
+``Inter-SemiBold.woff2``, ``Inter-BoldItalic.ttf`` or ``InterVariable.woff2``.
+"""
+
+import base64
+import os
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple
+
+BUNDLED_FONT_DIR = os.path.join(os.path.dirname(__file__), "assets", "fonts")
+FONT_DIR_ENV = "OPENFIGMA_FONT_DIR"
+GOOGLE_FONTS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap"
+
+_FORMATS = {
+    ".woff2": ("woff2", "font/woff2"),
+    ".woff": ("woff", "font/woff"),
+    ".ttf": ("truetype", "font/ttf"),
+    ".otf": ("opentype", "font/otf"),
+}
+
+# Compound names first so "ExtraBold" doesn't match "Bold"
+_WEIGHTS = [
+    ("extralight", "200"), ("ultralight", "200"),
+    ("semibold", "600"), ("demibold", "600"),
+    ("extrabold", "800"), ("ultrabold", "800"),
+    ("thin", "100"), ("light", "300"), ("regular", "400"), ("medium", "500"),
+    ("bold", "700"), ("black", "900"), ("heavy", "900"),
+]
+
+
+def font_files(font_dir: str) -> List[str]:
+    """Sorted font file names in a directory (empty if it doesn't exist)."""
+    if not os.path.isdir(font_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(font_dir)
+        if os.path.splitext(name)[1].lower() in _FORMATS
+    )
+
+
+def resolve_font_dir(font_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Find the directory to embed fonts from.
+
+    Raises:
+        ValueError: If an explicit font_dir contains no font files
+    """
+    if font_dir is not None:
+        if not font_files(font_dir):
+            raise ValueError(f"No font files (.woff2, .woff, .ttf, .otf) in {font_dir}")
+        return font_dir
+
+    for candidate in (os.environ.get(FONT_DIR_ENV), BUNDLED_FONT_DIR):
+        if candidate and font_files(candidate):
+            return candidate
+    return None
+
+
+def parse_font_name(filename: str) -> Tuple[str, str, str]:
+    """Derive (family, weight, style) from a font file name."""
+    stem = os.path.splitext(filename)[0]
+    family, _, variant = stem.partition("-")
+    variant = variant.lower()
+    style = "italic" if "italic" in variant or family.lower().endswith("italic") else "normal"
+
+    if "variable" in stem.lower():
+        family = re.sub(r"(?i)variable(font)?|italic", "", family) or family
+        return family, "100 900", style
+
+    weight = "400"
+    for name, value in _WEIGHTS:
+        if name in variant:
+            weight = value
+            break
+    return family, weight, style
+
+
+@lru_cache(maxsize=64)
+def font_face_css(
+    font_dir: str,
+    families: Optional[str] = None,
+    weights: Optional[FrozenSet[int]] = None,
+    styles: Optional[FrozenSet[str]] = None,
+) -> str:
+    """
+    @font-face rules embedding font_dir's files as data URIs.
+
+    families (a CSS font-family list), weights and styles limit the rules to
+    the faces a document can use; None keeps every file. A weight without
+    its own file keeps the nearest one, as the browser would pick it.
+
+    Rules are cached per process, so the directory is read once; call
+    clear_font_cache() after changing its files.
+    """
+    faces = _faces(font_dir)
+    if families is not None:
+        wanted = {_family_key(name) for name in families.split(",")}
+        faces = [face for face in faces if _family_key(face[1]) in wanted]
+    if styles is not None:
+        faces = [face for face in faces if face[3] in styles]
+    if weights is not None:
+        faces = [face for face in faces if face in _nearest_faces(faces, face, weights)]
+    return "\n".join(_face_rule(font_dir, *face) for face in faces)
+
+
+def clear_font_cache() -> None:
+    """Forget cached font directories and rules, e.g. after adding font files."""
+    font_face_css.cache_clear()
+    _faces.cache_clear()
+    _face_rule.cache_clear()
+
+
+def _family_key(name: str) -> str:
+    """Compare families case- and space-insensitively ("Open Sans" ~ "OpenSans")."""
+    return name.strip().strip("'\"").replace(" ", "").lower()
+
+
+def _weight_range(weight: str) -> Tuple[int, int]:
+    low, _, high = weight.partition(" ")
+    return int(low), int(high or low)
+
+
+@lru_cache(maxsize=8)
+def _faces(font_dir: str) -> Tuple[Tuple[str, str, str, str], ...]:
+    """(file name, family, weight, style) of each font file in font_dir."""
+    return tuple((name, *parse_font_name(name)) for name in font_files(font_dir))
+
+
+def _nearest_faces(faces: list, face: tuple, weights: FrozenSet[int]) -> List[tuple]:
+    """The faces of face's family and style that serve each of weights."""
+    group = [f for f in faces if f[1] == face[1] and f[3] == face[3]]
+    chosen = []
+    for weight in weights:
+        def distance(candidate: tuple) -> int:
+            low, high = _weight_range(candidate[2])
+            return max(low - weight, weight - high, 0)
+        chosen.append(min(group, key=distance))
+    return chosen
+
+
+@lru_cache(maxsize=64)
+def _face_rule(font_dir: str, name: str, family: str, weight: str, style: str) -> str:
+    """One @font-face rule; each file is read and encoded once per process."""
+    css_format, mime = _FORMATS[os.path.splitext(name)[1].lower()]
+    with open(os.path.join(font_dir, name), "rb") as f:
+        data = base64.b64encode(f.read()).decode("ascii")
+
+    return f"""    @font-face {{
+      font-family: '{family}';
+      font-weight: {weight};
+      font-style: {style};
+      font-display: block;
+      src: url(data:{mime};base64,{data}) format('{css_format}');
+    }}"""
@@ -0,0 +1,509 @@
+"""
+Layout Engine - Browser-free layout for shape-and-text components.
+
+Mirrors the CSS box model of a few simple components closely enough for
+previews: the canvas is the padded, vertically centered flex column of
+the HTML output, and each supported component lays out as fixed boxes.
+The result is a display list of rects, lines and text runs that a
+backend (see svg.py) draws in order.
+
+Text widths are estimated from average glyph advances, so fit-content
+boxes are approximate and long text does not wrap.
+
+Usage:
+    layout = layout_config(config, (1080, 1080), theme)
+    for shape in layout.shapes:
+        ...
+"""
+
+import re
+import warnings
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .components import Theme
+
+# Component types the layout engine can place, in registry order
+LAYOUT_COMPONENTS = ("badge", "metric_card", "event_poster", "bar_chart", "progress_bar")
+
+# Inter's vertical metrics (em units): the content area is ascent + descent,
+# which is also the height of a line with line-height: normal
+_ASCENT = 0.969
+_DESCENT = 0.242
+_NORMAL_LINE_HEIGHT = _ASCENT + _DESCENT
+
+# Average advance width (em) per glyph, by case and weight
+_ADVANCE = {"regular": 0.55, "bold": 0.6, "upper": 0.68}
+
+_GRADIENT_SIDES = {
+    "to top": 0.0, "to right": 90.0, "to bottom": 180.0, "to left": 270.0,
+    "to top right": 45.0, "to right top": 45.0, "to bottom right": 135.0,
+    "to right bottom": 135.0, "to bottom left": 225.0, "to left bottom": 225.0,
+    "to top left": 315.0, "to left top": 315.0,
+}
+
+
+@dataclass(frozen=True)
+class Gradient:
+    """A CSS linear-gradient: angle in CSS degrees (0 = to top) and evenly spaced colors."""
+    angle: float
+    colors: Tuple[str, ...]
+
+
+Paint = Union[str, Gradient]
+
+
+@dataclass(frozen=True)
+class Rect:
+    """
+    A filled box with rounded corners; stroke is an inner border like a
+    CSS border with box-sizing: border-box.
+    """
+    x: float
+    y: float
+    width: float
+    height: float
+    fill: Optional[Paint] = None
+    radius: float = 0.0
+    stroke: Optional[str] = None
+    stroke_width: float = 0.0
+
+
+@dataclass(frozen=True)
+class Line:
+    """A stroked line segment with round caps."""
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    stroke: str
+    width: float
+
+
+@dataclass(frozen=True)
+class TextRun:
+    """A run of text within a Text; dx is extra space before it."""
+    text: str
+    italic: bool = False
+    dx: float = 0.0
+
+
+@dataclass(frozen=True)
+class Text:
+    """
+    A single line of text. y is the baseline; anchor ("start", "middle"
+    or "end") aligns the whole line on x.
+    """
+    x: float
+    y: float
+    runs: Tuple[TextRun, ...]
+    size: float
+    weight: int
+    fill: Paint
+    anchor: str = "start"
+    letter_spacing: float = 0.0
+
+
+@dataclass(frozen=True)
+class Grid:
+    """The theme's background grid ("lines" or "dots") over the whole canvas."""
+    style: str
+    color: str
+    size: float
+    dot_size: float
+
+
+Shape = Union[Rect, Line, Text, Grid]
+
+
+@dataclass(frozen=True)
+class Layout:
+    """A laid out graphic: canvas size, background, font and shapes in paint order."""
+    width: int
+    height: int
+    background: Paint
+    font_family: str
+    shapes: Tuple[Shape, ...]
+
+
+def unsupported_components(config: Dict[str, Any]) -> List[str]:
+    """Component types in config the layout engine cannot place, in order of first use."""
+    unsupported: List[str] = []
+    for component in config.get("components", []):
+        comp_type = component.get("type")
+        if comp_type not in LAYOUT_COMPONENTS and comp_type not in unsupported:
+            unsupported.append(comp_type)
+    return unsupported
+
+
+def layout_config(
+    config: Dict[str, Any],
+    dimensions: tuple = (1920, 1080),
+    theme: Optional[Theme] = None,
+    unsupported: str = "raise",
+) -> Layout:
+    """
+    Lay out a build_from_config config without a browser.
+
+    Args:
+        config: Same structure as GraphicsBuilder.build_from_config
+        dimensions: Canvas (width, height)
+        theme: Base theme (default Theme()); config overrides apply on top
+        unsupported: Components outside LAYOUT_COMPONENTS either "raise"
+                     a ValueError naming them (default) or "warn" and are
+                     left out
+
+    Raises:
+        ValueError: If config uses unsupported components and
+                    unsupported="raise", or a length the layout needs
+                    is not in px (e.g. "4rem" or "5vw")
+    """
+    if unsupported not in ("raise", "warn"):
+        raise ValueError("unsupported must be 'raise' or 'warn'")
+    missing = unsupported_components(config)
+    if missing:
+        message = (
+            f"Cannot lay out component types {', '.join(map(repr, missing))} without a "
+            f"browser; supported types: {', '.join(LAYOUT_COMPONENTS)}"
+        )
+        if unsupported == "raise":
+            raise ValueError(message)
+        warnings.warn(message, stacklevel=2)
+
+    theme = theme or Theme()
+    overrides = config.get("theme")
+    if overrides:
+        theme = theme.with_overrides(overrides)
+
+    width, height = dimensions
+    blocks = [
+        _BLOCKS[component.get("type")](component.get("content", {}), theme)
+        for component in config.get("components", [])
+        if component.get("type") in _BLOCKS
+    ]
+
+    shapes: List[Shape] = []
+    if theme.grid_enabled:
+        shapes.append(Grid(
+            theme.grid_style, theme.grid_color,
+            _length(theme.grid_size), _length(theme.grid_dot_size),
+        ))
+    shapes.extend(_stack(blocks, width, height, theme))
+    return Layout(width, height, _paint(theme.background), theme.font_family, tuple(shapes))
+
+
+# ---------------------------------------------------------------------------
+# Canvas: body { display: flex; flex-direction: column; justify-content:
+# center; padding: padding_large; gap: gap_large }
+
+@dataclass
+class _Block:
+    """A component's box: content height, flex: 1, fit-content width and margin."""
+    height: float
+    draw: Callable[[float, float, float, float], List[Shape]]
+    grow: bool = False
+    width: Optional[float] = None
+    margin_bottom: float = 0.0
+
+
+def _stack(blocks: List[_Block], width: float, height: float, theme: Theme) -> List[Shape]:
+    """Place blocks down the canvas like the body's flex column and draw them."""
+    if not blocks:
+        return []
+    padding = _length(theme.padding_large)
+    gap = _length(theme.gap_large)
+    inner_width = width - 2 * padding
+    inner_height = height - 2 * padding
+
+    spacing = gap * (len(blocks) - 1) + sum(block.margin_bottom for block in blocks)
+    fixed = sum(block.height for block in blocks if not block.grow)
+    growing = sum(1 for block in blocks if block.grow)
+
+    # flex: 1 items have a zero basis and share the free space, but never
+    # shrink below their content height
+    share = (inner_height - spacing - fixed) / growing if growing else 0.0
+    heights = [max(block.height, share) if block.grow else block.height for block in blocks]
+
+    total = sum(heights) + spacing
+    # justify-content: center, overflowing equally at both ends like CSS
+    y = padding + (inner_height - total) / 2
+
+    shapes: List[Shape] = []
+    for block, block_height in zip(blocks, heights):
+        block_width = inner_width if block.width is None else block.width
+        shapes.extend(block.draw(padding, y, block_width, block_height))
+        y += block_height + block.margin_bottom + gap
+    return shapes
+
+
+# ---------------------------------------------------------------------------
+# Components, following their stylesheets in components.py and advanced.py
+
+def _badge(content: Dict[str, Any], t: Theme) -> _Block:
+    text = str(content.get("text", "")).upper()
+    icon = content.get("icon")
+    has_icon = icon in ("case-study", "process")
+    size, spacing = 13.0, 13.0 * 0.08
+    content_height = max(18.0, size * _NORMAL_LINE_HEIGHT) if has_icon else size * _NORMAL_LINE_HEIGHT
+    box_height = content_height + 28
+    icon_width = 18.0 + 10.0 if has_icon else 0.0
+    box_width = 56 + icon_width + _text_width(text, size, 700, spacing)
+
+    def draw(x: float, y: float, width: float, height: float) -> List[Shape]:
+        shapes: List[Shape] = [Rect(
+            x, y, width, height, t.surface, _length(t.radius_pill),
+            stroke=t.border, stroke_width=1.5,
+        )]
+        if has_icon:
+            shapes.extend(_badge_icon(icon, x + 28, y + (height - 18) / 2, t.accent))
+        shapes.append(Text(
+            x + 28 + icon_width, _baseline(y + height / 2, size), (TextRun(text),),
+            size, 700, t.accent, letter_spacing=spacing,
+        ))
+        return shapes
+
+    return _Block(box_height, draw, width=box_width, margin_bottom=_length(t.gap_small))
+
+
+def _badge_icon(icon: str, x: float, y: float, color: str) -> List[Shape]:
+    """The badge's 24-unit icons scaled to 18px."""
+    scale = 18 / 24
+    if icon == "case-study":
+        return [
+            Rect(x + left * scale, y + top * scale, 7 * scale, 7 * scale, color, 1 * scale)
+            for left, top in ((3, 3), (14, 3), (3, 14), (14, 14))
+        ]
+    return [
+        Line(x + 4 * scale, y + top * scale, x + right * scale, y + top * scale, color, 2 * scale)
+        for top, right in ((6, 20), (12, 20), (18, 14))
+    ]
+
+
+def _metric_card(content: Dict[str, Any], t: Theme) -> _Block:
+    value = str(content.get("value", ""))
+    label = str(content.get("label", ""))
+    change = content.get("change")
+    padding = _length(t.padding_large)
+    gap_medium, gap_small = _length(t.gap_medium), _length(t.gap_small)
+    label_height = 24 * _NORMAL_LINE_HEIGHT
+    change_height = 18 * _NORMAL_LINE_HEIGHT + 20 if change else 0.0
+    content_height = 140 + gap_medium + label_height + gap_small + change_height
+
+    def draw(x: float, y: float, width: float, height: float) -> List[Shape]:
+        center = x + width / 2
+        top = y + (height - content_height) / 2
+        shapes: List[Shape] = [
+            Rect(x, y, width, height, t.surface, _length(t.radius_large),
+                 stroke=t.border, stroke_width=1),
+            Text(center, _baseline(top + 70, 140, 1.0), (TextRun(value),), 140,
+                 _weight(t.font_headline), _paint(t.gradient_text), "middle", 140 * -0.05),
+        ]
+        top += 140 + gap_medium
+        shapes.append(Text(
+            center, _baseline(top + label_height / 2, 24), (TextRun(label),), 24, 600,
+            t.text_primary, "middle", 24 * 0.02,
+        ))
+        if change:
+            top += label_height + gap_small
+            pill_width = _text_width(str(change), 18, 600) + 40
+            shapes.append(Rect(
+                center - pill_width / 2, top, pill_width, change_height,
+                t.border_light, _length(t.radius_pill),
+            ))
+            shapes.append(Text(
+                center, _baseline(top + change_height / 2, 18), (TextRun(str(change)),), 18,
+                600, t.accent, "middle",
+            ))
+        return shapes
+
+    return _Block(content_height + 2 * padding + 2, draw, grow=True)
+
+
+def _event_poster(content: Dict[str, Any], t: Theme) -> _Block:
+    lines = [
+        (str(line.get("number", "")), str(line.get("text", "")), _length(line.get("size", "120px")))
+        for line in content.get("lines", [])
+    ]
+    anchor = {"center": "middle", "right": "end", "end": "end"}.get(content.get("align", "left"), "start")
+    weight = _weight(t.font_headline)
+
+    def draw(x: float, y: float, width: float, height: float) -> List[Shape]:
+        line_x = {"start": x, "middle": x + width / 2, "end": x + width}[anchor]
+        shapes: List[Shape] = []
+        for number, text, size in lines:
+            runs = (TextRun(number, italic=True), TextRun(text, dx=24))
+            shapes.append(Text(
+                line_x, _baseline(y + size / 2, size, 1.0), runs, size, weight,
+                t.text_primary, anchor, size * -0.04,
+            ))
+            y += size
+        return shapes
+
+    return _Block(sum(size for _, _, size in lines), draw)
+
+
+def _progress_bar(content: Dict[str, Any], t: Theme) -> _Block:
+    label = str(content.get("label", ""))
+    value = content.get("value", 0)
+    max_value = content.get("max_value", 100)
+    percentage = (value / max_value * 100) if max_value > 0 else 0
+    padding = _length(t.padding_small)
+    row_height = 20 * _NORMAL_LINE_HEIGHT
+
+    def draw(x: float, y: float, width: float, height: float) -> List[Shape]:
+        row_middle = y + padding + row_height / 2
+        track_y = y + padding + row_height + 12
+        radius = _length(t.radius_pill)
+        shapes: List[Shape] = [
+            Text(x, _baseline(row_middle, 20), (TextRun(label),), 20, 600, t.text_primary),
+            Rect(x, track_y, width, 16, t.border_light, radius),
+            Rect(x, track_y, width * min(max(percentage, 0), 100) / 100, 16,
+                 _paint(t.gradient_primary), radius),
+        ]
+        if content.get("show_percentage", True):
+            shapes.append(Text(
+                x + width, _baseline(row_middle, 18), (TextRun(f"{percentage:.0f}%"),), 18,
+                700, t.accent, "end",
+            ))
+        return shapes
+
+    return _Block(2 * padding + row_height + 12 + 16, draw)
+
+
+def _bar_chart(content: Dict[str, Any], t: Theme) -> _Block:
+    data = content.get("data", [])
+    max_value = content.get("max_value")
+    if not max_value:
+        max_value = max([d.get("value", 0) for d in data])
+    padding = _length(t.padding_large)
+    gap = _length(t.gap_medium)
+    radius = _length(t.radius_small)
+    label_height = 16 * _NORMAL_LINE_HEIGHT
+
+    def draw(x: float, y: float, width: float, height: float) -> List[Shape]:
+        shapes: List[Shape] = [Rect(
+            x, y, width, height, t.surface, _length(t.radius_large),
+            stroke=t.border, stroke_width=1,
+        )]
+        if not data:
+            return shapes
+        # Items are flex: 1 up to 120px wide, spaced around, bottom aligned
+        left = x + 1 + padding
+        inner_width = width - 2 * (1 + padding)
+        count = len(data)
+        item_width = min(120.0, max(0.0, (inner_width - gap * (count - 1)) / count))
+        spare = (inner_width - item_width * count - gap * (count - 1)) / count
+        top = y + height - 1 - padding - (320 + 16 + label_height)
+
+        for i, item in enumerate(data):
+            value = item.get("value", 0)
+            item_x = left + spare / 2 + i * (item_width + gap + spare)
+            center = item_x + item_width / 2
+            fill_height = 320 * ((value / max_value) if max_value > 0 else 0)
+            fill_top = top + 320 - fill_height
+            shapes.append(Rect(item_x, top, item_width, 320, t.border_light, radius))
+            shapes.append(Rect(
+                item_x, fill_top, item_width, fill_height, _paint(t.gradient_primary), radius,
+            ))
+            # The container clips the value label once the bar is too short
+            value_top = fill_top + 12
+            if value_top + 18 * _NORMAL_LINE_HEIGHT <= top + 320:
+                shapes.append(Text(
+                    center, _baseline(value_top + 9 * _NORMAL_LINE_HEIGHT, 18),
+                    (TextRun(str(value)),), 18, 800, "white", "middle",
+                ))
+            shapes.append(Text(
+                center, _baseline(top + 320 + 16 + label_height / 2, 16),
+                (TextRun(str(item.get("label", ""))),), 16, 600, t.text_primary, "middle",
+                16 * 0.02,
+            ))
+        return shapes
+
+    return _Block(420.0, draw)
+
+
+_BLOCKS: Dict[str, Callable[[Dict[str, Any], Theme], _Block]] = {
+    "badge": _badge,
+    "metric_card": _metric_card,
+    "event_poster": _event_poster,
+    "bar_chart": _bar_chart,
+    "progress_bar": _progress_bar,
+}
+
+
+# ---------------------------------------------------------------------------
+# CSS value helpers
+
+def _length(value: Any) -> float:
+    """A CSS length in px ("72px" or 72)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.fullmatch(r"\s*(-?\d*\.?\d+)(px)?\s*", str(value))
+    if match is None:
+        raise ValueError(
+            f"Cannot lay out CSS length {value!r} without a browser; "
+            "only px lengths are supported"
+        )
+    return float(match.group(1))
+
+
+def _weight(value: Any) -> int:
+    """A numeric CSS font-weight ("800", "bold")."""
+    named = {"normal": 400, "bold": 700}
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return named.get(str(value).strip().lower(), 400)
+
+
+def _paint(value: str) -> Paint:
+    """A CSS color, or a Gradient for linear-gradient() values."""
+    value = value.strip()
+    if not value.startswith("linear-gradient(") or not value.endswith(")"):
+        return value
+    parts = _split_top_level(value[len("linear-gradient("):-1])
+    angle = 180.0
+    direction = parts[0].strip().lower()
+    if direction.endswith(("deg", "turn")) or direction in _GRADIENT_SIDES:
+        parts = parts[1:]
+        if direction in _GRADIENT_SIDES:
+            angle = _GRADIENT_SIDES[direction]
+        elif direction.endswith("turn"):
+            angle = float(direction[:-4]) * 360
+        else:
+            angle = float(direction[:-3])
+    # Stops are treated as evenly spaced; explicit positions are dropped
+    colors = tuple(re.sub(r"\s+-?[\d.]+(%|px)$", "", part.strip()) for part in parts)
+    return Gradient(angle, colors)
+
+
+def _split_top_level(value: str) -> List[str]:
+    """Split on commas outside parentheses."""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(value):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(value[start:i])
+            start = i + 1
+    parts.append(value[start:])
+    return parts
+
+
+def _baseline(middle: float, size: float, line_height: Optional[float] = None) -> float:
+    """Baseline of a line box centered on middle (line_height None: normal)."""
+    line = size * (line_height if line_height is not None else _NORMAL_LINE_HEIGHT)
+    top = middle - line / 2
+    return top + (line - size * _NORMAL_LINE_HEIGHT) / 2 + size * _ASCENT
+
+
+def _text_width(text: str, size: float, weight: int, letter_spacing: float = 0.0) -> float:
+    """Estimated advance width of a line of text."""
+    if text.isupper():
+        advance = _ADVANCE["upper"]
+    else:
+        advance = _ADVANCE["bold" if weight >= 600 else "regular"]
+    return len(text) * (size * advance + letter_spacing)
+
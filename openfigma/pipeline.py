@@ -0,0 +1,99 @@
+"""
+Batch Pipeline - Scale HTML generation across cores.
+
+build_from_config is pure Python and holds the GIL, so large catalogs are
+sharded across a process pool. Each worker keeps one GraphicsBuilder (and
+its compiled stylesheet cache) for its whole lifetime.
+
+Usage:
+    for html in build_many(configs, dimensions=(1080, 1080), workers=8):
+        ...
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .components import GraphicsBuilder, Theme
+
+
+_worker_builder: Optional[GraphicsBuilder] = None
+
+
+def _init_worker(theme: Optional[Theme], builder_options: Dict[str, Any]) -> None:
+    """Create the builder reused for every chunk this worker processes."""
+    global _worker_builder
+    _worker_builder = GraphicsBuilder(theme, **builder_options)
+
+
+def _build_chunk(configs: List[Dict[str, Any]], dimensions: tuple) -> List[str]:
+    return [_worker_builder.build_from_config(config, dimensions) for config in configs]
+
+
+def _chunks(configs: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(configs)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def build_many(
+    configs: Iterable[Dict[str, Any]],
+    dimensions: tuple = (1920, 1080),
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    theme: Optional[Theme] = None,
+    **builder_options: Any,
+) -> Iterator[str]:
+    """
+    Build HTML for many configs on a process pool, yielding in input order.
+
+    configs is consumed lazily: at most two chunks per worker are in flight,
+    so arbitrarily long iterables stream in bounded memory.
+
+    Args:
+        configs: Iterable of build_from_config configs
+        dimensions: Canvas size for every graphic (default 1920x1080)
+        workers: Worker processes (default os.cpu_count(); 1 builds inline)
+        chunksize: Configs sent to a worker per task (default 64)
+        theme: Base theme for every build (default Theme())
+        **builder_options: Passed to each worker's GraphicsBuilder
+
+    Components registered at runtime are only visible to workers started
+    with the fork start method (the Linux default).
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    dimensions = tuple(dimensions)
+    if workers == 1:
+        builder = GraphicsBuilder(theme, **builder_options)
+        for config in configs:
+            yield builder.build_from_config(config, dimensions)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(theme, builder_options),
+    ) as pool:
+        pending = deque()
+        try:
+            for chunk in _chunks(configs, chunksize):
+                pending.append(pool.submit(_build_chunk, chunk, dimensions))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Abandoned generator or failed chunk: drop queued work
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,597 @@
+"""
+Raster Backend - Native PNG, JPEG and WebP rendering without a browser.
+
+Configs that only use shape-and-text components (see RASTER_COMPONENTS)
+with themes made of plain colors and linear gradients are laid out by the
+layout engine and drawn with Pillow, skipping the Chromium launch and page
+load entirely. Anything outside that subset is named by unsupported(), so
+callers can fall back to the browser; export_config_to_png and PNGExporter
+do this per item with native=True.
+
+Text is drawn from the same font files the HTML output embeds (font_dir,
+then OPENFIGMA_FONT_DIR, then the bundled fonts), so the theme's font
+family must be available locally as a TrueType/OpenType file. Box shadows
+and backdrop blur are not drawn; tests/test_raster.py checks the output
+against Chromium within a pixel tolerance.
+
+Requires Pillow (pip install Pillow).
+
+Usage:
+    renderer = RasterRenderer()
+    if not renderer.unsupported(config, theme):
+        png = renderer.render(config, (1080, 1080), theme)
+
+    export_config_to_png(config, "post.png", (1080, 1080), native=True)
+"""
+
+import io
+import math
+import os
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .components import _THEME_FIELDS, Theme
+from .export import ImageFormat, ImageFormatLike, _check_scale, _image_format, _write_bytes
+from .fonts import font_files, parse_font_name, resolve_font_dir
+from .layout import (
+    LAYOUT_COMPONENTS, Gradient, Grid, Layout, Line, Paint, Rect, Text, _length, _paint,
+    layout_config, unsupported_components,
+)
+
+try:
+    from PIL import Image, ImageChops, ImageColor, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+
+# Component types the raster backend draws
+RASTER_COMPONENTS = LAYOUT_COMPONENTS
+
+# Theme fields the raster backend honors; themes or configs that set any
+# other field away from its Theme() default fall back to Chromium. Colors may be any CSS color Pillow parses
+# (hex, rgb(), rgba(), hsl(), names) or a linear-gradient(), and lengths
+# must be in px. Shadows and glass blur are not drawn.
+RASTER_THEME_FIELDS = (
+    "background", "surface", "text_primary", "accent", "border", "border_light",
+    "gradient_primary", "gradient_text", "font_family", "font_headline",
+    "padding_large", "padding_small", "gap_large", "gap_medium", "gap_small",
+    "radius_large", "radius_small", "radius_pill",
+    "grid_enabled", "grid_color", "grid_size", "grid_style", "grid_dot_size",
+)
+
+_PAINT_FIELDS = (
+    "background", "surface", "text_primary", "accent", "border", "border_light",
+    "gradient_primary", "gradient_text",
+)
+
+_LENGTH_FIELDS = (
+    "padding_large", "padding_small", "gap_large", "gap_medium", "gap_small",
+    "radius_large", "radius_small", "radius_pill",
+)
+
+_PILLOW_MISSING = (
+    "Pillow is required for native raster rendering. "
+    "Install with: pip install Pillow"
+)
+
+# Chromium's synthetic oblique for families without an italic face
+_OBLIQUE_SKEW = 0.25
+
+
+@dataclass(frozen=True)
+class _Face:
+    """A font file and the weights and style it covers."""
+    path: str
+    weights: Tuple[int, int]
+    italic: bool
+
+
+class RasterRenderer:
+    """
+    Draws configs within the raster subset straight to images with Pillow.
+
+    Args:
+        font_dir: Directory of font files to draw text with (default:
+                  OPENFIGMA_FONT_DIR, then the bundled fonts)
+        supersample: Draw at this multiple of the output size and scale
+                     down, antialiasing shape edges (default 2)
+
+    Fonts are opened per thread, so one renderer can be shared across
+    threads and render pool workers.
+
+    Raises:
+        ImportError: If Pillow is not installed
+    """
+
+    def __init__(self, font_dir: Optional[str] = None, supersample: int = 2):
+        if Image is None:
+            raise ImportError(_PILLOW_MISSING)
+        if supersample < 1:
+            raise ValueError("supersample must be at least 1")
+        self.font_dir = resolve_font_dir(font_dir)
+        self.supersample = supersample
+        self._local = threading.local()
+
+    def unsupported(self, config: Dict[str, Any], theme: Optional[Theme] = None) -> List[str]:
+        """
+        What keeps config off the raster path: component types outside
+        RASTER_COMPONENTS, "theme.<field>" names (overrides outside
+        RASTER_THEME_FIELDS, other fields of the resolved theme that differ
+        from Theme(), then values that cannot be drawn) and
+        "<type>.<field>" content values, in that order. Empty when render()
+        can draw it.
+        """
+        reasons = unsupported_components(config)
+        theme = theme or Theme()
+        overrides = config.get("theme") or {}
+        if overrides:
+            theme = theme.with_overrides(overrides)
+
+        reasons.extend(f"theme.{field}" for field in overrides if field not in RASTER_THEME_FIELDS)
+        # Preset themes set undrawn fields too (shadows, secondary text colors)
+        defaults = Theme()
+        for field in _THEME_FIELDS:
+            name = f"theme.{field}"
+            if field in RASTER_THEME_FIELDS or name in reasons:
+                continue
+            if getattr(theme, field) != getattr(defaults, field):
+                reasons.append(name)
+        fields = _PAINT_FIELDS + (("grid_color",) if theme.grid_enabled else ())
+        for field in fields:
+            if not _paintable(_paint(getattr(theme, field))):
+                reasons.append(f"theme.{field}")
+        fields = _LENGTH_FIELDS + (("grid_size", "grid_dot_size") if theme.grid_enabled else ())
+        for field in fields:
+            if not _measurable(getattr(theme, field)):
+                reasons.append(f"theme.{field}")
+        if not self._faces(theme.font_family):
+            reasons.append("theme.font_family")
+
+        for component in config.get("components", []):
+            if component.get("type") != "event_poster":
+                continue
+            lines = component.get("content", {}).get("lines", [])
+            if not all(_measurable(line.get("size", "120px")) for line in lines):
+                if "event_poster.size" not in reasons:
+                    reasons.append("event_poster.size")
+        return reasons
+
+    def render(
+        self,
+        config: Dict[str, Any],
+        dimensions: tuple = (1920, 1080),
+        theme: Optional[Theme] = None,
+        output_path: Optional[str] = None,
+        format: ImageFormatLike = "png",
+        quality: Optional[int] = None,
+        scale: float = 1.0,
+    ) -> bytes:
+        """
+        Render config like export_config_to_png, without a browser.
+
+        Args:
+            config: Same structure as GraphicsBuilder.build_from_config
+            dimensions: (width, height) tuple
+            theme: Base theme (default Theme()); config overrides apply on top
+            output_path: Optional path to save the image
+            format: "png" (default), "jpeg", "webp" or an ImageFormat
+            quality: JPEG/WebP quality 0-100 (see ImageFormat)
+            scale: Device scale factor (default 1)
+
+        Returns:
+            Image bytes in the requested format
+
+        Raises:
+            ValueError: If config is outside the raster subset (see unsupported)
+        """
+        image_format = _image_format(format, quality)
+        data = _encode(self.render_image(config, dimensions, theme, scale), image_format)
+        if output_path:
+            _write_bytes(output_path, data)
+        return data
+
+    def render_image(
+        self,
+        config: Dict[str, Any],
+        dimensions: tuple = (1920, 1080),
+        theme: Optional[Theme] = None,
+        scale: float = 1.0,
+    ) -> "Image.Image":
+        """Render config to an RGB Pillow image (see render)."""
+        _check_scale(scale)
+        missing = self.unsupported(config, theme)
+        if missing:
+            raise ValueError(
+                f"Cannot rasterize {', '.join(map(repr, missing))} natively; "
+                f"render with Chromium instead"
+            )
+        return self._draw(layout_config(config, dimensions, theme), scale)
+
+    def _draw(self, layout: Layout, scale: float) -> "Image.Image":
+        factor = scale * self.supersample
+        size = (round(layout.width * factor), round(layout.height * factor))
+        # Chromium composites the page over white
+        canvas = _Canvas(Image.new("RGB", size, "white"), factor, self, self._faces(layout.font_family))
+        canvas.background(layout.background)
+        for shape in layout.shapes:
+            if isinstance(shape, Rect):
+                canvas.rect(shape)
+            elif isinstance(shape, Text):
+                canvas.text(shape)
+            elif isinstance(shape, Line):
+                canvas.line(shape)
+            elif isinstance(shape, Grid):
+                canvas.grid(shape)
+
+        image = canvas.image
+        if self.supersample > 1:
+            image = image.resize(
+                (round(layout.width * scale), round(layout.height * scale)), Image.BOX
+            )
+        return image
+
+    def _faces(self, font_family: str) -> List[_Face]:
+        """Faces of the first family in a CSS font-family list with local files."""
+        if not self.font_dir:
+            return []
+        by_family: Dict[str, List[_Face]] = {}
+        for name in font_files(self.font_dir):
+            path = os.path.join(self.font_dir, name)
+            if not _loadable(path, os.path.getmtime(path)):
+                continue
+            family, weight, style = parse_font_name(name)
+            low, _, high = weight.partition(" ")
+            by_family.setdefault(family.lower(), []).append(
+                _Face(path, (int(low), int(high or low)), style == "italic")
+            )
+        for family in font_family.split(","):
+            faces = by_family.get(family.strip().strip("'\"").lower())
+            if faces:
+                return faces
+        return []
+
+    def _font(self, face: _Face, size: float, weight: int) -> "ImageFont.FreeTypeFont":
+        """An opened font, cached per thread since FreeType faces aren't thread-safe."""
+        fonts = self._local.__dict__.setdefault("fonts", {})
+        key = (face.path, size, weight)
+        if key not in fonts:
+            font = ImageFont.truetype(face.path, size)
+            if face.weights[0] != face.weights[1]:
+                _set_weight(font, weight)
+            fonts[key] = font
+        return fonts[key]
+
+
+_default_renderer: Optional[RasterRenderer] = None
+_default_renderer_lock = threading.Lock()
+
+
+def render_raster(
+    config: Dict[str, Any],
+    theme: Optional[Theme] = None,
+    dimensions: tuple = (1920, 1080),
+    format: ImageFormatLike = "png",
+    quality: Optional[int] = None,
+    scale: float = 1.0,
+) -> bytes:
+    """
+    Rasterize config without holding a renderer.
+
+    The raster counterpart of render_svg: stateless, thread-safe, and
+    raises ValueError for configs outside the raster subset.
+    """
+    global _default_renderer
+    if _default_renderer is None:
+        with _default_renderer_lock:
+            if _default_renderer is None:
+                _default_renderer = RasterRenderer()
+    return _default_renderer.render(config, dimensions, theme, None, format, quality, scale)
+
+
+class _Canvas:
+    """Draws layout shapes onto a supersampled image."""
+
+    def __init__(self, image: "Image.Image", factor: float, renderer: RasterRenderer, faces: List[_Face]):
+        self.image = image
+        self.draw = ImageDraw.Draw(image, "RGBA")
+        self.factor = factor
+        self.renderer = renderer
+        self.faces = faces
+
+    def fill(self, origin: Tuple[int, int], mask: "Image.Image", paint: Paint) -> None:
+        """Composite paint through an L mask placed at origin."""
+        if isinstance(paint, Gradient):
+            gradient = _gradient(paint, mask.size)
+            alpha = ImageChops.multiply(gradient.getchannel("A"), mask)
+            self.image.paste(gradient.convert("RGB"), origin, alpha)
+            return
+        *rgb, alpha = _rgba(paint)
+        if alpha < 1:
+            mask = mask.point(lambda v: round(v * alpha))
+        self.image.paste(tuple(rgb), origin, mask)
+
+    def shape(self, box: Tuple[int, int, int, int], paint: Paint, draw: Callable[..., None]) -> None:
+        """
+        Paint a shape drawn by draw(draw, dx, dy, ink) within box: solid
+        colors straight onto the canvas, gradients through a mask of the box.
+        """
+        x0, y0, x1, y1 = box
+        if x1 <= x0 or y1 <= y0:
+            return
+        if isinstance(paint, Gradient):
+            mask = Image.new("L", (x1 - x0, y1 - y0), 0)
+            draw(ImageDraw.Draw(mask), -x0, -y0, 255)
+            self.fill((x0, y0), mask, paint)
+        else:
+            *rgb, alpha = _rgba(paint)
+            draw(self.draw, 0, 0, (*rgb, round(alpha * 255)))
+
+    def background(self, paint: Paint) -> None:
+        width, height = self.image.size
+        self.shape((0, 0, width, height), paint, lambda draw, dx, dy, ink: draw.rectangle(
+            (dx, dy, dx + width - 1, dy + height - 1), fill=ink,
+        ))
+
+    def rect(self, rect: Rect) -> None:
+        f = self.factor
+        box = (
+            math.floor(rect.x * f), math.floor(rect.y * f),
+            round((rect.x + rect.width) * f), round((rect.y + rect.height) * f),
+        )
+        x0, y0, x1, y1 = box
+        radius = min(rect.radius * f, (x1 - x0) / 2, (y1 - y0) / 2)
+
+        def bounds(dx: int, dy: int) -> tuple:
+            return (x0 + dx, y0 + dy, x1 - 1 + dx, y1 - 1 + dy)
+
+        if rect.fill is not None:
+            self.shape(box, rect.fill, lambda draw, dx, dy, ink: draw.rounded_rectangle(
+                bounds(dx, dy), radius, fill=ink,
+            ))
+        if rect.stroke and rect.stroke_width:
+            # Pillow outlines inside the bounds, like a CSS border
+            width = max(1, round(rect.stroke_width * f))
+            self.shape(box, rect.stroke, lambda draw, dx, dy, ink: draw.rounded_rectangle(
+                bounds(dx, dy), radius, outline=ink, width=width,
+            ))
+
+    def line(self, line: Line) -> None:
+        f = self.factor
+        width = line.width * f
+        pad = math.ceil(width / 2) + 1
+        box = (
+            math.floor(min(line.x1, line.x2) * f) - pad, math.floor(min(line.y1, line.y2) * f) - pad,
+            math.ceil(max(line.x1, line.x2) * f) + pad, math.ceil(max(line.y1, line.y2) * f) + pad,
+        )
+
+        def draw_line(draw: Any, dx: int, dy: int, ink: Any) -> None:
+            ends = [(line.x1 * f + dx, line.y1 * f + dy), (line.x2 * f + dx, line.y2 * f + dy)]
+            draw.line(ends, fill=ink, width=max(1, round(width)))
+            for x, y in ends:
+                # stroke-linecap: round
+                draw.ellipse((x - width / 2, y - width / 2, x + width / 2, y + width / 2), fill=ink)
+
+        self.shape(box, line.stroke, draw_line)
+
+    def grid(self, grid: Grid) -> None:
+        f = self.factor
+        step = grid.size * f
+        if step < 1:
+            return
+        width, height = self.image.size
+        rows, columns = math.ceil(height / step), math.ceil(width / step)
+
+        def draw_grid(draw: Any, dx: int, dy: int, ink: Any) -> None:
+            if grid.style == "dots":
+                # radial-gradient(circle, color dot_size, transparent dot_size) per tile
+                radius = grid.dot_size * f
+                for row in range(rows):
+                    for column in range(columns):
+                        x, y = (column + 0.5) * step, (row + 0.5) * step
+                        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=ink)
+                return
+            # A 1px line along the top and left edge of every tile
+            thickness = max(1, round(f))
+            for row in range(rows):
+                top = round(row * step)
+                draw.rectangle((0, top, width - 1, top + thickness - 1), fill=ink)
+            for column in range(columns):
+                left = round(column * step)
+                draw.rectangle((left, 0, left + thickness - 1, height - 1), fill=ink)
+
+        self.shape((0, 0, width, height), grid.color, draw_grid)
+
+    def text(self, text: Text) -> None:
+        f = self.factor
+        size = text.size * f
+        spacing = text.letter_spacing * f
+
+        # Lay the runs out along the line: (font, string, x, stroke) pieces
+        # and the x ranges that need a synthetic oblique
+        pieces: List[Tuple[Any, str, float, int]] = []
+        obliques: List[Tuple[float, float]] = []
+        fonts = []
+        x = 0.0
+        for run in text.runs:
+            x += run.dx * f
+            face, oblique = _match_face(self.faces, text.weight, run.italic)
+            font = self.renderer._font(face, size, text.weight)
+            fonts.append(font)
+            # Chromium emboldens faces lighter than a bold request
+            stroke = round(size / 64) if text.weight >= 600 and face.weights[1] < 600 else 0
+            start = x
+            if spacing:
+                for char in run.text:
+                    pieces.append((font, char, x, stroke))
+                    x += font.getlength(char) + spacing
+            else:
+                pieces.append((font, run.text, x, stroke))
+                x += font.getlength(run.text)
+            if oblique:
+                obliques.append((start, x))
+        if not pieces:
+            return
+
+        left = text.x * f - {"start": 0.0, "middle": x / 2, "end": x}.get(text.anchor, 0.0)
+        ascent = max(font.getmetrics()[0] for font in fonts)
+        descent = max(font.getmetrics()[1] for font in fonts)
+        pad = math.ceil(size / 2)
+        origin = (math.floor(left) - pad, math.floor(text.y * f - ascent) - pad)
+        mask_x = left - origin[0]
+        baseline = text.y * f - origin[1]
+        mask_size = (math.ceil(x + mask_x) + pad, math.ceil(baseline + descent) + pad)
+
+        mask = Image.new("L", mask_size, 0)
+        slanted = Image.new("L", mask_size, 0) if obliques else None
+        for font, string, offset, stroke in pieces:
+            target = mask
+            if slanted is not None and any(start <= offset < end for start, end in obliques):
+                target = slanted
+            ImageDraw.Draw(target).text(
+                (mask_x + offset, baseline), string, fill=255, font=font, anchor="ls",
+                stroke_width=stroke, stroke_fill=255,
+            )
+        if slanted is not None:
+            # Shear around the baseline: x' = x + skew * (baseline - y)
+            slanted = slanted.transform(
+                mask_size, Image.AFFINE,
+                (1, _OBLIQUE_SKEW, -_OBLIQUE_SKEW * baseline, 0, 1, 0),
+                Image.BILINEAR,
+            )
+            mask = ImageChops.lighter(mask, slanted)
+        self.fill(origin, mask, text.fill)
+
+
+def _match_face(faces: List[_Face], weight: int, italic: bool) -> Tuple[_Face, bool]:
+    """
+    CSS font matching: the face closest to weight, preferring the requested
+    style. The flag is True when italic must be synthesized.
+    """
+    styled = [face for face in faces if face.italic == italic] or faces
+    face = min(styled, key=lambda face: _weight_rank(face, weight))
+    return face, italic and not face.italic
+
+
+def _weight_rank(face: _Face, weight: int) -> Tuple[int, int]:
+    """Sort key following the CSS font-weight fallback order."""
+    low, high = face.weights
+    if low <= weight <= high:
+        return (0, 0)
+    nearest = low if weight < low else high
+    distance = abs(nearest - weight)
+    if 400 <= weight <= 500:
+        # 400 and 500 try the weights up to 500 first, then lighter, then heavier
+        if weight < nearest <= 500:
+            return (1, distance)
+        return (2, distance) if nearest < weight else (3, distance)
+    heavier_first = weight > 500
+    return (2, distance) if (nearest > weight) == heavier_first else (3, distance)
+
+
+def _set_weight(font: Any, weight: int) -> None:
+    """Set the wght axis of a variable font, leaving other axes at their defaults."""
+    try:
+        axes = font.get_variation_axes()
+        font.set_variation_by_axes([
+            min(max(weight, axis["minimum"]), axis["maximum"])
+            if axis.get("name") in (b"Weight", "Weight") else axis["default"]
+            for axis in axes
+        ])
+    except (OSError, KeyError):
+        pass
+
+
+@lru_cache(maxsize=64)
+def _loadable(path: str, mtime: float) -> bool:
+    """Whether FreeType can open a font file (woff2 needs a brotli build)."""
+    try:
+        ImageFont.truetype(path, 12)
+        return True
+    except OSError:
+        return False
+
+
+def _rgba(color: str) -> Tuple[int, int, int, float]:
+    """(r, g, b, alpha 0-1) for a CSS color; rgba() alpha is CSS's 0-1, not Pillow's 0-255."""
+    color = color.strip()
+    if color.lower() == "transparent":
+        return (0, 0, 0, 0.0)
+    match = re.fullmatch(r"(rgb|hsl)a?\((.*)\)", color, re.IGNORECASE)
+    if match:
+        parts = [part for part in re.split(r"[\s,/]+", match.group(2).strip()) if part]
+        if len(parts) == 4:
+            alpha = parts.pop()
+            value = float(alpha[:-1]) / 100 if alpha.endswith("%") else float(alpha)
+            r, g, b = ImageColor.getrgb(f"{match.group(1)}({', '.join(parts)})")[:3]
+            return (r, g, b, min(max(value, 0.0), 1.0))
+    rgb = ImageColor.getrgb(color)
+    return (rgb[0], rgb[1], rgb[2], rgb[3] / 255 if len(rgb) == 4 else 1.0)
+
+
+def _paintable(paint: Paint) -> bool:
+    colors = paint.colors if isinstance(paint, Gradient) else (paint,)
+    try:
+        for color in colors:
+            _rgba(color)
+    except ValueError:
+        return False
+    return bool(colors)
+
+
+def _measurable(value: Any) -> bool:
+    """Whether the layout engine can resolve a CSS length."""
+    try:
+        _length(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _gradient(paint: Gradient, size: Tuple[int, int]) -> "Image.Image":
+    """An RGBA image of a CSS linear-gradient filling a box of size."""
+    width, height = size
+    angle = math.radians(paint.angle)
+    sin, cos = math.sin(angle), math.cos(angle)
+    # The gradient line runs through the center, long enough that the
+    # start and end colors land exactly on opposite corners
+    length = abs(width * sin) + abs(height * cos) or 1.0
+    dx, dy = 254 * sin / length, -254 * cos / length
+    offset = 127.5 - dx * (width - 1) / 2 - dy * (height - 1) / 2
+    # Sample the rows of Pillow's 0-255 ramp to get 0-254 along the line
+    ramp = Image.linear_gradient("L").transform(
+        size, Image.AFFINE, (0, 0, 128, dx, dy, offset), Image.BILINEAR,
+    )
+    return Image.merge("RGBA", [ramp.point(lut) for lut in _gradient_luts(paint)])
+
+
+@lru_cache(maxsize=64)
+def _gradient_luts(paint: Gradient) -> List[List[int]]:
+    """Per-channel lookup tables from ramp value to color, stops evenly spaced."""
+    stops = [_rgba(color) for color in paint.colors]
+    stops = [(r, g, b, alpha * 255) for r, g, b, alpha in stops]
+    if len(stops) == 1:
+        stops = stops * 2
+    luts: List[List[int]] = [[], [], [], []]
+    for i in range(256):
+        t = min(i / 254, 1.0) * (len(stops) - 1)
+        j = min(int(t), len(stops) - 2)
+        u = t - j
+        for channel in range(4):
+            luts[channel].append(round(stops[j][channel] * (1 - u) + stops[j + 1][channel] * u))
+    return luts
+
+
+def _encode(image: "Image.Image", image_format: ImageFormat) -> bytes:
+    out = io.BytesIO()
+    if image_format.format == "png":
+        options = {}
+        if image_format.compress_level is not None:
+            options["compress_level"] = image_format.compress_level
+        image.save(out, "PNG", **options)
+    elif image_format.format == "jpeg":
+        image.save(out, "JPEG", quality=image_format._quality)
+    else:
+        image.save(out, "WEBP", quality=image_format._quality, lossless=image_format.lossless)
+    return out.getvalue()
@@ -0,0 +1,429 @@
+"""
+Render Server - Long-lived PNG rendering over localhost HTTP or a Unix socket.
+
+Keeps a pool of warm Chromium browsers so API paths don't pay browser
+startup per image. Browsers are recycled after a fixed number of pages and
+on demand, bounding memory growth without dropping in-flight renders.
+
+Endpoints:
+- GET  /health   Pool status and counters (503 unless every worker is
+                 up and the last render or launch succeeded)
+- POST /render   JSON {"html": ...} or {"config": ...} -> image/png bytes
+                 (optional "scale" for 2x/3x renders)
+- POST /restart  Recycle all browsers once their current render finishes
+
+Usage:
+    python -m openfigma.server --port 8765 --workers 4
+
+    client = RenderClient(port=8765)
+    png_bytes = client.render_config(config, dimensions=(1080, 1080))
+"""
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+from .cache import RenderCache
+from .export import _RenderPool, _render_page, _item_html
+
+
+class _RenderHandler(BaseHTTPRequestHandler):
+    """HTTP handler dispatching to the server's render pool."""
+
+    server: "_HTTPServer"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            status = self.server.render_server.health()
+            self._send_json(200 if status["status"] == "ok" else 503, status)
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path == "/render":
+            self._handle_render()
+        elif self.path == "/restart":
+            self.server.render_server.restart()
+            self._send_json(202, {"status": "restarting"})
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def _handle_render(self) -> None:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            html, width, height, scale = _parse_render_request(request)
+        except Exception as e:
+            # Anything raised before rendering comes from the request body
+            self._send_json(400, {"error": str(e)})
+            return
+
+        try:
+            png_bytes = self.server.render_server.render(html, width, height, scale)
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(png_bytes)))
+        self.end_headers()
+        self.wfile.write(png_bytes)
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.render_server.verbose:
+            super().log_message(format, *args)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    render_server: "RenderServer"
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    render_server: "RenderServer"
+
+    def server_bind(self) -> None:
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def _parse_render_request(request: Dict[str, Any]) -> tuple:
+    """Validate a /render payload and return (html, width, height, scale)."""
+    if not isinstance(request, dict):
+        raise ValueError("Request body must be a JSON object")
+
+    if "html" in request:
+        html = request["html"]
+        if not isinstance(html, str):
+            raise TypeError("'html' must be a string")
+        width = int(request.get("width", 1920))
+        height = int(request.get("height", 1080))
+    elif "config" in request:
+        config = request["config"]
+        _check_config(config)
+        width, height = (int(v) for v in request.get("dimensions", (1920, 1080)))
+        try:
+            html = _item_html(config, (width, height))
+        except Exception as e:
+            # Any failure building client-supplied config is a bad request
+            raise ValueError(f"Invalid config: {type(e).__name__}: {e}") from e
+    else:
+        raise ValueError("Request must contain 'html' or 'config'")
+
+    if width <= 0 or height <= 0:
+        raise ValueError("Dimensions must be positive")
+    scale = float(request.get("scale", 1.0))
+    if scale <= 0:
+        raise ValueError("scale must be positive")
+    return html, width, height, scale
+
+
+def _check_config(config: Any) -> None:
+    """Reject configs whose theme or components have the wrong JSON shape."""
+    if not isinstance(config, dict):
+        raise TypeError("'config' must be an object")
+    if not isinstance(config.get("theme") or {}, dict):
+        raise TypeError("'config.theme' must be an object")
+    components = config.get("components", [])
+    if not isinstance(components, list):
+        raise TypeError("'config.components' must be an array")
+    for i, component in enumerate(components):
+        if not isinstance(component, dict):
+            raise TypeError(f"'config.components[{i}]' must be an object")
+        if not isinstance(component.get("content", {}), dict):
+            raise TypeError(f"'config.components[{i}].content' must be an object")
+
+
+class RenderServer:
+    """
+    Persistent render server with warm browsers.
+
+    Args:
+        host: Interface to bind for HTTP (default 127.0.0.1)
+        port: TCP port (default 8765, 0 picks a free port)
+        socket_path: Serve on this Unix socket instead of TCP
+        workers: Number of warm Chromium processes (default 2)
+        max_pages_per_browser: Recycle a browser after this many renders
+                               (default 500, None disables)
+        render_timeout: Seconds to wait for a single render (default 60)
+        cache: Optional RenderCache consulted before rendering
+        verbose: Log each request to stderr
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        socket_path: Optional[str] = None,
+        workers: int = 2,
+        max_pages_per_browser: Optional[int] = 500,
+        render_timeout: float = 60.0,
+        cache: Optional[RenderCache] = None,
+        verbose: bool = False,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.workers = workers
+        self.max_pages_per_browser = max_pages_per_browser
+        self.render_timeout = render_timeout
+        self.cache = cache
+        self.verbose = verbose
+        self._pool: Optional[_RenderPool] = None
+        self._httpd = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        """Address the server is listening on."""
+        if self.socket_path:
+            return f"unix:{self.socket_path}"
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "RenderServer":
+        """Warm up the browsers and serve requests on a background thread."""
+        self._pool = _RenderPool(self.workers, max_pages=self.max_pages_per_browser)
+
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self._httpd = _UnixHTTPServer(self.socket_path, _RenderHandler)
+        else:
+            self._httpd = _HTTPServer((self.host, self.port), _RenderHandler)
+            self.port = self._httpd.server_address[1]
+        self._httpd.render_server = self
+
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="openfigma-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve until SIGINT/SIGTERM, then drain and shut down."""
+        stop = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stop.set())
+
+        self.start()
+        print(f"openfigma render server listening on {self.address} ({self.workers} workers)")
+        stop.wait()
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop accepting requests, finish queued renders and close browsers."""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        if self._pool:
+            self._pool.close()
+            self._pool = None
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def render(
+        self,
+        html: str,
+        width: int = 1920,
+        height: int = 1080,
+        scale: float = 1.0,
+    ) -> bytes:
+        """Render HTML on a warm browser and return PNG bytes."""
+        if not self._pool:
+            raise RuntimeError("RenderServer is not running")
+
+        if self.cache is not None:
+            key = self.cache.key(html, width, height, scale)
+            png_bytes = self.cache.get(key)
+            if png_bytes is not None:
+                return png_bytes
+
+        future = self._pool.submit(
+            _render_page, html, width, height, None, None, "auto", None, scale
+        )
+        png_bytes = future.result(timeout=self.render_timeout)
+        if self.cache is not None:
+            self.cache.put(key, png_bytes)
+        return png_bytes
+
+    def restart(self) -> None:
+        """Gracefully recycle all browsers."""
+        if self._pool:
+            self._pool.restart()
+
+    def health(self) -> Dict[str, Any]:
+        """
+        Pool status and render counters.
+
+        "error" when no worker is running or no browser has ever launched
+        after a failed launch; "degraded" when a worker died or the most
+        recent launch or render failed; otherwise "ok".
+        """
+        if not self._pool:
+            return {"status": "stopped"}
+        alive = self._pool.alive()
+        stats = dict(self._pool.stats)
+        if alive == 0 or (stats["launches"] == 0 and stats["launch_failures"] > 0):
+            status = "error"
+        elif alive < self.workers or self._pool.failing:
+            status = "degraded"
+        else:
+            status = "ok"
+        return {
+            "status": status,
+            "workers": self.workers,
+            "workers_alive": alive,
+            "max_pages_per_browser": self.max_pages_per_browser,
+            **stats,
+            **({"last_error": self._pool.last_error} if self._pool.last_error else {}),
+            **({"cache": dict(self.cache.stats)} if self.cache is not None else {}),
+        }
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class RenderClient:
+    """
+    Minimal client for a running RenderServer.
+
+    Args:
+        host: Server host (default 127.0.0.1)
+        port: Server port (default 8765)
+        socket_path: Connect over this Unix socket instead of TCP
+        timeout: Socket timeout in seconds (default 120)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        socket_path: Optional[str] = None,
+        timeout: float = 120.0,
+    ):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None) -> tuple:
+        if self.socket_path:
+            conn = _UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            body = json.dumps(payload).encode("utf-8") if payload is not None else None
+            headers = {"Content-Type": "application/json"} if body else {}
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.getheader("Content-Type"), response.read()
+        finally:
+            conn.close()
+
+    def _render(self, payload: dict) -> bytes:
+        status, content_type, body = self._request("POST", "/render", payload)
+        if status != 200:
+            message = json.loads(body).get("error", "") if content_type == "application/json" else ""
+            raise RuntimeError(f"Render failed ({status}): {message}")
+        return body
+
+    def render_html(
+        self,
+        html: str,
+        width: int = 1920,
+        height: int = 1080,
+        scale: float = 1.0,
+    ) -> bytes:
+        """Render an HTML document and return PNG bytes."""
+        return self._render({"html": html, "width": width, "height": height, "scale": scale})
+
+    def render_config(
+        self,
+        config: dict,
+        dimensions: tuple = (1920, 1080),
+        scale: float = 1.0,
+    ) -> bytes:
+        """Build a graphic from config on the server and return PNG bytes."""
+        return self._render({"config": config, "dimensions": list(dimensions), "scale": scale})
+
+    def health(self) -> Dict[str, Any]:
+        """Fetch server health and counters."""
+        _, _, body = self._request("GET", "/health")
+        return json.loads(body)
+
+    def restart(self) -> None:
+        """Ask the server to recycle its browsers."""
+        self._request("POST", "/restart")
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Run the openfigma render server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", dest="socket_path", help="Serve on a Unix socket instead")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-pages", type=int, default=500,
+                        help="Recycle a browser after this many renders (0 disables)")
+    parser.add_argument("--cache-dir", help="Enable the render cache with a disk tier here")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    RenderServer(
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket_path,
+        workers=args.workers,
+        max_pages_per_browser=args.max_pages or None,
+        cache=RenderCache(disk_dir=args.cache_dir) if args.cache_dir else None,
+        verbose=args.verbose,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -40,7 +40,7 @@ with sync_playwright() as p:
         
         # Load the HTML file
         page.goto(f"file://{html_path.absolute()}")
-        page.wait_for_load_state("networkidle")
+        page.evaluate("() => document.fonts.ready.then(() => true)")
         
         # Take screenshot
         output_path = EXPORTS_DIR / png_file
@@ -9,28 +9,20 @@ from pathlib import Path
 
 # Test if we can import from installed package
 try:
-    from openfigma import GraphicsBuilder
+    from openfigma import GraphicsBuilder, AsyncPNGExporter
     print("✅ Imported from installed openfigma package")
 except ImportError:
     # Fallback to local
     import sys
     sys.path.insert(0, str(Path(__file__).parent))
-    from openfigma import GraphicsBuilder
+    from openfigma import GraphicsBuilder, AsyncPNGExporter
     print("✅ Imported from local openfigma")
 
-from playwright.async_api import async_playwright
-
 
 async def html_to_png(html: str, output_path: Path):
     """Convert HTML to PNG."""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        try:
-            page = await browser.new_page(viewport={"width": 1920, "height": 1080})
-            await page.set_content(html, wait_until="networkidle")
-            await page.screenshot(path=str(output_path), full_page=False, type="png")
-        finally:
-            await browser.close()
+    async with AsyncPNGExporter() as exporter:
+        await exporter.export(html, str(output_path), width=1920, height=1080)
 
 
 async def test_visual_quality():
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Test suite for rendering in a real Chromium.
+
+Each test skips when Chromium cannot be launched. CI sets
+OPENFIGMA_REQUIRE_BROWSER=1 so a missing browser fails the run there
+instead of skipping.
+"""
+
+import asyncio
+import io
+import os
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+from contextlib import contextmanager
+sys.path.insert(0, '..')
+
+from PIL import Image, ImageChops
+
+from openfigma import (
+    AsyncPNGExporter, Carousel, GraphicsBuilder, ImageFormat, PNGExporter, Theme, html_to_pdf,
+)
+from openfigma.export import _load_html
+
+REQUIRE_BROWSER_ENV = "OPENFIGMA_REQUIRE_BROWSER"
+
+
+@contextmanager
+def _chromium():
+    """A launched Chromium browser, or a skip when none is available."""
+    try:
+        from playwright.sync_api import sync_playwright
+        playwright = sync_playwright().start()
+    except Exception as e:
+        _unavailable(e)
+    try:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            _unavailable(e)
+        try:
+            yield browser
+        finally:
+            browser.close()
+    finally:
+        playwright.stop()
+
+
+def _unavailable(error: Exception) -> None:
+    if os.environ.get(REQUIRE_BROWSER_ENV):
+        raise RuntimeError(f"Chromium is required but failed to launch: {error}")
+    raise unittest.SkipTest("Chromium is not available")
+
+
+def _exporter(**kwargs) -> PNGExporter:
+    """A PNGExporter entered in Chromium, or a skip when none is available."""
+    exporter = PNGExporter(**kwargs)
+    try:
+        return exporter.__enter__()
+    except Exception as e:
+        exporter.__exit__(None, None, None)
+        _unavailable(e)
+
+
+def _png_size(path: str) -> tuple:
+    """(width, height) from a PNG's IHDR chunk."""
+    with open(path, "rb") as f:
+        header = f.read(24)
+    assert header[:8] == b"\x89PNG\r\n\x1a\n", f"{path} is not a PNG"
+    return struct.unpack(">II", header[16:24])
+
+
+@contextmanager
+def _font_dir():
+    """A temp font directory with DejaVu Sans installed as the 'Probe' family."""
+    source = "/usr/share/fonts/truetype/dejavu"
+    if not os.path.exists(os.path.join(source, "DejaVuSans.ttf")):
+        raise unittest.SkipTest("DejaVu Sans is not installed")
+    with tempfile.TemporaryDirectory() as font_dir:
+        for weight in ("", "-Bold"):
+            shutil.copy(
+                os.path.join(source, f"DejaVuSans{weight}.ttf"),
+                os.path.join(font_dir, f"Probe{weight or '-Regular'}.ttf"),
+            )
+        yield font_dir
+
+
+def _mismatched(a: bytes, b: bytes) -> float:
+    """Share of pixels where two same-sized images differ noticeably."""
+    with Image.open(io.BytesIO(a)) as first, Image.open(io.BytesIO(b)) as second:
+        assert first.size == second.size, f"{first.size} != {second.size}"
+        diff = ImageChops.difference(first.convert("RGB"), second.convert("RGB"))
+    worst = diff.convert("L").point(lambda v: 255 if v > 16 else 0)
+    return worst.histogram()[255] / (diff.size[0] * diff.size[1])
+
+
+def _pdf_pages(path: str) -> list:
+    """(width, height) in points of each page of a PDF."""
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data.startswith(b"%PDF-"), f"{path} is not a PDF"
+    count = len(re.findall(rb"/Type\s*/Page\b", data))
+    boxes = re.findall(rb"/MediaBox\s*\[\s*0\s+0\s+([\d.]+)\s+([\d.]+)\s*\]", data)
+    assert len(boxes) == count, f"{count} pages but {len(boxes)} media boxes"
+    return [(round(float(w), 1), round(float(h), 1)) for w, h in boxes]
+
+
+_BADGE = {"components": [{"type": "badge", "content": {"text": "Browser"}}]}
+
+
+def test_base_dir_resolves_relative_assets():
+    """Test relative asset paths resolve against base_dir, and only with it."""
+    html = '<img src="dot.svg">'
+    with _chromium() as browser, tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "dot.svg"), "w") as f:
+            f.write('<svg xmlns="http://www.w3.org/2000/svg" width="3" height="2"></svg>')
+
+        page = browser.new_page(viewport={"width": 100, "height": 100})
+        try:
+            _load_html(page, html, tmp, "images")
+            assert page.evaluate("document.images[0].naturalWidth") == 3
+        finally:
+            page.close()
+        # The temp document is gone; only the asset is left
+        assert os.listdir(tmp) == ["dot.svg"]
+
+        page = browser.new_page(viewport={"width": 100, "height": 100})
+        try:
+            _load_html(page, html, None, "images")
+            assert page.evaluate("document.images[0].naturalWidth") == 0
+        finally:
+            page.close()
+    print("PASS: base_dir resolves relative assets")
+
+
+def test_scales_set_output_dimensions():
+    """Test each device scale, switched through CDP after the first, sizes its capture."""
+    html = GraphicsBuilder().build_from_config(_BADGE, (300, 200))
+    exporter = _exporter()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = exporter.export_scales(
+                html, os.path.join(tmp, "post.png"), 300, 200, scales=(1, 2, 3, 1.5)
+            )
+            assert [os.path.basename(p) for p in paths] == [
+                "post.png", "post@2x.png", "post@3x.png", "post@1.5x.png",
+            ]
+            assert [_png_size(p) for p in paths] == [(300, 200), (600, 400), (900, 600), (450, 300)]
+    finally:
+        exporter.__exit__(None, None, None)
+    print("PASS: Multi-scale export sizes each capture")
+
+
+def test_sizes_set_output_dimensions():
+    """Test each viewport size of one responsive document sizes its capture."""
+    html = GraphicsBuilder().build_from_config(_BADGE, dimensions=None)
+    sizes = [(1080, 1080), (1200, 627), (400, 800)]
+    for scale in (1, 2):
+        exporter = _exporter(scale=scale)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                paths = exporter.export_sizes(html, os.path.join(tmp, "post.png"), sizes)
+                assert [os.path.basename(p) for p in paths] == [
+                    "post-1080x1080.png", "post-1200x627.png", "post-400x800.png",
+                ]
+                assert [_png_size(p) for p in paths] == [
+                    (w * scale, h * scale) for w, h in sizes
+                ]
+        finally:
+            exporter.__exit__(None, None, None)
+    print("PASS: Multi-size export sizes each capture")
+
+
+def test_encodings_at_scale():
+    """Test each encoding writes its format's bytes at the scaled pixel size."""
+    html = GraphicsBuilder().build_from_config(_BADGE, (300, 200))
+    carousel = Carousel([_BADGE, _BADGE], dimensions=(300, 200))
+    for options, magic in (
+        ({"format": "jpeg"}, lambda data: data[:3] == b"\xff\xd8\xff"),
+        ({"format": "webp"}, lambda data: data[:4] == b"RIFF" and data[8:12] == b"WEBP"),
+        ({"format": ImageFormat("webp", lossless=True)},
+         lambda data: data[:4] == b"RIFF" and data[8:12] == b"WEBP"),
+        ({"format": ImageFormat(compress_level=9)}, lambda data: data[:4] == b"\x89PNG"),
+    ):
+        exporter = _exporter(scale=2, **options)
+        try:
+            captures = [exporter.export_bytes(html, 300, 200)]
+            with tempfile.TemporaryDirectory() as tmp:
+                # Slides are clipped captures of one tall page
+                for path in exporter.export_carousel(carousel, tmp):
+                    with open(path, "rb") as f:
+                        captures.append(f.read())
+        finally:
+            exporter.__exit__(None, None, None)
+        for data in captures:
+            assert magic(data), (options, data[:12])
+            with Image.open(io.BytesIO(data)) as image:
+                assert image.size == (600, 400), (options, image.size)
+    print("PASS: Encodings write their format at the scaled size")
+
+
+def test_reuse_page_matches_fresh_pages():
+    """Test documents swapped into a warm page render like fresh loads, web fonts included."""
+    headline = {"components": [{"type": "headline", "content": {"text": "Fonts load first"}}]}
+    with _font_dir() as font_dir:
+        documents = [
+            GraphicsBuilder(Theme(font_family="serif")).build_from_config(headline, (600, 400)),
+            # Swapping in embedded fonts must wait for them, not draw the fallback
+            GraphicsBuilder(Theme(font_family="'Probe', serif"), font_dir=font_dir)
+            .build_from_config(headline, (600, 400)),
+            GraphicsBuilder(Theme(background="#101010")).build_from_config(headline, (600, 400)),
+        ]
+    rendered = {}
+    for reuse_page in (False, True):
+        exporter = _exporter(reuse_page=reuse_page)
+        try:
+            rendered[reuse_page] = [exporter.export_bytes(html, 600, 400) for html in documents]
+        finally:
+            exporter.__exit__(None, None, None)
+
+    for fresh, warm in zip(rendered[False], rendered[True]):
+        assert _mismatched(fresh, warm) <= 0.002
+    # A capture in the fallback face would have been caught
+    assert _mismatched(rendered[False][0], rendered[False][1]) > 0.01
+    print("PASS: reuse_page renders like fresh pages")
+
+
+def test_atlas_mixes_builder_and_raw_frames():
+    """Test an atlas of builder and raw HTML tiles settles each frame and captures it."""
+    raw = '<body style="margin: 0; background: #ff0000"></body>'
+    items = [("built", _BADGE), ("raw", raw), ("built-2", _BADGE)]
+    exporter = _exporter()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = exporter.export_atlas(items, tmp, (300, 200))
+            assert [_png_size(p) for p in paths] == [(300, 200)] * 3
+            with Image.open(paths[1]) as image:
+                assert image.convert("RGB").getpixel((150, 100)) == (255, 0, 0)
+            with Image.open(paths[0]) as image:
+                assert image.convert("RGB").getpixel((2, 2)) == (248, 248, 248)
+    finally:
+        exporter.__exit__(None, None, None)
+    print("PASS: Atlas settles builder and raw frames")
+
+
+def test_carousel_slides_and_pdf():
+    """Test carousel slides capture in order and print one slide-sized PDF page each."""
+    colors = [(255, 0, 0), (0, 128, 0), (0, 0, 255)]
+    carousel = Carousel([
+        {"theme": {"background": "#%02x%02x%02x" % color}, "components": _BADGE["components"]}
+        for color in colors
+    ], dimensions=(400, 500))
+    exporter = _exporter(scale=2)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = exporter.export_carousel(carousel, tmp, "post")
+            assert [os.path.basename(p) for p in paths] == ["post-1.png", "post-2.png", "post-3.png"]
+            for path, color in zip(paths, colors):
+                assert _png_size(path) == (800, 1000)
+                with Image.open(path) as image:
+                    image = image.convert("RGB")
+                    # Corners sit on the slide's own background, not a neighbour's
+                    assert image.getpixel((4, 4)) == color, path
+                    assert image.getpixel((795, 995)) == color, path
+
+            pdf = exporter.export_carousel_pdf(carousel, os.path.join(tmp, "deck.pdf"))
+            # 400 x 500 CSS pixels are 300 x 375 points
+            assert _pdf_pages(pdf) == [(300.0, 375.0)] * 3
+    finally:
+        exporter.__exit__(None, None, None)
+    print("PASS: Carousel slides and PDF pages match the slide size")
+
+
+def test_pdf_mixes_builder_and_raw_documents():
+    """Test a multi-document PDF of builder and raw HTML prints a page per document."""
+    documents = [
+        GraphicsBuilder().build_from_config(_BADGE, (400, 500)),
+        '<body style="margin: 0; background: #ff0000"><p>Raw</p></body>',
+        GraphicsBuilder().build_from_config(_BADGE, (400, 500)),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        exporter = _exporter()
+        try:
+            path = exporter.export_pdf(documents, os.path.join(tmp, "deck.pdf"), 400, 500)
+            assert _pdf_pages(path) == [(300.0, 375.0)] * 3
+        finally:
+            exporter.__exit__(None, None, None)
+
+        # html_to_pdf runs its own Playwright, so only once the exporter's has stopped
+        html_to_pdf(documents[:2], os.path.join(tmp, "pair.pdf"), width=400, height=500)
+        assert _pdf_pages(os.path.join(tmp, "pair.pdf")) == [(300.0, 375.0)] * 2
+    print("PASS: Multi-document PDFs settle builder and raw documents")
+
+
+def test_async_exporter_batch():
+    """Test AsyncPNGExporter renders a concurrent batch in input order."""
+    async def scenario(tmp):
+        exporter = AsyncPNGExporter(concurrency=2)
+        try:
+            await exporter.__aenter__()
+        except Exception as e:
+            _unavailable(e)
+        try:
+            items = [(f"post-{i}", _BADGE) for i in range(3)]
+            return await exporter.export_batch(items, tmp, (300, 200))
+        finally:
+            await exporter.__aexit__(None, None, None)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = asyncio.run(scenario(tmp))
+        assert [os.path.basename(p) for p in paths] == ["post-0.png", "post-1.png", "post-2.png"]
+        assert [_png_size(p) for p in paths] == [(300, 200)] * 3
+    print("PASS: AsyncPNGExporter renders a batch")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("OPENFIGMA BROWSER TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        test_base_dir_resolves_relative_assets,
+        test_scales_set_output_dimensions,
+        test_sizes_set_output_dimensions,
+        test_encodings_at_scale,
+        test_reuse_page_matches_fresh_pages,
+        test_atlas_mixes_builder_and_raw_frames,
+        test_carousel_slides_and_pdf,
+        test_pdf_mixes_builder_and_raw_documents,
+        test_async_exporter_batch,
+    ]
+
+    passed = 0
+    failed = 0
+    skipped = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except unittest.SkipTest as e:
+            print(f"SKIP: {test.__name__} - {e}")
+            skipped += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__} - {e}")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed, {skipped} skipped")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
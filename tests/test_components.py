@@ -4,10 +4,17 @@ Comprehensive test suite for openfigma components.
 Tests edge cases, error handling, and output correctness.
 """
 
+import os
+import re
 import sys
+import tempfile
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, '..')
 
 from openfigma import GraphicsBuilder, Theme, dark_theme, linkedin_theme, HeroIcons
+from openfigma import register_component, unregister_component, registered_components
+from openfigma import render
 
 
 def test_empty_config():
@@ -208,6 +215,218 @@ def test_positioned_logo_positions():
     print("PASS: All logo positions work correctly")
 
 
+def test_embedded_fonts():
+    """Test local font files are embedded instead of linking Google Fonts."""
+    with tempfile.TemporaryDirectory() as font_dir:
+        for name in [
+            "Inter-Regular.woff2", "Inter-Light.woff2", "Inter-ExtraBold.woff2",
+            "Inter-Italic.woff2", "Roboto-Regular.woff2",
+        ]:
+            with open(os.path.join(font_dir, name), "wb") as f:
+                f.write(b"wOF2 fake font data")
+
+        builder = GraphicsBuilder(font_dir=font_dir)
+        html = builder.build_from_config({"components": []})
+        assert "fonts.googleapis.com" not in html
+        assert "data:font/woff2;base64," in html
+        assert "font-weight: 800;" in html
+        # Only the theme's family, weights and styles are embedded
+        assert html.count("@font-face") == 2
+        assert "font-weight: 300;" not in html and "font-style: italic;" not in html
+        assert "'Roboto'" not in html
+
+        # Themes switching family pick up that family's files
+        html = builder.build_from_config({"theme": {"font_family": "'Roboto', sans-serif"}})
+        assert html.count("@font-face") == 1 and "'Roboto'" in html
+
+    # Without local fonts, Google Fonts is linked unless turned off
+    html = GraphicsBuilder().build_from_config({"components": []})
+    assert "fonts.googleapis.com" in html
+    html = GraphicsBuilder(remote_fonts=False).build_from_config({"components": []})
+    assert "fonts.googleapis.com" not in html
+
+    print("PASS: Local fonts embedded as @font-face")
+
+
+def test_css_cache():
+    """Test the static sheet is compiled once and re-theming only changes variables."""
+    GraphicsBuilder.css_cache_clear()
+    theme = Theme()
+    builder = GraphicsBuilder(theme)
+    config = {"components": [{"type": "badge", "content": {"text": "Test"}}]}
+
+    html1 = builder.build_from_config(config, dimensions=(1080, 1080))
+    html2 = GraphicsBuilder(Theme()).build_from_config(config, dimensions=(1080, 1080))
+    assert html1 == html2
+    info = GraphicsBuilder.css_cache_info()
+    assert (info["static"]["hits"], info["static"]["misses"]) == (1, 1)
+    # An equal theme reuses the compiled theme block too
+    assert (info["theme"]["hits"], info["theme"]["misses"]) == (1, 1)
+
+    theme.accent = "#123456"
+    html3 = builder.build_from_config(config, dimensions=(1080, 1080))
+    assert "--accent: #123456;" in html3
+    assert "var(--accent)" in html3
+
+    builder.build_from_config(config, dimensions=(1080, 1350))
+    builder.build_from_config(config, dimensions=(1080, 1350))
+    info = GraphicsBuilder.css_cache_info()
+    assert info["static"]["misses"] == 1
+    assert (info["theme"]["hits"], info["theme"]["misses"]) == (2, 3)
+    print("PASS: CSS cache hits and invalidates correctly")
+
+
+def test_css_tree_shaking():
+    """Test only CSS for used component types is emitted."""
+    config = {"components": [{"type": "badge", "content": {"text": "Test"}}]}
+
+    html = GraphicsBuilder().build_from_config(config)
+    assert ".badge {" in html
+    assert ".quote-card {" not in html
+    assert ".timeline {" not in html
+    assert "body {" in html
+
+    full = GraphicsBuilder(full_css=True).build_from_config(config)
+    assert ".quote-card {" in full
+    assert ".timeline {" in full
+    assert len(full) > len(html)
+    print("PASS: CSS tree-shaking keeps only used components")
+
+
+def test_custom_component_registry():
+    """Test third-party components can be registered with their own CSS."""
+    register_component(
+        "chip",
+        lambda text, theme: f'<span class="chip">{text}</span>',
+        lambda content, theme: (content.get("text", ""), theme),
+        css=".chip {{ color: {t.accent}; }}",
+    )
+    try:
+        assert "chip" in registered_components()
+        html = GraphicsBuilder(Theme(accent="#abcdef")).build_from_config(
+            {"components": [{"type": "chip", "content": {"text": "Custom"}}]}
+        )
+        assert '<span class="chip">Custom</span>' in html
+        assert ".chip { color: var(--accent); }" in html
+        assert "--accent: #abcdef;" in html
+
+        try:
+            register_component("chip", lambda content, theme: "")
+            assert False, "Duplicate registration should raise"
+        except ValueError:
+            pass
+    finally:
+        unregister_component("chip")
+
+    assert "chip" not in registered_components()
+    print("PASS: Custom components register and render")
+
+
+def test_unknown_component_policy():
+    """Test unknown component types can warn or fail fast."""
+    config = {"components": [{"type": "not_a_component", "content": {}}]}
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        GraphicsBuilder(unknown_components="warn").build_from_config(config)
+    assert len(caught) == 1
+    assert "not_a_component" in str(caught[0].message)
+
+    try:
+        GraphicsBuilder(unknown_components="raise").build_from_config(config)
+        assert False, "Unknown component should raise"
+    except ValueError as e:
+        assert "not_a_component" in str(e)
+
+    print("PASS: Unknown component policy warns or raises")
+
+
+def test_theme_override_does_not_leak():
+    """Test config theme overrides apply per call and leave the builder alone."""
+    theme = Theme()
+    builder = GraphicsBuilder(theme)
+    config = {"components": [{"type": "badge", "content": {"text": "Test"}}]}
+
+    html1 = builder.build_from_config({**config, "theme": {"accent": "#ff0000", "nope": 1}})
+    assert "#ff0000" in html1
+    assert theme.accent == "#6366f1"
+
+    html2 = builder.build_from_config(config)
+    assert "#ff0000" not in html2
+    print("PASS: Theme overrides do not leak across calls")
+
+
+def test_concurrent_builds_isolated():
+    """Test concurrent builds with different themes never cross-contaminate."""
+    builder = GraphicsBuilder()
+    count = 2000
+
+    def build(i):
+        accent = f"#ab{i:04x}"
+        config = {"components": [{"type": "badge", "content": {"text": f"job-{i}"}}]}
+        if i % 3 == 0:
+            html = builder.build_from_config(config, (1080, 1080), Theme(accent=accent))
+        elif i % 3 == 1:
+            html = builder.build_from_config({**config, "theme": {"accent": accent}}, (1080, 1080))
+        else:
+            html = render(config, Theme(accent=accent), (1080, 1080))
+        return i, html
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # force frequent thread switches
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(build, range(count)))
+    finally:
+        sys.setswitchinterval(interval)
+
+    for i, html in results:
+        assert set(re.findall(r"#ab[0-9a-f]{4}", html)) == {f"#ab{i:04x}"}
+        assert set(re.findall(r"job-\d+", html)) == {f"job-{i}"}
+    assert builder.theme.accent == Theme().accent
+    print(f"PASS: {count} concurrent builds stayed isolated")
+
+
+def test_responsive_css():
+    """Test dimensions=None emits a canvas that fills the viewport."""
+    builder = GraphicsBuilder()
+    config = {"components": [{"type": "badge", "content": {"text": "Test"}}]}
+
+    fixed = builder.build_from_config(config, (1080, 1350))
+    assert "width: 1080px;" in fixed and "height: 1350px;" in fixed
+
+    responsive = builder.build_from_config(config, None)
+    assert "width: 100vw;" in responsive and "height: 100vh;" in responsive
+    assert "1080px" not in responsive
+    print("PASS: Responsive CSS is dimension-independent")
+
+
+def test_carousel_document():
+    """Test carousels share one stylesheet and scope slide theme overrides."""
+    builder = GraphicsBuilder(linkedin_theme("#8b5cf6"))
+    slides = [
+        {"components": [{"type": "badge", "content": {"text": "Cover"}}]},
+        {"theme": {"accent": "#ff0000"},
+         "components": [{"type": "headline", "content": {"text": "Slide"}}]},
+        {"components": [{"type": "badge", "content": {"text": "End"}}]},
+    ]
+    html = builder.build_carousel(slides, (1080, 1350))
+
+    assert html.count('<section class="slide"') == 3
+    assert 'id="slide-3"' in html
+    assert html.count("/* Badge") == 1 and "/* Headline" in html
+    assert ".slide {\n      font-family: var(--font-family);" in html
+    assert "body {" not in html
+    assert "--accent: #8b5cf6;" in html
+    assert re.search(r"#slide-2 \{[^}]*--accent: #ff0000;", html)
+    assert "@page { size: 1080px 1350px; margin: 0; }" in html
+
+    # Single graphics keep body as the canvas
+    single = builder.build_from_config(slides[0], (1080, 1350))
+    assert "body {\n      font-family" in single and ".slide" not in single
+    print("PASS: Carousel documents share one stylesheet")
+
+
 def run_all_tests():
     """Run all tests."""
     print("=" * 60)
@@ -228,6 +447,15 @@ def run_all_tests():
         test_grid_styles,
         test_hero_icons,
         test_positioned_logo_positions,
+        test_embedded_fonts,
+        test_css_cache,
+        test_css_tree_shaking,
+        test_custom_component_registry,
+        test_unknown_component_policy,
+        test_theme_override_does_not_leak,
+        test_concurrent_builds_isolated,
+        test_responsive_css,
+        test_carousel_document,
     ]
 
     passed = 0
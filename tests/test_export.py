@@ -0,0 +1,825 @@
+#!/usr/bin/env python3
+"""
+Test suite for export helpers that run without a browser.
+
+Render paths run against _FakeBrowser, which records what the helpers ask
+of Playwright; test_browser.py covers the same paths in real Chromium.
+"""
+
+import asyncio
+import base64
+import io
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, '..')
+
+from openfigma import (
+    AsyncPNGExporter, Carousel, GraphicsBuilder, ImageFormat, PNGExporter, RenderCache, html_to_pdf, html_to_png,
+)
+from openfigma.export import (
+    _FRAME_READY_SCRIPTS, _SWAP_SCRIPT, _RenderPool, _atlas_html, _atlas_layout, _pages_html,
+    _capture, _capture_params, _ready_steps, _render_atlas, _render_page, _render_pdf,
+    _swap_ready_steps, _transcode, _warm,
+)
+
+
+class _FakePage:
+    """Just enough of a Playwright page for the render helpers."""
+
+    def __init__(self, viewport: dict, device_scale_factor: float = 1):
+        self.viewport_size = dict(viewport)
+        self.scale = device_scale_factor
+        self.content = None
+        self.url = None
+        self.calls = []
+        self.closed = False
+
+    def set_content(self, html):
+        self.content = html
+
+    def goto(self, url):
+        self.url = url
+        self.content = Path(url[len("file://"):]).read_text(encoding="utf-8")
+
+    def evaluate(self, script, arg=None):
+        self.calls.append(("evaluate", script, arg))
+        if script == _SWAP_SCRIPT:
+            self.content = arg
+        return True
+
+    def wait_for_function(self, script, arg=None):
+        self.calls.append(("wait_for_function", script, arg))
+        return True
+
+    def wait_for_load_state(self, state):
+        self.calls.append(("wait_for_load_state", state, None))
+
+    def set_viewport_size(self, size):
+        self.viewport_size = dict(size)
+
+    def screenshot(self, path=None, type="png", quality=None, clip=None):
+        if "boom" in self.content:
+            raise RuntimeError("render failed")
+        # Vary timing so pooled renders finish out of order
+        time.sleep(0.001 * (len(self.content) % 4))
+        data = f"{self.content}@{self.scale}".encode()
+        if path:
+            with open(path, "wb") as f:
+                f.write(data)
+        return data
+
+    def pdf(self, path=None, **options):
+        data = f"%PDF-{self.content}".encode()
+        if path:
+            with open(path, "wb") as f:
+                f.write(data)
+        return data
+
+    def close(self):
+        self.closed = True
+
+    def is_closed(self):
+        return self.closed
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.pages = []
+        self.connected = True
+
+    def new_page(self, viewport, device_scale_factor=1):
+        page = _FakePage(viewport, device_scale_factor)
+        self.pages.append(page)
+        return page
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.connected = False
+
+
+class _FakeCDPSession:
+    """Records CDP commands and answers captureScreenshot with fake WebP bytes."""
+
+    def __init__(self):
+        self.sent = []
+        self.detached = False
+
+    def send(self, method, params=None):
+        self.sent.append((method, params))
+        return {"data": base64.b64encode(b"RIFF\0\0\0\0WEBPfake").decode()}
+
+    def detach(self):
+        self.detached = True
+
+
+class _FakeCapturePage:
+    """A loaded page whose screenshots are a real PNG of a small gradient."""
+
+    def __init__(self):
+        self.session = _FakeCDPSession()
+        self.context = self
+        self.screenshots = []
+
+    def new_cdp_session(self, page):
+        return self.session
+
+    def screenshot(self, path=None, type="png", quality=None, clip=None):
+        from PIL import Image
+        self.screenshots.append({"type": type, "quality": quality, "clip": clip})
+        image = Image.new("RGB", (40, 30))
+        image.putdata([(x * 6, y * 8, 128) for y in range(30) for x in range(40)])
+        out = io.BytesIO()
+        image.save(out, "PNG")
+        return out.getvalue()
+
+
+class _FakeAsyncPage:
+    """Async counterpart of _FakePage; data-delay="N" holds the capture N ticks."""
+
+    def __init__(self, browser, viewport: dict, device_scale_factor: float = 1):
+        self.browser = browser
+        self.viewport_size = dict(viewport)
+        self.scale = device_scale_factor
+        self.content = None
+
+    async def set_content(self, html):
+        self.content = html
+
+    async def evaluate(self, script, arg=None):
+        return True
+
+    async def wait_for_function(self, script, arg=None):
+        return True
+
+    async def screenshot(self, path=None, type="png", quality=None, clip=None):
+        delay = re.search(r'data-delay="(\d+)"', self.content)
+        await asyncio.sleep(0.01 * int(delay.group(1)) if delay else 0)
+        if "boom" in self.content:
+            raise RuntimeError("render failed")
+        data = f"{self.content}@{self.scale}".encode()
+        if path:
+            with open(path, "wb") as f:
+                f.write(data)
+        return data
+
+    async def close(self):
+        self.browser.open_pages -= 1
+
+
+class _FakeAsyncBrowser:
+    def __init__(self):
+        self.pages = []
+        self.open_pages = 0
+        self.peak_pages = 0
+
+    async def new_page(self, viewport, device_scale_factor=1):
+        page = _FakeAsyncPage(self, viewport, device_scale_factor)
+        self.pages.append(page)
+        self.open_pages += 1
+        self.peak_pages = max(self.peak_pages, self.open_pages)
+        return page
+
+
+def _async_exporter(concurrency=8, **kwargs) -> AsyncPNGExporter:
+    """An AsyncPNGExporter over one fake browser; call inside the event loop."""
+    exporter = AsyncPNGExporter(concurrency=concurrency, **kwargs)
+    exporter._browsers = [_FakeAsyncBrowser()]
+    exporter._semaphore = asyncio.Semaphore(concurrency)
+    return exporter
+
+
+class _FakePool(_RenderPool):
+    """A render pool whose workers drive fake browsers."""
+
+    def __init__(self, size, max_pages=None):
+        self.browsers = []
+        super().__init__(size, max_pages)
+
+    def _start(self):
+        return None
+
+    def _launch(self, playwright):
+        browser = _FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+def test_cache_key_stable():
+    """Test cache keys depend only on render inputs."""
+    key = RenderCache.key("<p>x</p>", 400, 300)
+    assert key == RenderCache.key("<p>x</p>", 400, 300)
+    assert key != RenderCache.key("<p>y</p>", 400, 300)
+    assert key != RenderCache.key("<p>x</p>", 400, 301)
+    assert key != RenderCache.key("<p>x</p>", 400, 300, scale=2)
+    assert key != RenderCache.key("<p>x</p>", 400, 300, format="jpeg")
+    # Relative assets resolve against base_dir, so it is part of the key
+    with tempfile.TemporaryDirectory() as tmp:
+        in_dir = RenderCache.key("<p>x</p>", 400, 300, base_dir=tmp)
+        assert in_dir not in (key, RenderCache.key("<p>x</p>", 400, 300, base_dir=os.getcwd()))
+        assert in_dir == RenderCache.key("<p>x</p>", 400, 300, base_dir=os.path.relpath(tmp))
+    print("PASS: Cache keys are stable and input-sensitive")
+
+
+def test_cache_memory_lru():
+    """Test memory tier evicts least recently used entries."""
+    cache = RenderCache(max_memory_bytes=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"  # a is now most recent
+    cache.put("c", b"cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.stats["misses"] == 1
+    print("PASS: Memory tier LRU eviction works")
+
+
+def test_cache_disk_tier():
+    """Test disk tier persists across instances and respects its budget."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RenderCache(disk_dir=tmp, max_disk_bytes=10)
+        cache.put("a", b"aaaa")
+        os.utime(os.path.join(tmp, "a.bin"), (1, 1))
+        cache.put("b", b"bbbb")
+        cache.put("c", b"cccc")  # over budget, evicts oldest file
+
+        fresh = RenderCache(disk_dir=tmp, max_disk_bytes=10)
+        assert fresh.get("a") is None
+        assert fresh.get("c") == b"cccc"
+        assert fresh.stats["disk_hits"] == 1
+    print("PASS: Disk tier persists and evicts by size")
+
+
+def test_html_to_png_cache_hit_skips_browser():
+    """Test a cache hit is served without launching a browser."""
+    html = "<html><body>cached</body></html>"
+    cache = RenderCache()
+    cache.put(RenderCache.key(html, 400, 300), b"\x89PNG fake")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "out.png")
+        png = html_to_png(html, output_path, width=400, height=300, cache=cache)
+        assert png == b"\x89PNG fake"
+        with open(output_path, "rb") as f:
+            assert f.read() == png
+
+        # A render from another base_dir is not the same render
+        cache.put(RenderCache.key(html, 400, 300, base_dir=tmp), b"\x89PNG in tmp")
+        png = html_to_png(html, width=400, height=300, cache=cache, base_dir=tmp)
+        assert png == b"\x89PNG in tmp"
+        exporter = PNGExporter(cache=cache, base_dir=tmp)
+        exporter._browser = _FakeBrowser()
+        assert exporter.export_bytes(html, 400, 300) == b"\x89PNG in tmp"
+        assert exporter._browser.pages == []
+        with tempfile.TemporaryDirectory() as other:
+            exporter.base_dir = other
+            assert exporter.export_bytes(html, 400, 300) != b"\x89PNG in tmp"
+        assert len(exporter._browser.pages) == 1
+    print("PASS: Cache hits skip the browser")
+
+
+def test_ready_strategies():
+    """Test readiness strategy resolution."""
+    html = GraphicsBuilder().build_from_config({"components": []})
+    assert "window.__openfigmaReady = true" in html
+    assert _ready_steps(html, "auto") == ["flag"]
+    assert _ready_steps("<p>plain</p>", "auto") == ["fonts"]
+    assert _ready_steps(html, ["fonts", "images"]) == ["fonts", "images"]
+    assert _ready_steps(html, "none") == []
+
+    try:
+        _ready_steps(html, "sometime")
+        assert False, "Unknown strategy should raise"
+    except ValueError:
+        pass
+
+    # Swapped-in content never runs the flag script
+    assert _swap_ready_steps(html, "auto") == ["fonts", "images"]
+    assert _swap_ready_steps(html, ["flag", "images"]) == ["fonts", "images"]
+    assert _swap_ready_steps("<p>plain</p>", "auto") == ["fonts"]
+    print("PASS: Readiness strategies resolve correctly")
+
+
+def test_set_content_writes_no_temp_file():
+    """Test documents load from memory unless base_dir asks for a file."""
+    browser = _FakeBrowser()
+
+    def refuse(*args, **kwargs):
+        raise AssertionError("The set_content path wrote a temp file")
+
+    original = tempfile.NamedTemporaryFile
+    tempfile.NamedTemporaryFile = refuse
+    try:
+        _render_page(browser, "<p>inline</p>", 400, 300, ready="none")
+    finally:
+        tempfile.NamedTemporaryFile = original
+    page = browser.pages[0]
+    assert page.content == "<p>inline</p>" and page.url is None and page.closed
+
+    # base_dir loads from a temp file in that directory, removed afterwards
+    with tempfile.TemporaryDirectory() as tmp:
+        _render_page(browser, "<p>file</p>", 400, 300, base_dir=tmp, ready="none")
+        page = browser.pages[1]
+        assert page.url.startswith(Path(tmp).as_uri() + "/")
+        assert page.content == "<p>file</p>"
+        assert os.listdir(tmp) == []
+    print("PASS: set_content path writes no temp file")
+
+
+def test_export_stream_is_lazy():
+    """Test export_stream reads items on demand and yields in order."""
+    cache = RenderCache()
+    for i in range(5):
+        cache.put(RenderCache.key(f"<p>{i}</p>", 400, 300), f"png-{i}".encode())
+
+    read = []
+
+    def items():
+        for i in range(5):
+            read.append(i)
+            yield f"item-{i}", f"<p>{i}</p>" if i != 2 else None
+
+    exporter = PNGExporter(cache=cache)
+    exporter._browser = object()  # every render below is a cache hit
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stream = exporter.export_stream(items(), tmp, dimensions=(400, 300))
+        name, path = next(stream)
+        assert name == "item-0" and read == [0]
+        with open(path, "rb") as f:
+            assert f.read() == b"png-0"
+
+        rest = list(stream)
+        assert [name for name, _ in rest] == ["item-1", "item-2", "item-3", "item-4"]
+        assert isinstance(rest[1][1], Exception)
+        assert os.path.exists(os.path.join(tmp, "item-4.png"))
+
+        # Bad limits raise on the call, before any item is read
+        read.clear()
+        for max_in_flight in (0, -1):
+            for call in (
+                lambda: exporter.export_stream(items(), tmp, (400, 300), max_in_flight),
+                lambda: exporter.iter_bytes(items(), (400, 300), max_in_flight),
+            ):
+                try:
+                    call()
+                    assert False, f"max_in_flight={max_in_flight} should raise"
+                except ValueError:
+                    pass
+        assert read == []
+    print("PASS: export_stream streams lazily in order")
+
+
+def test_export_bytes_without_disk():
+    """Test bytes APIs return buffers without writing files."""
+    cache = RenderCache()
+    for i in range(3):
+        cache.put(RenderCache.key(f"<p>{i}</p>", 400, 300), f"png-{i}".encode())
+
+    exporter = PNGExporter(cache=cache)
+    exporter._browser = object()  # every render below is a cache hit
+
+    assert exporter.export_bytes("<p>0</p>", 400, 300) == b"png-0"
+    view = exporter.export_bytes("<p>1</p>", 400, 300, as_memoryview=True)
+    assert isinstance(view, memoryview) and view.tobytes() == b"png-1"
+
+    items = ((f"item-{i}", f"<p>{i}</p>") for i in range(3))
+    assert list(exporter.iter_bytes(items, dimensions=(400, 300))) == [
+        ("item-0", b"png-0"), ("item-1", b"png-1"), ("item-2", b"png-2"),
+    ]
+    print("PASS: Bytes exports skip the filesystem")
+
+
+def test_image_formats():
+    """Test image format validation, cache tags and file extensions."""
+    assert ImageFormat().cache_tag == "png"
+    assert ImageFormat("jpg").format == "jpeg"
+    assert ImageFormat("jpeg").cache_tag == ImageFormat("jpeg", quality=90).cache_tag
+    assert ImageFormat("webp", quality=60).cache_tag != ImageFormat("webp").cache_tag
+    assert ImageFormat("webp", lossless=True).extension == ".webp"
+
+    for bad in [
+        {"format": "gif"},
+        {"format": "png", "quality": 80},
+        {"format": "jpeg", "quality": 101},
+        {"format": "jpeg", "lossless": True},
+        {"format": "webp", "compress_level": 6},
+    ]:
+        try:
+            ImageFormat(**bad)
+            assert False, f"{bad} should raise"
+        except ValueError:
+            pass
+
+    html = "<p>jpeg</p>"
+    cache = RenderCache()
+    cache.put(RenderCache.key(html, 400, 300, format="jpeg:q75"), b"jpeg-bytes")
+    exporter = PNGExporter(cache=cache, format="jpeg", quality=75)
+    exporter._browser = object()  # served from the cache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        [(name, path)] = exporter.export_stream([("post", html)], tmp, (400, 300))
+        assert path == os.path.join(tmp, "post.jpg")
+        assert html_to_png(html, width=400, height=300, cache=cache,
+                           format="jpeg", quality=75) == b"jpeg-bytes"
+    print("PASS: Image formats validate and key the cache")
+
+
+def test_capture_encodings():
+    """Test WebP goes through CDP with the clip, and Pillow re-encodes losslessly."""
+    from PIL import Image
+
+    clip = {"x": 0, "y": 300, "width": 400, "height": 300}
+    assert _capture_params(ImageFormat("webp")) == {"format": "webp", "quality": 80}
+    # The clip scale is relative to the page's device scale factor, so it stays 1
+    assert _capture_params(ImageFormat("webp", quality=60), clip) == {
+        "format": "webp", "quality": 60, "clip": {**clip, "scale": 1},
+    }
+
+    page = _FakeCapturePage()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "slide.webp")
+        data = _capture(page, ImageFormat("webp", quality=60), path, clip)
+        assert data.startswith(b"RIFF") and data[8:12] == b"WEBP"
+        with open(path, "rb") as f:
+            assert f.read() == data
+    assert page.session.sent == [("Page.captureScreenshot", _capture_params(
+        ImageFormat("webp", quality=60), clip
+    ))]
+    assert page.session.detached and page.screenshots == []
+
+    source = page.screenshot()
+    with Image.open(io.BytesIO(source)) as image:
+        pixels = image.convert("RGB").tobytes()
+
+    lossless = _transcode(source, ImageFormat("webp", lossless=True))
+    with Image.open(io.BytesIO(lossless)) as image:
+        assert image.format == "WEBP" and image.size == (40, 30)
+        assert image.convert("RGB").tobytes() == pixels
+
+    sizes = {}
+    for level in (0, 9):
+        encoded = _transcode(source, ImageFormat(compress_level=level))
+        with Image.open(io.BytesIO(encoded)) as image:
+            assert image.format == "PNG"
+            assert image.convert("RGB").tobytes() == pixels
+        sizes[level] = len(encoded)
+    assert sizes[9] < sizes[0]
+
+    # Pillow encodings start from a PNG capture of the same clip
+    page.screenshots.clear()
+    data = _capture(page, ImageFormat(compress_level=9), clip=clip)
+    assert data == _transcode(source, ImageFormat(compress_level=9))
+    assert page.screenshots == [{"type": "png", "quality": None, "clip": clip}]
+    print("PASS: Captures encode WebP through CDP and re-encode with Pillow")
+
+
+def test_multi_scale_export():
+    """Test multi-scale exports name files by scale and key the cache by scale."""
+    html = "<p>retina</p>"
+    cache = RenderCache()
+    for scale in (1, 2, 3):
+        cache.put(RenderCache.key(html, 400, 300, scale=scale), f"{scale}x".encode())
+
+    exporter = PNGExporter(cache=cache)
+    exporter._browser = object()  # served from the cache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = exporter.export_scales(html, os.path.join(tmp, "post.png"), 400, 300)
+        assert [os.path.basename(p) for p in paths] == ["post.png", "post@2x.png", "post@3x.png"]
+        with open(paths[1], "rb") as f:
+            assert f.read() == b"2x"
+
+        [item_paths] = exporter.export_batch([("item", html)], tmp, (400, 300), scales=(1, 2))
+        assert [os.path.basename(p) for p in item_paths] == ["item.png", "item@2x.png"]
+
+    try:
+        PNGExporter(scale=0)
+        assert False, "scale=0 should raise"
+    except ValueError:
+        pass
+    print("PASS: Multi-scale exports are named and cached per scale")
+
+
+def test_multi_size_export():
+    """Test multi-size exports name files by size and build responsive HTML."""
+    config = {"components": [{"type": "badge", "content": {"text": "Sizes"}}]}
+    html = GraphicsBuilder().build_from_config(config, None)
+    sizes = [(1080, 1080), (1200, 627)]
+    cache = RenderCache()
+    for width, height in sizes:
+        cache.put(RenderCache.key(html, width, height), f"{width}x{height}".encode())
+
+    exporter = PNGExporter(cache=cache)
+    exporter._browser = object()  # served from the cache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        [paths] = exporter.export_batch([("post", config)], tmp, sizes=sizes)
+        assert [os.path.basename(p) for p in paths] == ["post-1080x1080.png", "post-1200x627.png"]
+        with open(paths[1], "rb") as f:
+            assert f.read() == b"1200x627"
+
+        try:
+            exporter.export_batch([("post", config)], tmp, sizes=sizes, scales=(1, 2))
+            assert False, "sizes with scales should raise"
+        except ValueError:
+            pass
+    print("PASS: Multi-size exports share one responsive document")
+
+
+def test_atlas_export():
+    """Test atlas exports lay tiles out on a grid and return paths in order."""
+    clips, width, height = _atlas_layout(5, 400, 300)
+    assert (width, height) == (1200, 600)
+    assert clips[4] == {"x": 400, "y": 300, "width": 400, "height": 300}
+
+    page = _atlas_html(['<p class="a">"quoted"</p>', "<p>b</p>"], clips)
+    assert page.count("<iframe") == 2
+    assert 'srcdoc="&lt;p class=&quot;a&quot;&gt;' in page
+
+    cache = RenderCache()
+    for i in range(5):
+        cache.put(RenderCache.key(f"<p>{i}</p>", 400, 300), f"png-{i}".encode())
+
+    exporter = PNGExporter(cache=cache)
+    exporter._browser = object()  # every tile is a cache hit
+
+    items = [(f"item-{i}", f"<p>{i}</p>") for i in range(5)]
+    items.insert(2, ("broken", {"components": None}))
+    with tempfile.TemporaryDirectory() as tmp:
+        results = exporter.export_atlas(items, tmp, (400, 300), tiles_per_page=2,
+                                        return_exceptions=True)
+        assert isinstance(results[2], Exception)
+        paths = results[:2] + results[3:]
+        assert [os.path.basename(p) for p in paths] == [f"item-{i}.png" for i in range(5)]
+        with open(paths[3], "rb") as f:
+            assert f.read() == b"png-3"
+
+    # Each frame gets its own readiness: the flag only where the document
+    # sets it, fonts for raw HTML
+    builder_html = GraphicsBuilder().build_from_config({"components": []}, (400, 300))
+    browser = _FakeBrowser()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"tile-{i}.png") for i in range(3)]
+        _render_atlas(browser, [builder_html, "<p>raw</p>", builder_html], paths, 400, 300)
+        assert all(os.path.exists(path) for path in paths)
+    assert browser.pages[0].calls == [
+        ("wait_for_function", _FRAME_READY_SCRIPTS["flag"], [0, 2]),
+        ("evaluate", _FRAME_READY_SCRIPTS["fonts"], [1]),
+    ]
+    print("PASS: Atlas exports tile graphics and keep input order")
+
+
+def test_carousel_export():
+    """Test carousel slides are named in order and cached per slide."""
+    carousel = Carousel([
+        {"components": [{"type": "badge", "content": {"text": f"Slide {i}"}}]}
+        for i in range(1, 4)
+    ], dimensions=(400, 500))
+    assert len(carousel.add_slide({"components": []})) == 4
+
+    html = carousel.to_html()
+    cache = RenderCache()
+    for i in range(1, 5):
+        cache.put(RenderCache.key(html, 400, 500, format=f"png:slide-{i}"), f"slide-{i}".encode())
+
+    exporter = PNGExporter(cache=cache)
+    exporter._browser = object()  # every slide is a cache hit
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = carousel.export(tmp, "post", exporter=exporter)
+        assert [os.path.basename(p) for p in paths] == [f"post-{i}.png" for i in range(1, 5)]
+        with open(paths[2], "rb") as f:
+            assert f.read() == b"slide-3"
+    print("PASS: Carousel slides export in order")
+
+
+def test_pdf_export():
+    """Test PDF exports size pages to the graphic and key the cache by page count."""
+    pages = _pages_html(["<p>1</p>", "<p>2</p>"], 400, 500)
+    assert "@page { size: 400px 500px; margin: 0; }" in pages
+    assert pages.count("<iframe") == 2
+
+    cache = RenderCache()
+    cache.put(RenderCache.key("<p>1</p>", 400, 500, format="pdf:1"), b"%PDF-one")
+    cache.put(RenderCache.key(pages, 400, 500, format="pdf:2"), b"%PDF-two")
+    assert html_to_pdf("<p>1</p>", width=400, height=500, cache=cache) == b"%PDF-one"
+    assert html_to_pdf(["<p>1</p>", "<p>2</p>"], width=400, height=500, cache=cache) == b"%PDF-two"
+
+    exporter = PNGExporter(cache=cache)
+    exporter._browser = object()  # served from the cache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = exporter.export_pdf(["<p>1</p>", "<p>2</p>"], os.path.join(tmp, "deck.pdf"), 400, 500)
+        with open(path, "rb") as f:
+            assert f.read() == b"%PDF-two"
+
+        results = exporter.export_pdf_batch(
+            [("one", "<p>1</p>"), ("broken", {"components": None})], tmp, (400, 500),
+            return_exceptions=True,
+        )
+        assert results[0] == os.path.join(tmp, "one.pdf")
+        assert isinstance(results[1], Exception)
+
+    # Multi-document PDFs settle each framed document on its own terms
+    builder_html = GraphicsBuilder().build_from_config({"components": []}, (400, 500))
+    browser = _FakeBrowser()
+    pdf = _render_pdf(browser, ["<p>raw</p>", builder_html], 400, 500)
+    assert pdf.startswith(b"%PDF-") and b"<iframe" in pdf
+    assert browser.pages[0].calls == [
+        ("evaluate", _FRAME_READY_SCRIPTS["fonts"], [0]),
+        ("wait_for_function", _FRAME_READY_SCRIPTS["flag"], [1]),
+    ]
+    print("PASS: PDF exports are page-sized and cached")
+
+
+def test_render_pool_concurrency():
+    """Test pooled renders keep input order, isolate failures and shut down cleanly."""
+    pool = _FakePool(3)
+    exporter = PNGExporter(workers=3)
+    exporter._pool = pool
+
+    items = [(f"item-{i}", f"<p>{i}</p>") for i in range(8)]
+    items[3] = ("item-3", "<p>boom</p>")
+    with tempfile.TemporaryDirectory() as tmp:
+        results = exporter.export_batch(items, tmp, (400, 300), return_exceptions=True)
+        assert isinstance(results[3], RuntimeError)
+        for i in (0, 1, 2, 4, 5, 6, 7):
+            assert results[i] == os.path.join(tmp, f"item-{i}.png")
+            with open(results[i], "rb") as f:
+                assert f.read() == f"<p>{i}</p>@1.0".encode()
+
+        try:
+            exporter.export_batch(items, tmp, (400, 300))
+            assert False, "A failed item should raise without return_exceptions"
+        except RuntimeError:
+            pass
+
+        # Single exports run on the pool too, never on a browser of their own
+        path = exporter.export("<p>single</p>", os.path.join(tmp, "single.png"), 400, 300)
+        assert os.path.exists(path) and exporter._browser is None
+        assert exporter.export_bytes("<p>bytes</p>", 400, 300) == b"<p>bytes</p>@1.0"
+    assert pool.stats["failed"] >= 2 and pool.stats["launches"] == 3
+
+    exporter.__exit__(None, None, None)
+    assert exporter._pool is None
+    assert pool.alive() == 0
+    assert all(not browser.is_connected() for browser in pool.browsers)
+
+    try:
+        exporter.export("<p>closed</p>", "closed.png")
+        assert False, "A closed exporter should raise"
+    except RuntimeError:
+        pass
+    print("PASS: Render pool keeps order, isolates failures and joins on close")
+
+
+def test_reuse_page_keeps_warm_pages():
+    """Test reuse_page swaps documents into one page per browser and scale."""
+    exporter = PNGExporter(reuse_page=True)
+    browser = exporter._browser = _FakeBrowser()
+    assert exporter.export_bytes("<p>1</p>", 400, 300) == b"<p>1</p>@1.0"
+    assert exporter.export_bytes("<p>2</p>", 600, 300) == b"<p>2</p>@1.0"
+    assert len(browser.pages) == 1
+    assert browser.pages[0].viewport_size == {"width": 600, "height": 300}
+
+    exporter.scale = 2
+    assert exporter.export_bytes("<p>3</p>", 400, 300) == b"<p>3</p>@2"
+    assert len(browser.pages) == 2
+
+    # A failed swap closes the page instead of reusing it
+    try:
+        exporter.export_bytes("<p>boom</p>", 400, 300)
+        assert False, "A failed render should raise"
+    except RuntimeError:
+        pass
+    assert browser.pages[1].closed
+    exporter.export_bytes("<p>4</p>", 400, 300)
+    assert len(browser.pages) == 3
+
+    # Closing the exporter forgets its browser's warm pages
+    assert browser in _warm.browsers
+    exporter.__exit__(None, None, None)
+    assert browser not in _warm.browsers
+
+    # Pool workers keep their own warm pages, one per worker browser
+    pool = _FakePool(2)
+    exporter = PNGExporter(workers=2, reuse_page=True)
+    exporter._pool = pool
+    with tempfile.TemporaryDirectory() as tmp:
+        results = exporter.export_batch(
+            [(f"item-{i}", f"<p>{i}</p>") for i in range(10)], tmp, (400, 300)
+        )
+        for i, path in enumerate(results):
+            with open(path, "rb") as f:
+                assert f.read() == f"<p>{i}</p>@1.0".encode()
+    exporter.__exit__(None, None, None)
+    assert all(len(browser.pages) <= 1 for browser in pool.browsers)
+    print("PASS: reuse_page keeps one warm page per browser and scale")
+
+
+def test_async_export_cache_and_batches():
+    """Test AsyncPNGExporter serves cache hits, orders batches and captures failures."""
+    async def scenario(tmp):
+        cache = RenderCache()
+        cache.put(RenderCache.key("<p>cached</p>", 400, 300), b"png-cached")
+        exporter = _async_exporter(cache=cache)
+        browser = exporter._browsers[0]
+
+        # A cache hit never opens a page
+        path = await exporter.export("<p>cached</p>", os.path.join(tmp, "hit.png"), 400, 300)
+        with open(path, "rb") as f:
+            assert f.read() == b"png-cached"
+        assert browser.pages == []
+
+        # Slowest first: gather still returns input order
+        items = [(f"item-{i}", f'<p data-delay="{3 - i}">{i}</p>') for i in range(4)]
+        results = await exporter.export_batch(items, tmp, (400, 300))
+        assert results == [os.path.join(tmp, f"item-{i}.png") for i in range(4)]
+
+        broken = items[:2] + [("broken", "<p>boom</p>")]
+        results = await exporter.export_batch(broken, tmp, (400, 300), return_exceptions=True)
+        assert results[:2] == [os.path.join(tmp, f"item-{i}.png") for i in range(2)]
+        assert isinstance(results[2], RuntimeError)
+        try:
+            await exporter.export_batch(broken, tmp, (400, 300))
+            assert False, "A failed item should raise without return_exceptions"
+        except RuntimeError:
+            pass
+
+        # iter_batch yields in completion order, failures included; without a
+        # cache, so the items above render again instead of hitting it
+        uncached = _async_exporter()
+        seen = [name async for name, _ in uncached.iter_batch(items, tmp, (400, 300))]
+        assert seen == ["item-3", "item-2", "item-1", "item-0"]
+        outcomes = dict([pair async for pair in uncached.iter_batch(broken, tmp, (400, 300))])
+        assert isinstance(outcomes["broken"], RuntimeError)
+        assert outcomes["item-0"] == os.path.join(tmp, "item-0.png")
+
+        # The semaphore bounds the pages open at once
+        bounded = _async_exporter(concurrency=2)
+        await bounded.export_batch(
+            [(f"page-{i}", f'<p data-delay="2">{i}</p>') for i in range(6)], tmp, (400, 300)
+        )
+        assert bounded._browsers[0].peak_pages == 2
+        assert bounded._browsers[0].open_pages == 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(scenario(tmp))
+    print("PASS: AsyncPNGExporter caches, orders and bounds renders")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("OPENFIGMA EXPORT TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        test_cache_key_stable,
+        test_cache_memory_lru,
+        test_cache_disk_tier,
+        test_html_to_png_cache_hit_skips_browser,
+        test_ready_strategies,
+        test_set_content_writes_no_temp_file,
+        test_export_stream_is_lazy,
+        test_export_bytes_without_disk,
+        test_image_formats,
+        test_capture_encodings,
+        test_multi_scale_export,
+        test_multi_size_export,
+        test_atlas_export,
+        test_carousel_export,
+        test_pdf_export,
+        test_render_pool_concurrency,
+        test_reuse_page_keeps_warm_pages,
+        test_async_export_cache_and_batches,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__} - {e}")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test suite for batch HTML generation.
+"""
+
+import sys
+sys.path.insert(0, '..')
+
+from openfigma import GraphicsBuilder, build_many, dark_theme
+
+
+def _configs(count):
+    return [
+        {
+            "theme": {"accent": f"#ab{i:04x}"},
+            "components": [{"type": "badge", "content": {"text": f"job-{i}"}}],
+        }
+        for i in range(count)
+    ]
+
+
+def test_build_many_matches_builder():
+    """Test pooled builds equal sequential builds, in input order."""
+    configs = _configs(50)
+    builder = GraphicsBuilder(dark_theme())
+    expected = [builder.build_from_config(c, (1080, 1080)) for c in configs]
+
+    pooled = build_many(iter(configs), (1080, 1080), workers=2, chunksize=7, theme=dark_theme())
+    assert list(pooled) == expected
+    assert list(build_many(configs, (1080, 1080), workers=1, theme=dark_theme())) == expected
+    print("PASS: build_many preserves order and output")
+
+
+def test_build_many_is_lazy():
+    """Test build_many streams and can be abandoned early."""
+    results = build_many(_configs(1000), workers=2, chunksize=10)
+    assert "job-0" in next(results)
+    results.close()
+
+    for options in ({"chunksize": 0}, {"workers": 0}, {"workers": -1}):
+        try:
+            list(build_many([], **options))
+            assert False, f"{options} should raise"
+        except ValueError:
+            pass
+    print("PASS: build_many streams lazily")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("OPENFIGMA PIPELINE TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        test_build_many_matches_builder,
+        test_build_many_is_lazy,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__} - {e}")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
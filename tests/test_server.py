@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test suite for the render server, with fake browsers behind the pool.
+"""
+
+import sys
+import time
+sys.path.insert(0, '..')
+
+import openfigma.server as server_module
+from openfigma.server import RenderClient, RenderServer, _parse_render_request
+
+from test_export import _FakePool
+
+
+class _BrokenPool(_FakePool):
+    """A render pool whose browsers never launch."""
+
+    def _launch(self, playwright):
+        raise RuntimeError("Executable doesn't exist")
+
+
+def _serve(pool_class, workers=2):
+    """Start a RenderServer on a free port with pool_class as its pool."""
+    original = server_module._RenderPool
+    server_module._RenderPool = pool_class
+    try:
+        return RenderServer(port=0, workers=workers).start()
+    finally:
+        server_module._RenderPool = original
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for the pool"
+        time.sleep(0.01)
+
+
+def test_malformed_config_is_bad_request():
+    """Test config of the wrong shape gets a 400 JSON error, not a dropped connection."""
+    for request in (
+        {"config": {"components": ["badge"]}},
+        {"config": {"components": {"type": "badge"}}},
+        {"config": {"components": [{"type": "badge", "content": "Hi"}]}},
+        {"config": {"theme": ["dark"]}},
+    ):
+        try:
+            _parse_render_request(request)
+            assert False, f"{request} should be rejected"
+        except TypeError:
+            pass
+
+    server = _serve(_FakePool)
+    try:
+        client = RenderClient(port=server.port)
+        for payload in (
+            {"config": {"components": ["badge"]}},
+            {"html": "<p></p>", "width": 1e999},
+        ):
+            status, content_type, body = client._request("POST", "/render", payload)
+            assert status == 400 and content_type == "application/json", (status, body)
+
+        # The server keeps serving after bad requests
+        assert client.render_html("<p>ok</p>", 400, 300) == b"<p>ok</p>@1.0"
+    finally:
+        server.shutdown()
+    print("PASS: Malformed configs get a 400 JSON error")
+
+
+def test_health_reports_failures():
+    """Test health turns degraded on a failed render and error when browsers never launch."""
+    server = _serve(_FakePool)
+    try:
+        client = RenderClient(port=server.port)
+        _wait_for(lambda: server._pool.stats["launches"] == 2)
+        assert client.health()["status"] == "ok"
+
+        try:
+            client.render_html("<p>boom</p>", 400, 300)
+            assert False, "A failed render should raise"
+        except RuntimeError as e:
+            assert "(500)" in str(e)
+        health = client.health()
+        assert health["status"] == "degraded" and health["failed"] == 1
+        assert health["last_error"] == "RuntimeError: render failed"
+
+        client.render_html("<p>ok</p>", 400, 300)
+        assert client.health()["status"] == "ok"
+    finally:
+        server.shutdown()
+
+    server = _serve(_BrokenPool)
+    try:
+        client = RenderClient(port=server.port)
+        try:
+            client.render_html("<p>ok</p>", 400, 300)
+            assert False, "Rendering without a browser should raise"
+        except RuntimeError:
+            pass
+        status, _, _ = client._request("GET", "/health")
+        assert status == 503
+        health = client.health()
+        assert health["status"] == "error" and health["launches"] == 0
+        assert health["launch_failures"] >= 2
+        assert "Executable doesn't exist" in health["last_error"]
+    finally:
+        server.shutdown()
+    print("PASS: Health reports failed launches and renders")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("OPENFIGMA SERVER TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        test_malformed_config_is_bad_request,
+        test_health_reports_failures,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__} - {e}")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
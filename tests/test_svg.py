@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test suite for the browser-free layout engine and SVG backend.
+"""
+
+import sys
+import warnings
+import xml.dom.minidom
+sys.path.insert(0, '..')
+
+from openfigma import SVGBuilder, Theme, dark_theme, linkedin_theme, render_svg
+from openfigma.layout import Gradient, Rect, Text, _paint, layout_config, unsupported_components
+
+
+CONFIG = {
+    "components": [
+        {"type": "badge", "content": {"text": "Case Study", "icon": "case-study"}},
+        {"type": "metric_card", "content": {"value": "10x", "label": "Growth", "change": "+900%"}},
+        {"type": "bar_chart", "content": {"data": [
+            {"label": "Q1", "value": 10}, {"label": "Q2", "value": 100},
+        ]}},
+        {"type": "progress_bar", "content": {"label": "Goal", "value": 72}},
+        {"type": "event_poster", "content": {"align": "center", "lines": [
+            {"number": "40", "text": "founders & <friends>", "size": "96px"},
+        ]}},
+    ]
+}
+
+
+def test_svg_is_standalone_xml():
+    """Test every supported component renders to well-formed SVG."""
+    svg = render_svg(CONFIG, linkedin_theme(), (1080, 1350))
+    document = xml.dom.minidom.parseString(svg)
+    root = document.documentElement
+    assert root.tagName == "svg"
+    assert root.getAttribute("viewBox") == "0 0 1080 1350"
+    assert "founders &amp; &lt;friends&gt;" in svg
+    assert "CASE STUDY" in svg
+    assert "72%" in svg
+    assert "<linearGradient" in svg
+    print("PASS: SVG output is well-formed and standalone")
+
+
+def test_unsupported_components_are_reported():
+    """Test components without an SVG layout are named, never dropped silently."""
+    config = {"components": [
+        {"type": "headline", "content": {"text": "Hi"}},
+        {"type": "badge", "content": {"text": "ok"}},
+        {"type": "headline", "content": {"text": "Again"}},
+        {"type": "quote_card", "content": {}},
+    ]}
+    assert unsupported_components(config) == ["headline", "quote_card"]
+    assert unsupported_components(CONFIG) == []
+
+    try:
+        render_svg(config)
+        assert False, "Unsupported components should raise"
+    except ValueError as e:
+        assert "'headline', 'quote_card'" in str(e)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        svg = SVGBuilder(unsupported="warn").build_from_config(config)
+    assert len(caught) == 1 and "headline" in str(caught[0].message)
+    assert "OK" in svg
+
+    # Lengths the layout cannot resolve raise instead of collapsing to 0
+    for overrides in ({"padding_large": "4rem"}, {"radius_pill": "50%"}, {"gap_large": "calc(1px)"}):
+        try:
+            render_svg({"theme": overrides, "components": CONFIG["components"]})
+            assert False, f"{overrides} should raise"
+        except ValueError as e:
+            assert repr(next(iter(overrides.values()))) in str(e)
+    assert "<svg" in render_svg({"theme": {"padding_large": "64px", "gap_large": 0}, **CONFIG})
+    print("PASS: Unsupported components are reported")
+
+
+def test_layout_follows_canvas_css():
+    """Test the layout mirrors the body's padded, centered flex column."""
+    theme = Theme()
+    layout = layout_config({"components": [
+        {"type": "progress_bar", "content": {"label": "Goal", "value": 50}},
+    ]}, (1000, 600), theme)
+    track, fill = [s for s in layout.shapes if isinstance(s, Rect)]
+    assert track.x == 72 and track.width == 1000 - 2 * 72
+    assert fill.width == track.width / 2
+    # One 108px block centered in the 600px canvas
+    labels = [s for s in layout.shapes if isinstance(s, Text)]
+    assert 246 < labels[0].y < 300
+
+    # A metric card is flex: 1 and fills the free height
+    card = layout_config(
+        {"components": [{"type": "metric_card", "content": {"value": "1"}}]}, (1000, 1000)
+    ).shapes[0]
+    assert card.y == 72 and card.height == 1000 - 2 * 72
+
+    grid = layout_config({"theme": {"grid_enabled": True}, "components": []}, (100, 100))
+    assert grid.shapes[0].style == "lines"
+    print("PASS: Layout follows the canvas CSS")
+
+
+def test_theme_paints():
+    """Test CSS colors and gradients map to paints."""
+    assert _paint("#fff") == "#fff"
+    assert _paint("linear-gradient(135deg, #6366f1, #8b5cf6)") == Gradient(135.0, ("#6366f1", "#8b5cf6"))
+    assert _paint("linear-gradient(to right, rgba(0,0,0,.5) 0%, #fff 100%)") == Gradient(
+        90.0, ("rgba(0,0,0,.5)", "#fff")
+    )
+    svg = render_svg({"components": []}, dark_theme(), (200, 100))
+    assert f'fill="{dark_theme().background}"' in svg
+    print("PASS: Theme colors and gradients map to paints")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("OPENFIGMA SVG TEST SUITE")
+    print("=" * 60)
+
+    tests = [
+        test_svg_is_standalone_xml,
+        test_unsupported_components_are_reported,
+        test_layout_follows_canvas_css,
+        test_theme_paints,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__} - {e}")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)